@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from agentic_alert.pipeline import (  # noqa: E402
+    _alert_fieldnames,
+    compact_partition_statuses,
+)
+from agentic_alert.storage.partitions import PartitionedCsvStore  # noqa: E402
+from agentic_alert.storage.status_journal import read_alerts  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Maintain the date-partitioned alert / candidate archives."
+    )
+    parser.add_argument("command", choices=["import", "compact", "export", "list"])
+    parser.add_argument("--root", type=Path, default=ROOT_DIR / "data/alerts")
+    parser.add_argument(
+        "--csv",
+        type=Path,
+        default=ROOT_DIR / "data/alerts.csv",
+        help="Source for import, destination for export.",
+    )
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=0,
+        help="compact: drop partitions older than this many days (0 keeps all).",
+    )
+    parser.add_argument("--from", dest="start", default=None, help="YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", default=None, help="YYYY-MM-DD")
+    args = parser.parse_args()
+
+    store = PartitionedCsvStore(args.root)
+    if args.command == "import":
+        rows = read_alerts(args.csv)
+        imported = store.import_rows(rows, list(rows[0].keys())) if rows else 0
+        print(f"imported={imported} partitions={len(store.days)} root={args.root}")
+    elif args.command == "compact":
+        folded = compact_partition_statuses(store, args.retention_days)
+        print(f"status_rows_folded={folded} partitions={len(store.days)}")
+    elif args.command == "export":
+        rows = list(store.iter_rows(start=args.start, end=args.end))
+        fieldnames = list(rows[0].keys()) if rows else _alert_fieldnames()
+        args.csv.parent.mkdir(parents=True, exist_ok=True)
+        with args.csv.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"exported={len(rows)} csv={args.csv}")
+    else:
+        for day, rows in store.rows_by_day().items():
+            print(f"{day} rows={rows}")
+        print(f"partitions={len(store.days)} rows={len(store)} today={date.today()}")
+
+
+if __name__ == "__main__":
+    main()
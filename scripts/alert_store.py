@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from agentic_alert.pipeline import _row_dedupe_key  # noqa: E402
+from agentic_alert.storage.sqlite_store import SqliteAlertStore  # noqa: E402
+from agentic_alert.storage.status_journal import (  # noqa: E402
+    compact_status_journal,
+    read_alerts,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Import alerts.csv into the SQLite alert store, export it back, "
+            "or fold the status journal into alerts.csv."
+        )
+    )
+    parser.add_argument("command", choices=["import", "export", "compact-status"])
+    parser.add_argument("--db", type=Path, default=ROOT_DIR / "data/alerts.sqlite")
+    parser.add_argument("--csv", type=Path, default=ROOT_DIR / "data/alerts.csv")
+    args = parser.parse_args()
+
+    if args.command == "compact-status":
+        compacted = compact_status_journal(args.csv)
+        print(f"compacted={compacted} csv={args.csv}")
+        return
+
+    with SqliteAlertStore(args.db) as store:
+        if args.command == "import":
+            imported = store.import_rows(read_alerts(args.csv), _row_dedupe_key)
+            print(f"imported={imported} total={store.count()} db={args.db}")
+        else:
+            written = store.export_csv(args.csv)
+            print(f"exported={written} csv={args.csv}")
+
+
+if __name__ == "__main__":
+    main()
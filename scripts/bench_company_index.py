@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from agentic_alert.matching.companies import CompanyMatcher  # noqa: E402
+from agentic_alert.matching.company_index import load_company_index  # noqa: E402
+from agentic_alert.pipeline import load_companies  # noqa: E402
+
+NAME_WORDS = [
+    "ALPHA", "BETA", "NORD", "SUD", "ITALIA", "GROUP", "HOLDING", "ENERGIA",
+    "FOODS", "TECH", "SISTEMI", "COSTRUZIONI", "LOGISTICA", "TRASPORTI",
+    "INDUSTRIE", "MECCANICA", "FARMA", "TESSILE", "SERVIZI", "IMPIANTI",
+]
+LEGAL_FORMS = ["S.P.A.", "S.R.L.", "SPA", "SRL"]
+
+
+def _write_synthetic_csv(path: Path, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(
+            ["company_id", "name", "revenue_eur", "website_domain", "country",
+             "contact_owner"]
+        )
+        for index in range(rows):
+            words = rng.sample(NAME_WORDS, 3)
+            name = f"{' '.join(words)} {index} {rng.choice(LEGAL_FORMS)}"
+            domain = f"{''.join(words).lower()}{index}.it"
+            writer.writerow(
+                [f"IT{index:011d}", name, rng.randint(1, 10**9), domain, "IT", "N/A"]
+            )
+
+
+def _timed(label: str, func) -> object:
+    start = time.perf_counter()
+    result = func()
+    print(f"{label}: {time.perf_counter() - start:.3f}s")
+    return result
+
+
+def _bench(csv_path: Path, cache_dir: Path, build_matcher: bool) -> None:
+    print(f"dataset={csv_path} build_matcher={build_matcher}")
+    if build_matcher:
+        _timed(
+            "before  read_csv+load_companies+matcher",
+            lambda: CompanyMatcher(load_companies(csv_path)),
+        )
+    else:
+        _timed("before  read_csv+load_companies", lambda: load_companies(csv_path))
+    _timed(
+        "after   cold index build+snapshot",
+        lambda: load_company_index(csv_path, cache_dir, build_matcher=build_matcher),
+    )
+    _timed(
+        "after   warm snapshot load (mmap)",
+        lambda: load_company_index(csv_path, cache_dir, build_matcher=build_matcher),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure companies startup before/after the CompanyIndex cache."
+    )
+    parser.add_argument("--csv", type=Path, default=ROOT_DIR / "data/companies.csv")
+    parser.add_argument(
+        "--synthetic-rows",
+        type=int,
+        default=0,
+        help="Generate a synthetic dataset with this many rows instead of --csv.",
+    )
+    parser.add_argument(
+        "--no-matcher",
+        action="store_true",
+        help="Leave the name automaton out of the snapshot (very large datasets).",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        csv_path = args.csv
+        if args.synthetic_rows > 0:
+            csv_path = tmp_dir / "companies_synthetic.csv"
+            _write_synthetic_csv(csv_path, args.synthetic_rows, args.seed)
+        _bench(csv_path, tmp_dir / "cache", not args.no_matcher)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from agentic_alert.matching.company_index import (  # noqa: E402
+    companies_from_rows,
+    load_companies_csv,
+)
+from agentic_alert.pipeline import (  # noqa: E402
+    _row_dedupe_key,
+    load_existing_alert_keys,
+)
+from agentic_alert.storage.csv_store import read_csv  # noqa: E402
+
+
+def _measure(label: str, func) -> object:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    # Tracing slows allocation-heavy code down, so time and peak are taken
+    # from separate runs.
+    tracemalloc.start()
+    result = func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label}: {elapsed:.3f}s peak={peak / 1_048_576:.1f}MiB")
+    return result
+
+
+def _legacy_alert_keys(path: Path) -> set[str]:
+    keys = {_row_dedupe_key(row) for row in read_csv(path)}
+    keys.discard("")
+    return keys
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Peak memory of read_csv (dict rows) vs the streaming iter_csv."
+    )
+    parser.add_argument(
+        "--companies", type=Path, default=ROOT_DIR / "data/companies.csv"
+    )
+    parser.add_argument("--alerts", type=Path, default=ROOT_DIR / "data/alerts.csv")
+    args = parser.parse_args()
+
+    print(f"companies={args.companies}")
+    before = _measure(
+        "before  read_csv+companies_from_rows",
+        lambda: companies_from_rows(read_csv(args.companies)),
+    )
+    after = _measure(
+        "after   iter_csv+load_companies_csv",
+        lambda: load_companies_csv(args.companies),
+    )
+    assert before == after
+    print(f"alerts={args.alerts}")
+    before = _measure(
+        "before  read_csv alert keys", lambda: _legacy_alert_keys(args.alerts)
+    )
+    after = _measure(
+        "after   iter_csv alert keys", lambda: load_existing_alert_keys(args.alerts)
+    )
+    assert before == after
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, fields, make_dataclass
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from agentic_alert.models.schemas import NewsItem  # noqa: E402
+from agentic_alert.storage.csv_store import write_csv, write_records  # noqa: E402
+
+FIELDNAMES = [field.name for field in fields(NewsItem)]
+# The pre-slots model: a plain @dataclass with a per-instance __dict__.
+LegacyNewsItem = make_dataclass(
+    "LegacyNewsItem",
+    [(field.name, field.type, field) for field in fields(NewsItem)],
+)
+
+
+def _build(cls, count: int) -> list:
+    # Values are produced by string formatting, so without interning every
+    # row holds its own copy of provider_id / source_name, as after a CSV or
+    # feed parse.
+    return [
+        cls(
+            f"a{index}",
+            f"gn_company_{index % 40}",
+            f"GN Company | c{index % 40:03d}",
+            f"Acquisizione numero {index}",
+            f"https://example.com/news/{index}",
+            "2026-02-01T00:00:00+00:00",
+            "",
+        )
+        for index in range(count)
+    ]
+
+
+def _measure_build(label: str, cls, count: int) -> list:
+    start = time.perf_counter()
+    _build(cls, count)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    items = _build(cls, count)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label}: build={elapsed:.2f}s ({count / elapsed / 1000:.0f}k/s) "
+        f"retained={current / 1_048_576:.0f}MiB"
+    )
+    return items
+
+
+def _timed(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{label}: {time.perf_counter() - start:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory/throughput of plain vs slotted, interned NewsItems."
+    )
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"items={args.items}")
+    legacy = _measure_build("before  @dataclass", LegacyNewsItem, args.items)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        start = time.perf_counter()
+        rows = [asdict(item) for item in legacy]
+        del legacy
+        write_csv(out / "legacy.csv", rows, FIELDNAMES)
+        print(f"before  asdict+write_csv: {time.perf_counter() - start:.2f}s")
+        del rows
+        slotted = _measure_build("after   slots+intern", NewsItem, args.items)
+        _timed(
+            "after   write_records",
+            lambda: write_records(out / "fast.csv", slotted, FIELDNAMES),
+        )
+        same = (out / "legacy.csv").read_bytes() == (out / "fast.csv").read_bytes()
+        print(f"identical_csv={same}")
+
+
+if __name__ == "__main__":
+    main()
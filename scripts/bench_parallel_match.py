@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from agentic_alert.matching.companies import article_text  # noqa: E402
+from agentic_alert.matching.company_index import CompanyIndex  # noqa: E402
+from agentic_alert.matching.parallel import ParallelMatcher  # noqa: E402
+from agentic_alert.matching.planner import EvaluationPlanner  # noqa: E402
+from agentic_alert.models.schemas import Company, NewsItem  # noqa: E402
+from agentic_alert.pipeline import load_triggers  # noqa: E402
+from agentic_alert.triggers.matcher import TriggerMatcher  # noqa: E402
+
+NAME_WORDS = [
+    "ALPHA", "BETA", "NORD", "SUD", "ITALIA", "GROUP", "HOLDING", "ENERGIA",
+    "FOODS", "TECH", "SISTEMI", "COSTRUZIONI", "LOGISTICA", "TRASPORTI",
+    "INDUSTRIE", "MECCANICA", "FARMA", "TESSILE", "SERVIZI", "IMPIANTI",
+]
+FILLER = (
+    "il mercato chiude in rialzo dopo la trimestrale mentre gli analisti "
+    "attendono le decisioni della banca centrale sui tassi"
+).split()
+
+
+def _companies(count: int, rng: random.Random) -> list[Company]:
+    companies = []
+    for index in range(count):
+        words = rng.sample(NAME_WORDS, 3)
+        companies.append(
+            Company(
+                company_id=f"IT{index:011d}",
+                name=f"{' '.join(words)} {index} SPA",
+                aliases=[],
+                revenue_eur="",
+                industry_code="",
+                industry_description="",
+                website="",
+                website_domain=f"{''.join(words).lower()}{index}.it",
+                country="IT",
+                contact_owner="",
+                status="active",
+            )
+        )
+    return companies
+
+
+def _items(
+    count: int, companies: list[Company], keywords: list[str], rng: random.Random
+) -> list[NewsItem]:
+    items = []
+    for index in range(count):
+        words = rng.sample(FILLER, 12)
+        if keywords and index % 2 == 0:
+            words.insert(3, rng.choice(keywords))
+        if index % 3 == 0:
+            words.insert(0, rng.choice(companies).name)
+        items.append(
+            NewsItem(
+                article_id=f"a{index}",
+                provider_id="bench",
+                source_name="Bench",
+                title=" ".join(words[:8]),
+                url=f"https://example.com/news/{index}",
+                published_at="2026-02-01T00:00:00+00:00",
+                content_snippet=" ".join(words[8:] * 20),
+            )
+        )
+    return items
+
+
+def _run(
+    workers: int,
+    batch_size: int,
+    index: CompanyIndex,
+    trigger_matcher: TriggerMatcher,
+    items: list[NewsItem],
+) -> tuple[float, list]:
+    company_matcher = index.matcher
+    planner: EvaluationPlanner[NewsItem] = EvaluationPlanner(
+        [
+            (
+                "triggers",
+                lambda item: trigger_matcher.match(article_text(item)).triggers,
+            ),
+            ("companies", company_matcher.match),
+        ]
+    )
+    start = time.perf_counter()
+    with ParallelMatcher(
+        planner,
+        trigger_matcher.triggers,
+        index.companies,
+        workers=workers,
+        batch_size=batch_size,
+    ) as matcher:
+        results = [
+            (tag, stage_results is not None)
+            for _item, tag, stage_results in matcher.evaluate_stream(
+                (item, item.article_id) for item in items
+            )
+        ]
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure matching throughput with MATCH_WORKERS processes."
+    )
+    parser.add_argument("--companies", type=int, default=50_000)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument(
+        "--workers",
+        default="1,2,4,8",
+        help="Comma-separated worker counts to measure.",
+    )
+    parser.add_argument(
+        "--triggers", type=Path, default=ROOT_DIR / "data/triggers.csv"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    index = CompanyIndex.from_companies(_companies(args.companies, rng))
+    triggers = load_triggers(args.triggers)
+    trigger_matcher = TriggerMatcher(triggers)
+    keywords = [keyword for trigger in triggers for keyword in trigger.keywords]
+    items = _items(args.items, index.companies, keywords, rng)
+    print(
+        f"setup: companies={args.companies} items={args.items} "
+        f"triggers={len(triggers)} cpus={os.cpu_count()} "
+        f"{time.perf_counter() - start:.1f}s"
+    )
+
+    baseline = None
+    reference = None
+    for workers in [int(value) for value in args.workers.split(",")]:
+        elapsed, results = _run(
+            workers, args.batch_size, index, trigger_matcher, items
+        )
+        if baseline is None:
+            baseline, reference = elapsed, results
+        print(
+            f"workers={workers}: {elapsed:.2f}s "
+            f"({args.items / elapsed:.0f} items/s) "
+            f"speedup={baseline / elapsed:.2f}x "
+            f"identical={results == reference}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
-from agentic_alert.pipeline import run_daily
+from agentic_alert.pipeline import main as pipeline_main
 
 
 def main() -> None:
-    run_daily()
+    pipeline_main()
 
 
 if __name__ == "__main__":
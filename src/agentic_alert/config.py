@@ -24,6 +24,33 @@ class AppConfig:
     backtest_enabled: bool = False
     backtest_lookback_days: int = 14
     backtest_company_ids: str = ""
+    company_index_cache_enabled: bool = True
+    company_index_cache_dir: Path = Path(".cache/company_index")
+    match_hinted_full_scan: bool = True
+    match_workers: int = 1
+    match_batch_size: int = 200
+    seen_articles_enabled: bool = False
+    seen_articles_path: Path = Path(".cache/seen_articles.json")
+    seen_articles_ttl_days: int = 7
+    near_duplicates_enabled: bool = False
+    near_duplicates_path: Path = Path(".cache/near_duplicates.json")
+    near_duplicates_max_distance: int = 6
+    near_duplicates_ttl_days: int = 3
+    alert_store: str = "csv"
+    alert_store_sqlite_path: Path = Path("data/alerts.sqlite")
+    alert_store_export_csv: bool = True
+    alert_dedupe_index: bool = False
+    alert_dedupe_retention_days: int = 0
+    alert_status_journal: bool = True
+    alert_status_journal_compact_rows: int = 1000
+    alert_partitions_enabled: bool = False
+    alerts_partition_dir: Path = Path("data/alerts")
+    alert_candidates_partition_dir: Path = Path("data/alert_candidates")
+    alert_partitions_dedupe_days: int = 0
+    alert_candidates_all: bool = False
+    stream_queue_size: int = 1000
+    stream_write_batch: int = 500
+    shard: str = ""
 
 
 def _env_path(name: str, default: Path) -> Path:
@@ -101,4 +128,79 @@ def load_config() -> AppConfig:
         backtest_company_ids=_env_str(
             "BACKTEST_COMPANY_IDS", defaults.backtest_company_ids
         ),
+        company_index_cache_enabled=_env_bool(
+            "COMPANY_INDEX_CACHE", defaults.company_index_cache_enabled
+        ),
+        company_index_cache_dir=_env_path(
+            "COMPANY_INDEX_CACHE_DIR", defaults.company_index_cache_dir
+        ),
+        match_hinted_full_scan=_env_bool(
+            "MATCH_HINTED_FULL_SCAN", defaults.match_hinted_full_scan
+        ),
+        match_workers=_env_int("MATCH_WORKERS", defaults.match_workers),
+        match_batch_size=_env_int("MATCH_BATCH_SIZE", defaults.match_batch_size),
+        seen_articles_enabled=_env_bool(
+            "SEEN_ARTICLES", defaults.seen_articles_enabled
+        ),
+        seen_articles_path=_env_path(
+            "SEEN_ARTICLES_PATH", defaults.seen_articles_path
+        ),
+        seen_articles_ttl_days=_env_int(
+            "SEEN_ARTICLES_TTL_DAYS", defaults.seen_articles_ttl_days
+        ),
+        near_duplicates_enabled=_env_bool(
+            "NEAR_DUPLICATES", defaults.near_duplicates_enabled
+        ),
+        near_duplicates_path=_env_path(
+            "NEAR_DUPLICATES_PATH", defaults.near_duplicates_path
+        ),
+        near_duplicates_max_distance=_env_int(
+            "NEAR_DUPLICATES_MAX_DISTANCE", defaults.near_duplicates_max_distance
+        ),
+        near_duplicates_ttl_days=_env_int(
+            "NEAR_DUPLICATES_TTL_DAYS", defaults.near_duplicates_ttl_days
+        ),
+        alert_store=_env_str("ALERT_STORE", defaults.alert_store).strip().lower(),
+        alert_store_sqlite_path=_env_path(
+            "ALERT_STORE_SQLITE_PATH", defaults.alert_store_sqlite_path
+        ),
+        alert_store_export_csv=_env_bool(
+            "ALERT_STORE_EXPORT_CSV", defaults.alert_store_export_csv
+        ),
+        alert_dedupe_index=_env_bool(
+            "ALERT_DEDUPE_INDEX", defaults.alert_dedupe_index
+        ),
+        alert_dedupe_retention_days=_env_int(
+            "ALERT_DEDUPE_RETENTION_DAYS", defaults.alert_dedupe_retention_days
+        ),
+        alert_status_journal=_env_bool(
+            "ALERT_STATUS_JOURNAL", defaults.alert_status_journal
+        ),
+        alert_status_journal_compact_rows=_env_int(
+            "ALERT_STATUS_JOURNAL_COMPACT_ROWS",
+            defaults.alert_status_journal_compact_rows,
+        ),
+        alert_partitions_enabled=_env_bool(
+            "ALERT_PARTITIONS", defaults.alert_partitions_enabled
+        ),
+        alerts_partition_dir=_env_path(
+            "ALERTS_PARTITION_DIR", defaults.alerts_partition_dir
+        ),
+        alert_candidates_partition_dir=_env_path(
+            "ALERT_CANDIDATES_PARTITION_DIR",
+            defaults.alert_candidates_partition_dir,
+        ),
+        alert_partitions_dedupe_days=_env_int(
+            "ALERT_PARTITIONS_DEDUPE_DAYS", defaults.alert_partitions_dedupe_days
+        ),
+        alert_candidates_all=_env_bool(
+            "ALERT_CANDIDATES_ALL", defaults.alert_candidates_all
+        ),
+        stream_queue_size=_env_int(
+            "STREAM_QUEUE_SIZE", defaults.stream_queue_size
+        ),
+        stream_write_batch=_env_int(
+            "STREAM_WRITE_BATCH", defaults.stream_write_batch
+        ),
+        shard=_env_str("PIPELINE_SHARD", defaults.shard),
     )
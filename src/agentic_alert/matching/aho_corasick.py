@@ -0,0 +1,178 @@
+from array import array
+from collections import deque
+from typing import Iterator, Mapping, Sequence
+
+
+class AhoCorasick:
+    """Multi-pattern substring automaton.
+
+    Patterns are added with ``add`` and compiled once with ``build``; every
+    occurrence of every pattern is then found in a single pass over the text,
+    so search cost depends on the text length and not on the pattern count.
+    Matching is exact and case-sensitive: callers normalize both sides.
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._report: list[int] = [0]
+        self._terminal: dict[int, int] = {}
+        self._pattern_ids: dict[str, int] = {}
+        self._patterns: list[str] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def patterns(self) -> list[str]:
+        return self._patterns
+
+    def add(self, pattern: str) -> int:
+        """Register a pattern and return its id (stable for duplicates)."""
+        if not pattern:
+            raise ValueError("Empty patterns are not supported")
+        existing = self._pattern_ids.get(pattern)
+        if existing is not None:
+            return existing
+        if self._built:
+            raise RuntimeError("Cannot add patterns after build()")
+
+        goto = self._goto
+        node = 0
+        for ch in pattern:
+            next_node = goto[node].get(ch)
+            if next_node is None:
+                next_node = len(goto)
+                goto[node][ch] = next_node
+                goto.append({})
+            node = next_node
+
+        pattern_id = len(self._patterns)
+        self._patterns.append(pattern)
+        self._pattern_ids[pattern] = pattern_id
+        self._terminal[node] = pattern_id
+        return pattern_id
+
+    def build(self) -> "AhoCorasick":
+        """Compute failure links; must be called before searching."""
+        goto = self._goto
+        size = len(goto)
+        fail = [0] * size
+        report = [0] * size
+        terminal = self._terminal
+
+        queue: deque[int] = deque()
+        for child in goto[0].values():
+            queue.append(child)
+            report[child] = child if child in terminal else 0
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(ch, 0)
+                report[child] = child if child in terminal else report[fail[child]]
+                queue.append(child)
+
+        self._fail = fail
+        self._report = report
+        self._built = True
+        return self
+
+    def to_arrays(self) -> tuple[dict, dict[str, array]]:
+        """Flat state for snapshots: JSON metadata plus int32 arrays.
+
+        Node ``n``'s edges are ``chars[offsets[n]:offsets[n + 1]]`` leading
+        to the same slice of ``targets``.
+        """
+        if not self._built:
+            self.build()
+        chars: list[str] = []
+        offsets = array("i", [0])
+        targets = array("i")
+        for edges in self._goto:
+            chars.extend(edges)
+            targets.extend(edges.values())
+            offsets.append(len(targets))
+        meta = {"patterns": self._patterns, "chars": "".join(chars)}
+        arrays = {
+            "offsets": offsets,
+            "targets": targets,
+            "fail": array("i", self._fail),
+            "report": array("i", self._report),
+            "terminal_nodes": array("i", self._terminal.keys()),
+            "terminal_ids": array("i", self._terminal.values()),
+        }
+        return meta, arrays
+
+    @classmethod
+    def from_arrays(
+        cls, meta: Mapping, arrays: Mapping[str, Sequence[int]]
+    ) -> "AhoCorasick":
+        """Rebuild a compiled automaton from ``to_arrays`` output."""
+        patterns = list(meta["patterns"])
+        chars = meta["chars"]
+        offsets = list(arrays["offsets"])
+        targets = list(arrays["targets"])
+        fail = list(arrays["fail"])
+        report = list(arrays["report"])
+        terminal_nodes = list(arrays["terminal_nodes"])
+        terminal_ids = list(arrays["terminal_ids"])
+        size = len(offsets) - 1
+        if (
+            size < 1
+            or len(fail) != size
+            or len(report) != size
+            or len(chars) != len(targets)
+            or offsets[-1] != len(targets)
+            or len(terminal_nodes) != len(terminal_ids)
+            or any(
+                max(values, default=0) >= size
+                for values in (targets, fail, report, terminal_nodes)
+            )
+            or max(terminal_ids, default=0) >= len(patterns)
+        ):
+            raise ValueError("Inconsistent automaton arrays")
+        automaton = cls()
+        automaton._goto = [
+            dict(zip(chars[start:end], targets[start:end]))
+            for start, end in zip(offsets, offsets[1:])
+        ]
+        automaton._fail = fail
+        automaton._report = report
+        automaton._terminal = dict(zip(terminal_nodes, terminal_ids))
+        automaton._patterns = patterns
+        automaton._pattern_ids = {
+            pattern: pattern_id for pattern_id, pattern in enumerate(patterns)
+        }
+        automaton._built = True
+        return automaton
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield ``(start, end, pattern_id)`` for every occurrence in text."""
+        if not self._built:
+            self.build()
+        goto = self._goto
+        fail = self._fail
+        report = self._report
+        terminal = self._terminal
+        patterns = self._patterns
+
+        node = 0
+        for index, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = report[node]
+            while hit:
+                pattern_id = terminal[hit]
+                end = index + 1
+                yield end - len(patterns[pattern_id]), end, pattern_id
+                hit = report[fail[hit]]
+
+    def find_ids(self, text: str) -> set[int]:
+        """Return the distinct ids of the patterns occurring in text."""
+        return {pattern_id for _, _, pattern_id in self.iter_matches(text)}
@@ -0,0 +1,224 @@
+from array import array
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+from agentic_alert.matching.aho_corasick import AhoCorasick
+from agentic_alert.matching.domains import (
+    DomainIndex,
+    extract_hosts,
+    normalize_domain,
+    registrable_suffixes,
+)
+from agentic_alert.models.schemas import Company, NewsItem
+
+METHOD_CONFIDENCE = {
+    "domain": 0.95,
+    "alias": 0.85,
+    "name": 0.75,
+}
+_TEXT_METHODS = ("alias", "name")
+
+
+@dataclass
+class CompanyMatch:
+    company: Company
+    match_method: str
+    confidence: float
+
+
+def article_text(news_item: NewsItem) -> str:
+    return f"{news_item.title} {news_item.content_snippet}".strip()
+
+
+def _is_matchable(company: Company) -> bool:
+    return not company.status or company.status.lower() == "active"
+
+
+class CompanyMatcher:
+    """Company name/alias/domain matcher compiled once per run.
+
+    Names and aliases share one automaton scanned over the article text;
+    website domains are looked up by hash from the article URL host and the
+    hostnames found in the snippet, walking parent domains. Results keep one
+    match per company with the highest-confidence method, in the order of
+    the input list.
+
+    Items carrying a ``company_hint`` (fetched by querying one company) can
+    skip the universe scan: only the hinted company is verified. That saving
+    needs ``full_scan=False`` (MATCH_HINTED_FULL_SCAN=false); a full scan
+    already covers the hinted company.
+    """
+
+    def __init__(self, companies: list[Company]) -> None:
+        self._companies = companies
+        self._positions: dict[str, int] = {}
+        self._text_automaton = AhoCorasick()
+        self._text_targets: list[list[tuple[int, str]]] = []
+        self._domain_index = DomainIndex()
+
+        for position, company in enumerate(companies):
+            if not _is_matchable(company):
+                continue
+            self._positions.setdefault(company.company_id, position)
+            if company.website_domain:
+                self._domain_index.add(company.website_domain, position)
+            for alias in company.aliases:
+                self._add_text(alias.lower(), position, "alias")
+            if company.name:
+                self._add_text(company.name.lower(), position, "name")
+
+        self._text_automaton.build()
+
+    @property
+    def companies(self) -> list[Company]:
+        return self._companies
+
+    def to_arrays(self) -> tuple[dict, dict[str, array]]:
+        """Compiled state for the company index snapshot (no pickling)."""
+        automaton_meta, arrays = self._text_automaton.to_arrays()
+        target_offsets = array("i", [0])
+        target_positions = array("i")
+        target_methods = array("i")
+        for targets in self._text_targets:
+            for position, method in targets:
+                target_positions.append(position)
+                target_methods.append(_TEXT_METHODS.index(method))
+            target_offsets.append(len(target_positions))
+        arrays = {f"automaton_{name}": values for name, values in arrays.items()}
+        arrays["target_offsets"] = target_offsets
+        arrays["target_positions"] = target_positions
+        arrays["target_methods"] = target_methods
+        meta = {
+            "automaton": automaton_meta,
+            "domains": self._domain_index.to_dict(),
+        }
+        return meta, arrays
+
+    @classmethod
+    def from_arrays(
+        cls,
+        companies: list[Company],
+        meta: Mapping,
+        arrays: Mapping[str, Sequence[int]],
+    ) -> "CompanyMatcher":
+        """Restore a matcher over ``companies`` from ``to_arrays`` output."""
+        prefix = "automaton_"
+        automaton = AhoCorasick.from_arrays(
+            meta["automaton"],
+            {
+                name[len(prefix) :]: values
+                for name, values in arrays.items()
+                if name.startswith(prefix)
+            },
+        )
+        offsets = list(arrays["target_offsets"])
+        positions = list(arrays["target_positions"])
+        methods = [_TEXT_METHODS[method] for method in arrays["target_methods"]]
+        if (
+            len(offsets) != len(automaton) + 1
+            or offsets[-1] != len(positions)
+            or len(methods) != len(positions)
+            or max(positions, default=0) >= max(len(companies), 1)
+        ):
+            raise ValueError("Inconsistent matcher arrays")
+        domain_index = DomainIndex.from_dict(meta["domains"])
+        if any(
+            position >= len(companies)
+            for values in domain_index.to_dict().values()
+            for position in values
+        ):
+            raise ValueError("Inconsistent matcher domains")
+
+        matcher = cls.__new__(cls)
+        matcher._companies = companies
+        matcher._positions = {}
+        for position, company in enumerate(companies):
+            if _is_matchable(company):
+                matcher._positions.setdefault(company.company_id, position)
+        matcher._text_automaton = automaton
+        matcher._text_targets = [
+            list(zip(positions[start:end], methods[start:end]))
+            for start, end in zip(offsets, offsets[1:])
+        ]
+        matcher._domain_index = domain_index
+        return matcher
+
+    def _add_text(self, pattern: str, position: int, method: str) -> None:
+        if not pattern:
+            return
+        pattern_id = self._text_automaton.add(pattern)
+        if pattern_id == len(self._text_targets):
+            self._text_targets.append([])
+        self._text_targets[pattern_id].append((position, method))
+
+    def match(
+        self,
+        news_item: NewsItem,
+        full_scan: bool = True,
+    ) -> list[CompanyMatch]:
+        """Match news_item against the companies.
+
+        With ``full_scan=False`` a hinted item is only checked against its
+        hinted company; items without a hint are always fully scanned.
+        """
+        if news_item.company_hint and not full_scan:
+            verified = self.verify(news_item, news_item.company_hint)
+            return [verified] if verified else []
+        return self._scan(news_item)
+
+    def verify(self, news_item: NewsItem, company_id: str) -> CompanyMatch | None:
+        """Check a single company with the same rules as the full scan."""
+        position = self._positions.get(company_id)
+        if position is None:
+            return None
+        company = self._companies[position]
+
+        method = ""
+        domain = normalize_domain(company.website_domain)
+        if domain:
+            hosts = extract_hosts(news_item.url, news_item.content_snippet)
+            if any(
+                suffix == domain
+                for host in hosts
+                for suffix in registrable_suffixes(host)
+            ):
+                method = "domain"
+        if not method:
+            text = article_text(news_item).lower()
+            if any(alias.lower() in text for alias in company.aliases if alias):
+                method = "alias"
+            elif company.name and company.name.lower() in text:
+                method = "name"
+        if not method:
+            return None
+        return CompanyMatch(
+            company=company,
+            match_method=method,
+            confidence=METHOD_CONFIDENCE[method],
+        )
+
+    def _scan(self, news_item: NewsItem) -> list[CompanyMatch]:
+        best: dict[int, str] = {}
+
+        hosts = extract_hosts(news_item.url, news_item.content_snippet)
+        for position in self._domain_index.lookup(hosts):
+            best[position] = "domain"
+
+        text = article_text(news_item).lower()
+        for pattern_id in self._text_automaton.find_ids(text):
+            for position, method in self._text_targets[pattern_id]:
+                current = best.get(position)
+                if (
+                    current is None
+                    or METHOD_CONFIDENCE[method] > METHOD_CONFIDENCE[current]
+                ):
+                    best[position] = method
+
+        return [
+            CompanyMatch(
+                company=self._companies[position],
+                match_method=best[position],
+                confidence=METHOD_CONFIDENCE[best[position]],
+            )
+            for position in sorted(best)
+        ]
@@ -0,0 +1,382 @@
+import gc
+import hashlib
+import json
+import mmap
+import os
+import struct
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from agentic_alert.matching.companies import CompanyMatcher
+from agentic_alert.models.schemas import Company
+from agentic_alert.storage.csv_store import iter_csv
+
+COMPANY_INDEX_FORMAT_VERSION = 4
+
+COMPANY_COLUMNS = (
+    "company_id",
+    "name",
+    "aliases",
+    "revenue_eur",
+    "industry_code",
+    "industry_description",
+    "website",
+    "website_domain",
+    "country",
+    "contact_owner",
+    "status",
+)
+
+_MAGIC = b"AACIDX\x00\x00"
+# magic, format version, CSV sha256, length of the JSON metadata block.
+_HEADER = struct.Struct("<8sI32sI")
+
+
+def _split_aliases(aliases_raw: str) -> list[str]:
+    return [alias.strip() for alias in aliases_raw.split(";") if alias.strip()]
+
+
+def _company_from_values(
+    company_id: str, name: str, aliases_raw: str, *rest: str
+) -> Company:
+    return Company(company_id, name, _split_aliases(aliases_raw), *rest)
+
+
+def load_companies_csv(path: Path) -> list[Company]:
+    """Stream ``path`` straight into Company objects (COMPANY_COLUMNS order)."""
+    return list(iter_csv(path, COMPANY_COLUMNS, row_factory=_company_from_values))
+
+
+def companies_from_rows(rows: Iterable[dict[str, str]]) -> list[Company]:
+    companies: list[Company] = []
+    for row in rows:
+        aliases = _split_aliases(row.get("aliases", ""))
+        companies.append(
+            Company(
+                company_id=row.get("company_id", ""),
+                name=row.get("name", ""),
+                aliases=aliases,
+                revenue_eur=row.get("revenue_eur", ""),
+                industry_code=row.get("industry_code", ""),
+                industry_description=row.get("industry_description", ""),
+                website=row.get("website", ""),
+                website_domain=row.get("website_domain", ""),
+                country=row.get("country", ""),
+                contact_owner=row.get("contact_owner", ""),
+                status=row.get("status", ""),
+            )
+        )
+    return companies
+
+
+def parse_revenue_value(value: str) -> float:
+    if not value:
+        return 0.0
+    cleaned = value.replace(",", "").strip()
+    try:
+        return float(cleaned)
+    except ValueError:
+        return 0.0
+
+
+def is_active_company(company: Company) -> bool:
+    status = company.status.strip().lower()
+    if status and status != "active":
+        return False
+    return bool(company.name)
+
+
+def is_bank_company(company: Company) -> bool:
+    value = getattr(company, "is_bank", "")
+    if isinstance(value, bool):
+        return value
+    normalized = str(value).strip().lower()
+    return normalized in {"1", "true", "yes", "y"}
+
+
+def revenue_ranked_positions(companies: list[Company]) -> list[int]:
+    """Positions ordered by revenue (desc), ties broken by company_id."""
+    ordered = sorted(
+        range(len(companies)),
+        key=lambda position: companies[position].company_id or "",
+    )
+    return sorted(
+        ordered,
+        key=lambda position: parse_revenue_value(companies[position].revenue_eur),
+        reverse=True,
+    )
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Building or restoring hundreds of thousands of small containers
+    # triggers repeated full collections that find nothing to free.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@dataclass
+class CompanyIndex:
+    """Pre-normalized, pre-compiled view of the companies dataset."""
+
+    companies: list[Company]
+    active: list[int]
+    gn_candidates: list[int]
+    revenue_rank: list[int]
+    source_hash: str = ""
+    _matcher: CompanyMatcher | None = field(default=None, repr=False)
+    _positions: dict[str, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_companies(
+        cls,
+        companies: list[Company],
+        source_hash: str = "",
+        build_matcher: bool = True,
+    ) -> "CompanyIndex":
+        with _gc_paused():
+            active = [
+                position
+                for position, company in enumerate(companies)
+                if is_active_company(company)
+            ]
+            gn_candidates = [
+                position
+                for position in active
+                if companies[position].country.strip().upper() == "IT"
+                and not is_bank_company(companies[position])
+            ]
+            return cls(
+                companies=companies,
+                active=active,
+                gn_candidates=gn_candidates,
+                revenue_rank=revenue_ranked_positions(companies),
+                source_hash=source_hash,
+                _matcher=CompanyMatcher(companies) if build_matcher else None,
+                _positions={
+                    company.company_id: position
+                    for position, company in enumerate(companies)
+                },
+            )
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    @property
+    def matcher(self) -> CompanyMatcher:
+        if self._matcher is None:
+            with _gc_paused():
+                self._matcher = CompanyMatcher(self.companies)
+        return self._matcher
+
+    def get(self, company_id: str) -> Company | None:
+        position = self._positions.get(company_id)
+        if position is None:
+            return None
+        return self.companies[position]
+
+    def active_companies(self) -> list[Company]:
+        return [self.companies[position] for position in self.active]
+
+    def ranked(self, positions: Iterable[int], limit: int | None = None) -> list[Company]:
+        """Return companies at positions in revenue-rank order."""
+        wanted = set(positions)
+        ranked: list[Company] = []
+        for position in self.revenue_rank:
+            if limit is not None and len(ranked) >= limit:
+                break
+            if position in wanted:
+                ranked.append(self.companies[position])
+        return ranked
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_path(cache_dir: Path, csv_path: Path, source_hash: str) -> Path:
+    name = f"{csv_path.stem}.{source_hash[:16]}.v{COMPANY_INDEX_FORMAT_VERSION}.idx"
+    return cache_dir / name
+
+
+def _read_snapshot(path: Path, source_hash: str) -> CompanyIndex | None:
+    arrays: dict[str, memoryview] = {}
+    try:
+        with path.open("rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            if len(mapped) < _HEADER.size:
+                return None
+            magic, version, digest, meta_size = _HEADER.unpack_from(mapped, 0)
+            if magic != _MAGIC or version != COMPANY_INDEX_FORMAT_VERSION:
+                return None
+            if digest != bytes.fromhex(source_hash):
+                return None
+            with _gc_paused(), memoryview(mapped) as view:
+                try:
+                    meta = json.loads(
+                        bytes(view[_HEADER.size : _HEADER.size + meta_size])
+                    )
+                    base = _aligned(_HEADER.size + meta_size)
+                    # The integer arrays are cast in place over the mapping
+                    # and only copied into lists by the consumers.
+                    for name, (offset, count) in meta["arrays"].items():
+                        start = base + offset
+                        stop = start + count * _ITEM_SIZE
+                        if stop > len(view):
+                            return None
+                        arrays[name] = view[start:stop].cast("i")
+                    return _index_from_snapshot(meta, arrays, source_hash)
+                finally:
+                    for values in arrays.values():
+                        values.release()
+    except (
+        OSError,
+        ValueError,
+        TypeError,
+        KeyError,
+        IndexError,
+        BufferError,
+    ):
+        return None
+
+
+def _index_from_snapshot(
+    meta: dict, arrays: dict[str, memoryview], source_hash: str
+) -> CompanyIndex:
+    companies = [
+        _company_from_values(*values) for values in meta["companies"]
+    ]
+    size = len(companies)
+    active = arrays["active"].tolist()
+    gn_candidates = arrays["gn_candidates"].tolist()
+    revenue_rank = arrays["revenue_rank"].tolist()
+    if any(
+        position < 0 or position >= size
+        for positions in (active, gn_candidates, revenue_rank)
+        for position in positions
+    ):
+        raise ValueError("Company position out of range")
+    matcher = None
+    if meta.get("matcher") is not None:
+        matcher = CompanyMatcher.from_arrays(companies, meta["matcher"], arrays)
+    return CompanyIndex(
+        companies=companies,
+        active=active,
+        gn_candidates=gn_candidates,
+        revenue_rank=revenue_rank,
+        source_hash=source_hash,
+        _matcher=matcher,
+        _positions={
+            company.company_id: position
+            for position, company in enumerate(companies)
+        },
+    )
+
+
+_ITEM_SIZE = array("i").itemsize
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ITEM_SIZE) * _ITEM_SIZE
+
+
+def _write_snapshot(path: Path, index: CompanyIndex) -> None:
+    """JSON metadata followed by raw int32 arrays; nothing is executable.
+
+    The snapshot is a local (or CI-restored) cache in native byte order.
+    """
+    arrays: dict[str, array] = {
+        "active": array("i", index.active),
+        "gn_candidates": array("i", index.gn_candidates),
+        "revenue_rank": array("i", index.revenue_rank),
+    }
+    meta: dict = {
+        "companies": [
+            [
+                company.company_id,
+                company.name,
+                ";".join(company.aliases),
+                *(getattr(company, column) for column in COMPANY_COLUMNS[3:]),
+            ]
+            for company in index.companies
+        ],
+        "matcher": None,
+    }
+    if index._matcher is not None:
+        matcher_meta, matcher_arrays = index._matcher.to_arrays()
+        meta["matcher"] = matcher_meta
+        arrays.update(matcher_arrays)
+    offset = 0
+    layout: dict[str, list[int]] = {}
+    for name, values in arrays.items():
+        layout[name] = [offset, len(values)]
+        offset += len(values) * _ITEM_SIZE
+    meta["arrays"] = layout
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(
+        _MAGIC,
+        COMPANY_INDEX_FORMAT_VERSION,
+        bytes.fromhex(index.source_hash),
+        len(meta_bytes),
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(header)
+        handle.write(meta_bytes)
+        handle.write(b"\x00" * (_aligned(handle.tell()) - handle.tell()))
+        for values in arrays.values():
+            values.tofile(handle)
+    os.replace(tmp_path, path)
+
+
+def load_company_index(
+    csv_path: Path,
+    cache_dir: Path | None = None,
+    build_matcher: bool = True,
+) -> CompanyIndex:
+    """Load the companies CSV as a CompanyIndex, warm-starting from cache.
+
+    Snapshots are keyed by the CSV content hash and the index format
+    version, so an edited dataset or an upgraded index never reuses a stale
+    snapshot. Without ``cache_dir`` the index is always rebuilt. With
+    ``build_matcher=False`` the automaton is compiled on first use and is
+    not part of the snapshot.
+    """
+    if not csv_path.exists():
+        return CompanyIndex.from_companies([])
+
+    source_hash = file_sha256(csv_path)
+    snapshot_path = None
+    if cache_dir is not None:
+        snapshot_path = _cache_path(cache_dir, csv_path, source_hash)
+        cached = _read_snapshot(snapshot_path, source_hash)
+        if cached is not None:
+            print(f"Company index: warm start from {snapshot_path}")
+            return cached
+
+    index = CompanyIndex.from_companies(
+        load_companies_csv(csv_path),
+        source_hash=source_hash,
+        build_matcher=build_matcher,
+    )
+    if snapshot_path is not None:
+        try:
+            _write_snapshot(snapshot_path, index)
+        except OSError as exc:
+            print(f"Company index snapshot write failed: {exc}")
+    return index
@@ -0,0 +1,81 @@
+import re
+import urllib.parse
+from typing import Iterable, Iterator
+
+_HOSTNAME_RE = re.compile(
+    r"(?<![a-z0-9.-])(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}(?![a-z0-9-])"
+)
+
+
+def normalize_domain(value: str) -> str:
+    """Reduce a website/domain value to a bare lowercase host."""
+    cleaned = value.strip().lower()
+    if not cleaned:
+        return ""
+    if "://" in cleaned:
+        cleaned = urllib.parse.urlsplit(cleaned).hostname or ""
+    else:
+        cleaned = cleaned.split("/", 1)[0].split(":", 1)[0]
+    cleaned = cleaned.strip(".")
+    if cleaned.startswith("www."):
+        cleaned = cleaned[4:]
+    return cleaned
+
+
+def url_host(url: str) -> str:
+    try:
+        host = urllib.parse.urlsplit(url.strip()).hostname
+    except ValueError:
+        return ""
+    return (host or "").strip(".").lower()
+
+
+def extract_hosts(url: str, text: str) -> set[str]:
+    """Return the URL host plus every hostname mentioned in text."""
+    hosts = {match.group(0) for match in _HOSTNAME_RE.finditer(text.lower())}
+    host = url_host(url)
+    if host:
+        hosts.add(host)
+    return hosts
+
+
+def registrable_suffixes(host: str) -> Iterator[str]:
+    """Yield host and its parent domains, e.g. news.safilo.com, safilo.com."""
+    labels = host.split(".")
+    for index in range(len(labels) - 1):
+        yield ".".join(labels[index:])
+
+
+class DomainIndex:
+    """Hash index from normalized website domains to arbitrary values."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, domain: str, value: int) -> None:
+        key = normalize_domain(domain)
+        if not key:
+            return
+        self._values.setdefault(key, []).append(value)
+
+    def to_dict(self) -> dict[str, list[int]]:
+        return self._values
+
+    @classmethod
+    def from_dict(cls, values: dict[str, list[int]]) -> "DomainIndex":
+        index = cls()
+        index._values = {str(key): list(value) for key, value in values.items()}
+        return index
+
+    def lookup(self, hosts: Iterable[str]) -> set[int]:
+        found: set[int] = set()
+        values = self._values
+        for host in hosts:
+            for suffix in registrable_suffixes(host):
+                matched = values.get(suffix)
+                if matched:
+                    found.update(matched)
+        return found
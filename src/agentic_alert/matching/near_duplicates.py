@@ -0,0 +1,267 @@
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from agentic_alert.models.schemas import NewsItem
+
+NEAR_DUPLICATES_FORMAT_VERSION = 1
+
+_TOKEN = re.compile(r"\w+")
+_MIN_TITLE_TOKENS = 4
+_MAX_PUBLISHER_WORDS = 6
+_STOPWORDS = frozenset(
+    "a ad al alla alle agli ai con da dal dalla dei del della delle di e ed "
+    "fra gli i il in la le lo nel nella per su sul sulla tra un una uno "
+    "and for of on the to".split()
+)
+# Fingerprint kinds: the title alone (feeds such as Google News carry no
+# snippet) and title + snippet.
+_TITLE = 0
+_FULL = 1
+
+
+def _strip_publisher(title: str) -> str:
+    """Drop the ``" - Publisher"`` suffix Google News appends to titles."""
+    head, sep, tail = title.rpartition(" - ")
+    if sep and head and len(tail.split()) <= _MAX_PUBLISHER_WORDS:
+        return head
+    return title
+
+
+def _tokens(text: str) -> list[str]:
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def _feature_hash(feature: str) -> int:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def simhash(tokens: list[str]) -> int:
+    """64-bit SimHash over word unigrams and bigrams."""
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    weights = [0] * 64
+    for feature in features:
+        value = _feature_hash(feature)
+        for bit in range(64):
+            if value >> bit & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def fingerprints(item: NewsItem) -> list[tuple[int, int]]:
+    """``(kind, simhash)`` pairs for an item; empty when the title is too short."""
+    title_tokens = _tokens(_strip_publisher(item.title))
+    if len(title_tokens) < _MIN_TITLE_TOKENS:
+        return []
+    result = [(_TITLE, simhash(title_tokens))]
+    snippet_tokens = _tokens(item.content_snippet)
+    if snippet_tokens:
+        result.append((_FULL, simhash(title_tokens + snippet_tokens)))
+    return result
+
+
+@dataclass
+class _Cluster:
+    first_seen: float
+    previous_run: bool
+    fingerprints: list[tuple[int, int]]
+    sources: list[str] = field(default_factory=list)
+    scope: str = ""
+
+
+@dataclass
+class NearDuplicateStats:
+    representatives: int = 0
+    duplicates: int = 0
+    skipped_previous: int = 0
+    unfingerprinted: int = 0
+    evicted: int = 0
+
+
+class NearDuplicateIndex:
+    """SimHash clusters of articles, kept within a run and across recent runs.
+
+    Each article gets a title fingerprint and, when it has a snippet, a
+    title + snippet fingerprint. Two articles belong to the same cluster when
+    fingerprints of the same kind differ in at most ``max_distance`` bits.
+    Candidates are found through LSH buckets: the 64 bits are cut into
+    ``max_distance + 1`` bands, so any pair within the distance shares at
+    least one band exactly. The first article of a cluster is its
+    representative; the others only contribute their source name. Clusters
+    created by earlier runs are persisted for ``ttl_days``, and articles that
+    fall into them are skipped. Articles only cluster within the same
+    ``scope`` (the company hint, when hinted items are not fully scanned).
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_distance: int = 6,
+        ttl_days: int = 3,
+        now: float | None = None,
+    ) -> None:
+        self.path = path
+        self.max_distance = max_distance
+        self.ttl_seconds = ttl_days * 86400
+        self.now = time.time() if now is None else now
+        self.stats = NearDuplicateStats()
+        bands = max_distance + 1
+        self._band_bits = 64 // bands
+        self._bands = bands
+        self._clusters: dict[str, _Cluster] = {}
+        self._buckets: dict[tuple[int, int, int], list[str]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        max_distance: int = 6,
+        ttl_days: int = 3,
+        now: float | None = None,
+    ) -> "NearDuplicateIndex":
+        index = cls(path, max_distance, ttl_days, now)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if payload.get("version") != NEAR_DUPLICATES_FORMAT_VERSION:
+            return index
+        cutoff = index.now - index.ttl_seconds
+        for cluster_id, raw in (payload.get("clusters") or {}).items():
+            first_seen = float(raw.get("first_seen") or 0.0)
+            if first_seen < cutoff:
+                index.stats.evicted += 1
+                continue
+            cluster = _Cluster(
+                first_seen=first_seen,
+                previous_run=True,
+                scope=str(raw.get("scope") or ""),
+                fingerprints=[
+                    (int(kind), int(value))
+                    for kind, value in raw.get("fingerprints") or []
+                ],
+            )
+            index._add_cluster(cluster_id, cluster)
+        return index
+
+    def _band_keys(self, kind: int, value: int) -> list[tuple[int, int, int]]:
+        mask = (1 << self._band_bits) - 1
+        return [
+            (kind, band, value >> (band * self._band_bits) & mask)
+            for band in range(self._bands)
+        ]
+
+    def _add_cluster(self, cluster_id: str, cluster: _Cluster) -> None:
+        self._clusters[cluster_id] = cluster
+        for kind, value in cluster.fingerprints:
+            self._index_fingerprint(cluster_id, kind, value)
+
+    def _index_fingerprint(self, cluster_id: str, kind: int, value: int) -> None:
+        for key in self._band_keys(kind, value):
+            bucket = self._buckets.setdefault(key, [])
+            if cluster_id not in bucket:
+                bucket.append(cluster_id)
+
+    def _find(self, prints: list[tuple[int, int]], scope: str) -> str | None:
+        for kind, value in prints:
+            for key in self._band_keys(kind, value):
+                for cluster_id in self._buckets.get(key, ()):
+                    cluster = self._clusters[cluster_id]
+                    if cluster.scope != scope:
+                        continue
+                    for other_kind, other in cluster.fingerprints:
+                        if other_kind == kind and (
+                            bin(value ^ other).count("1") <= self.max_distance
+                        ):
+                            return cluster_id
+        return None
+
+    def assign(self, item: NewsItem, scope: str = "") -> tuple[str, bool]:
+        """Return ``(cluster_id, is_representative)`` for the item.
+
+        ``scope`` keeps company-scoped copies apart: a copy hinted for
+        another company must still reach that company's match.
+        """
+        own_id = f"{item.article_id}|{scope}" if scope else item.article_id
+        prints = fingerprints(item)
+        if not prints:
+            self.stats.unfingerprinted += 1
+            return own_id, True
+        cluster_id = self._find(prints, scope)
+        if cluster_id is None:
+            cluster_id = own_id
+            self._add_cluster(
+                cluster_id,
+                _Cluster(
+                    first_seen=self.now,
+                    previous_run=False,
+                    fingerprints=prints,
+                    sources=[item.source_name],
+                    scope=scope,
+                ),
+            )
+            self.stats.representatives += 1
+            return cluster_id, True
+        cluster = self._clusters[cluster_id]
+        # Keep the new copy's fingerprints too, so a snippet-less copy can
+        # join through the title while later copies match on title + snippet.
+        for kind, value in prints:
+            if (kind, value) not in cluster.fingerprints:
+                cluster.fingerprints.append((kind, value))
+                self._index_fingerprint(cluster_id, kind, value)
+        if cluster.previous_run:
+            self.stats.skipped_previous += 1
+        else:
+            self.stats.duplicates += 1
+            if item.source_name not in cluster.sources:
+                cluster.sources.append(item.source_name)
+        return cluster_id, False
+
+    def sources(self, cluster_id: str) -> list[str]:
+        cluster = self._clusters.get(cluster_id)
+        return list(cluster.sources) if cluster is not None else []
+
+    def __len__(self) -> int:
+        return len(self._clusters)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "version": NEAR_DUPLICATES_FORMAT_VERSION,
+            "clusters": {
+                cluster_id: {
+                    "first_seen": cluster.first_seen,
+                    "fingerprints": cluster.fingerprints,
+                    **({"scope": cluster.scope} if cluster.scope else {}),
+                }
+                for cluster_id, cluster in self._clusters.items()
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def report(self) -> str:
+        return (
+            f"clusters={len(self)} representatives={self.stats.representatives} "
+            f"duplicates={self.stats.duplicates} "
+            f"skipped_previous={self.stats.skipped_previous} "
+            f"unfingerprinted={self.stats.unfingerprinted} "
+            f"evicted={self.stats.evicted}"
+        )
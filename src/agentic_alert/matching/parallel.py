@@ -0,0 +1,207 @@
+import multiprocessing
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.pool import AsyncResult, Pool
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+from agentic_alert.matching.companies import CompanyMatch
+from agentic_alert.matching.planner import EvaluationPlanner
+from agentic_alert.models.schemas import Company, NewsItem, Trigger
+
+TagT = TypeVar("TagT")
+
+# Batches kept in flight per worker: enough to hide the hand-off latency
+# without buffering a large part of the stream in the parent.
+_IN_FLIGHT_PER_WORKER = 2
+
+# (trigger positions, [(company position, match method, confidence)])
+_EncodedResult = tuple[list[int], list[tuple[int, str, float]]]
+_StatsDelta = dict[str, tuple[int, int, float]]
+
+# Set in the parent right before the pool forks, so the workers inherit the
+# compiled matchers (and the company index pages) copy-on-write instead of
+# receiving a pickled copy.
+_worker_planner: EvaluationPlanner[NewsItem] | None = None
+_worker_trigger_positions: dict[int, int] = {}
+_worker_company_positions: dict[int, int] = {}
+
+
+@dataclass
+class ParallelMatchStats:
+    workers: int = 0
+    batches: int = 0
+    items: int = 0
+
+    def report(self) -> str:
+        return f"workers={self.workers} batches={self.batches} items={self.items}"
+
+
+def _encode(results: dict[str, Any]) -> _EncodedResult:
+    return (
+        [_worker_trigger_positions[id(trigger)] for trigger in results["triggers"]],
+        [
+            (
+                _worker_company_positions[id(match.company)],
+                match.match_method,
+                match.confidence,
+            )
+            for match in results["companies"]
+        ],
+    )
+
+
+def _match_batch(
+    items: list[NewsItem],
+) -> tuple[list[_EncodedResult | None], _StatsDelta]:
+    planner = _worker_planner
+    assert planner is not None, "worker forked without a planner"
+    before = planner.stats_snapshot()
+    encoded = []
+    for item in items:
+        results = planner.evaluate(item)
+        encoded.append(None if results is None else _encode(results))
+    after = planner.stats_snapshot()
+    delta = {
+        name: (
+            evaluated - before[name][0],
+            passed - before[name][1],
+            seconds - before[name][2],
+        )
+        for name, (evaluated, passed, seconds) in after.items()
+    }
+    return encoded, delta
+
+
+def fork_available() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+class ParallelMatcher(Generic[TagT]):
+    """Evaluates the trigger/company planner over batches of items in a
+    process pool.
+
+    The pool is forked once, after the matchers are compiled, so every worker
+    shares the read-only company index and automata with the parent through
+    copy-on-write pages. Items travel to the workers in batches of
+    ``batch_size``; results come back as trigger and company positions and
+    are rebuilt against the parent's objects. Batches are consumed in
+    submission order, so the output order (and everything downstream:
+    dedupe claims, alert ids, row order) matches a single-process run.
+
+    With ``workers <= 1``, or where ``fork`` is unavailable, items are
+    evaluated in-process. Create the matcher before starting other threads:
+    forking a multi-threaded process is only safe while they are idle.
+    """
+
+    def __init__(
+        self,
+        planner: EvaluationPlanner[NewsItem],
+        triggers: list[Trigger],
+        companies: list[Company],
+        workers: int = 1,
+        batch_size: int = 200,
+    ) -> None:
+        global _worker_planner, _worker_trigger_positions, _worker_company_positions
+        self.planner = planner
+        self.triggers = triggers
+        self.companies = companies
+        self.batch_size = max(batch_size, 1)
+        self.stats = ParallelMatchStats()
+        self._pool: Pool | None = None
+        if workers <= 1:
+            return
+        if not fork_available():
+            print(
+                f"WARNING: MATCH_WORKERS={workers} needs the fork start method; "
+                "matching in-process."
+            )
+            return
+        _worker_planner = planner
+        _worker_trigger_positions = {
+            id(trigger): position for position, trigger in enumerate(triggers)
+        }
+        _worker_company_positions = {
+            id(company): position for position, company in enumerate(companies)
+        }
+        try:
+            self._pool = multiprocessing.get_context("fork").Pool(workers)
+        finally:
+            _worker_planner = None
+            _worker_trigger_positions = {}
+            _worker_company_positions = {}
+        self.stats.workers = workers
+
+    def evaluate_stream(
+        self, entries: Iterable[tuple[NewsItem, TagT]]
+    ) -> Iterator[tuple[NewsItem, TagT, dict[str, Any] | None]]:
+        """Yield ``(item, tag, stage results or None)`` in input order."""
+        if self._pool is None:
+            for item, tag in entries:
+                self.stats.items += 1
+                yield item, tag, self.planner.evaluate(item)
+            return
+        in_flight: deque[
+            tuple[
+                list[tuple[NewsItem, TagT]],
+                AsyncResult[tuple[list[_EncodedResult | None], _StatsDelta]],
+            ]
+        ] = deque()
+        max_in_flight = self.stats.workers * _IN_FLIGHT_PER_WORKER
+        batch: list[tuple[NewsItem, TagT]] = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) < self.batch_size:
+                continue
+            in_flight.append(self._submit(batch))
+            batch = []
+            if len(in_flight) >= max_in_flight:
+                yield from self._collect(*in_flight.popleft())
+        if batch:
+            in_flight.append(self._submit(batch))
+        while in_flight:
+            yield from self._collect(*in_flight.popleft())
+
+    def _submit(
+        self, batch: list[tuple[NewsItem, TagT]]
+    ) -> tuple[
+        list[tuple[NewsItem, TagT]],
+        AsyncResult[tuple[list[_EncodedResult | None], _StatsDelta]],
+    ]:
+        assert self._pool is not None
+        self.stats.batches += 1
+        self.stats.items += len(batch)
+        return batch, self._pool.apply_async(
+            _match_batch, ([item for item, _ in batch],)
+        )
+
+    def _collect(
+        self,
+        batch: list[tuple[NewsItem, TagT]],
+        pending: AsyncResult[tuple[list[_EncodedResult | None], _StatsDelta]],
+    ) -> Iterator[tuple[NewsItem, TagT, dict[str, Any] | None]]:
+        encoded, delta = pending.get()
+        self.planner.absorb(delta)
+        for (item, tag), result in zip(batch, encoded):
+            yield item, tag, None if result is None else self._decode(result)
+
+    def _decode(self, result: _EncodedResult) -> dict[str, Any]:
+        trigger_positions, company_matches = result
+        return {
+            "triggers": [self.triggers[position] for position in trigger_positions],
+            "companies": [
+                CompanyMatch(self.companies[position], method, confidence)
+                for position, method, confidence in company_matches
+            ],
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelMatcher[TagT]":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,119 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, TypeVar
+
+ItemT = TypeVar("ItemT")
+
+_MIN_REJECT_RATE = 1e-3
+
+
+@dataclass
+class StageStats:
+    name: str
+    evaluated: int = 0
+    passed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def selectivity(self) -> float:
+        """Fraction of evaluated items that passed (lower is more selective)."""
+        if not self.evaluated:
+            return 1.0
+        return self.passed / self.evaluated
+
+    @property
+    def avg_seconds(self) -> float:
+        if not self.evaluated:
+            return 0.0
+        return self.seconds / self.evaluated
+
+    def rank(self) -> float:
+        # Classic predicate ordering: cost per item divided by the fraction
+        # of items the stage rejects; cheap, selective stages go first.
+        reject_rate = max(1.0 - self.selectivity, _MIN_REJECT_RATE)
+        return self.avg_seconds / reject_rate
+
+
+class EvaluationPlanner(Generic[ItemT]):
+    """Runs conjunctive filter stages cheapest-selective first.
+
+    Every stage returns a result for an item; an empty result rejects the
+    item and the remaining stages are skipped. Because an item survives only
+    when every stage passes, the set of surviving items (and their results)
+    does not depend on the order. The order starts as given and is
+    re-planned every ``replan_every`` items from the observed per-stage cost
+    and selectivity.
+    """
+
+    def __init__(
+        self,
+        stages: list[tuple[str, Callable[[ItemT], Any]]],
+        replan_every: int = 64,
+    ) -> None:
+        self._stages = dict(stages)
+        self._order = [name for name, _ in stages]
+        self._stats = {name: StageStats(name) for name, _ in stages}
+        self._replan_every = max(replan_every, 1)
+        self._items_seen = 0
+
+    @property
+    def order(self) -> list[str]:
+        return list(self._order)
+
+    @property
+    def stats(self) -> list[StageStats]:
+        return [self._stats[name] for name in self._order]
+
+    def evaluate(self, item: ItemT) -> dict[str, Any] | None:
+        """Return every stage result for item, or None once a stage rejects."""
+        self._items_seen += 1
+        results: dict[str, Any] = {}
+        for name in self._order:
+            stats = self._stats[name]
+            started = time.perf_counter()
+            result = self._stages[name](item)
+            stats.seconds += time.perf_counter() - started
+            stats.evaluated += 1
+            if not result:
+                self._maybe_replan()
+                return None
+            stats.passed += 1
+            results[name] = result
+        self._maybe_replan()
+        return results
+
+    def stats_snapshot(self) -> dict[str, tuple[int, int, float]]:
+        return {
+            name: (stats.evaluated, stats.passed, stats.seconds)
+            for name, stats in self._stats.items()
+        }
+
+    def absorb(self, deltas: dict[str, tuple[int, int, float]]) -> None:
+        """Add stage counters gathered elsewhere (e.g. in worker processes)."""
+        for name, (evaluated, passed, seconds) in deltas.items():
+            stats = self._stats[name]
+            stats.evaluated += evaluated
+            stats.passed += passed
+            stats.seconds += seconds
+        self._replan()
+
+    def _maybe_replan(self) -> None:
+        if self._items_seen % self._replan_every:
+            return
+        self._replan()
+
+    def _replan(self) -> None:
+        if any(not self._stats[name].evaluated for name in self._order):
+            return
+        self._order.sort(key=lambda name: self._stats[name].rank())
+
+    def report(self) -> str:
+        parts = [f"order={'>'.join(self._order)}"]
+        for stats in self.stats:
+            parts.append(
+                f"{stats.name}: evaluated={stats.evaluated} "
+                f"passed={stats.passed} "
+                f"selectivity={stats.selectivity:.3f} "
+                f"avg_us={stats.avg_seconds * 1_000_000:.1f}"
+            )
+        return " | ".join(parts)
@@ -1,12 +1,29 @@
+import argparse
 import os
 import re
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass, fields
-from datetime import datetime, timezone
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Callable, Container, Iterable, Iterator
 
 from agentic_alert.alerts.dispatcher import dispatch_alerts
 from agentic_alert.config import AppConfig, load_config
+from agentic_alert.matching.companies import (
+    CompanyMatch,
+    CompanyMatcher,
+    article_text,
+)
+from agentic_alert.matching.company_index import (
+    CompanyIndex,
+    load_companies_csv,
+    load_company_index,
+)
+from agentic_alert.matching.near_duplicates import NearDuplicateIndex
+from agentic_alert.matching.parallel import ParallelMatcher
+from agentic_alert.matching.planner import EvaluationPlanner
 from agentic_alert.models.schemas import (
     Alert,
     AlertCandidate,
@@ -15,40 +32,51 @@ from agentic_alert.models.schemas import (
     Provider,
     Trigger,
 )
-from agentic_alert.sources.provider_registry import fetch_news
-from agentic_alert.storage.csv_store import read_csv, write_csv
-from agentic_alert.triggers.matcher import match_triggers
-
-
-@dataclass
-class CompanyMatch:
-    company: Company
-    match_method: str
-    confidence: float
+from agentic_alert.sources.gn_scheduler import (
+    merge_gn_scheduler_states,
+    reset_shared_gn_scheduler,
+    save_gn_scheduler,
+    shared_gn_scheduler,
+)
+from agentic_alert.sources.gn_urls import canonical_url, save_gn_url_cache
+from agentic_alert.sources.http_cache import http_cache_report
+from agentic_alert.sources.http_client import http_pool_report
+from agentic_alert.sources.provider_registry import (
+    fetch_news,
+    merge_gn_rotation_states,
+)
+from agentic_alert.storage.csv_store import (
+    iter_csv,
+    read_csv,
+    record_rows,
+    write_csv,
+    write_records,
+)
+from agentic_alert.storage.dedupe_index import DedupeIndex
+from agentic_alert.storage.partitions import PartitionedCsvStore
+from agentic_alert.storage.seen_articles import SeenArticleStore
+from agentic_alert.storage.sqlite_store import SqliteAlertStore
+from agentic_alert.storage.status_journal import (
+    append_status_changes,
+    compact_status_journal,
+    journal_path,
+    journal_rows,
+    load_status_overrides,
+    read_alerts,
+)
+from agentic_alert.sharding import (
+    Shard,
+    all_shards,
+    read_shard_summary,
+    summary_path,
+    write_shard_summary,
+)
+from agentic_alert.streaming import StageQueue, StageThread
+from agentic_alert.triggers.matcher import TriggerMatcher
 
 
 def load_companies(path: Path) -> list[Company]:
-    rows = read_csv(path)
-    companies: list[Company] = []
-    for row in rows:
-        aliases_raw = row.get("aliases", "")
-        aliases = [alias.strip() for alias in aliases_raw.split(";") if alias.strip()]
-        companies.append(
-            Company(
-                company_id=row.get("company_id", ""),
-                name=row.get("name", ""),
-                aliases=aliases,
-                revenue_eur=row.get("revenue_eur", ""),
-                industry_code=row.get("industry_code", ""),
-                industry_description=row.get("industry_description", ""),
-                website=row.get("website", ""),
-                website_domain=row.get("website_domain", ""),
-                country=row.get("country", ""),
-                contact_owner=row.get("contact_owner", ""),
-                status=row.get("status", ""),
-            )
-        )
-    return companies
+    return load_companies_csv(path)
 
 
 def load_triggers(path: Path) -> list[Trigger]:
@@ -118,47 +146,13 @@ def _filter_companies_by_ids(
     ]
 
 
-def _article_text(news_item: NewsItem) -> str:
-    return f"{news_item.title} {news_item.content_snippet}".strip()
-
-
 def match_companies(news_item: NewsItem, companies: list[Company]) -> list[CompanyMatch]:
-    text = _article_text(news_item).lower()
-    snippet = news_item.content_snippet.lower()
-    url = news_item.url.lower()
-    matches: dict[str, CompanyMatch] = {}
-
-    for company in companies:
-        if company.status and company.status.lower() != "active":
-            continue
-        if company.website_domain:
-            domain = company.website_domain.lower()
-            if domain in url or domain in snippet:
-                _update_match(matches, company, "domain", 0.95)
-        for alias in company.aliases:
-            if alias.lower() in text:
-                _update_match(matches, company, "alias", 0.85)
-        if company.name and company.name.lower() in text:
-            _update_match(matches, company, "name", 0.75)
-
-    return list(matches.values())
-
-
-def _update_match(
-    matches: dict[str, CompanyMatch],
-    company: Company,
-    method: str,
-    confidence: float,
-) -> None:
-    current = matches.get(company.company_id)
-    if current and current.confidence >= confidence:
-        return
+    """Match one article against a company list.
 
-    matches[company.company_id] = CompanyMatch(
-        company=company,
-        match_method=method,
-        confidence=confidence,
-    )
+    Compiles a fresh ``CompanyMatcher``; loops should build the matcher once
+    and call ``CompanyMatcher.match`` directly.
+    """
+    return CompanyMatcher(companies).match(news_item)
 
 
 def _resolve_contact_owner(company: Company) -> str:
@@ -295,33 +289,107 @@ def _print_provenance(
     )
 
 
+DEDUPE_KEY_COLUMNS = (
+    "company_id",
+    "trigger_id",
+    "dedupe_key",
+    "published_at",
+    "title",
+    "article_title",
+)
+
+
+def _dedupe_key_from_values(
+    company_id: str,
+    trigger_id: str,
+    dedupe_key: str,
+    published_at: str,
+    title: str,
+    article_title: str,
+) -> str:
+    if not company_id or not trigger_id:
+        return ""
+    if dedupe_key:
+        return dedupe_key
+    return _build_dedupe_key(
+        company_id, trigger_id, published_at, title or article_title or ""
+    )
+
+
+def _row_dedupe_key(row: dict[str, str]) -> str:
+    return _dedupe_key_from_values(
+        *(row.get(column) or "" for column in DEDUPE_KEY_COLUMNS)
+    )
+
+
 def load_existing_alert_keys(path: Path) -> set[str]:
-    rows = read_csv(path)
+    keys = set(
+        iter_csv(path, DEDUPE_KEY_COLUMNS, row_factory=_dedupe_key_from_values)
+    )
+    keys.discard("")
+    return keys
+
+
+def open_alert_partitions(root: Path, legacy_csv: Path) -> PartitionedCsvStore:
+    """Open the partitioned alert archive, seeding an empty one from alerts.csv."""
+    store = PartitionedCsvStore(root)
+    if not store.days and legacy_csv.exists():
+        imported = store.import_rows(read_alerts(legacy_csv), _alert_fieldnames())
+        print(f"Alert partitions: imported {imported} rows from {legacy_csv}")
+    return store
+
+
+def load_partition_alert_keys(
+    store: PartitionedCsvStore, window_days: int = 0
+) -> set[str]:
+    start = None
+    if window_days > 0:
+        start = (
+            datetime.now(timezone.utc).date() - timedelta(days=window_days)
+        ).isoformat()
     keys: set[str] = set()
-    for row in rows:
-        company_id = row.get("company_id", "")
-        trigger_id = row.get("trigger_id", "")
-        if not company_id or not trigger_id:
-            continue
-
-        dedupe_key = row.get("dedupe_key", "")
-        if not dedupe_key:
-            title = row.get("title") or row.get("article_title") or ""
-            dedupe_key = _build_dedupe_key(
-                company_id,
-                trigger_id,
-                row.get("published_at", ""),
-                title,
-            )
+    for row in store.iter_rows(start=start):
+        dedupe_key = _row_dedupe_key(row)
         if dedupe_key:
             keys.add(dedupe_key)
     return keys
 
 
+def compact_partition_statuses(
+    store: PartitionedCsvStore, retention_days: int = 0
+) -> int:
+    """Fold the status journal into the partitions, then drop the journal."""
+    pending = journal_rows(store.root)
+    stats = store.compact(
+        retention_days=retention_days,
+        status_overrides=load_status_overrides(store.root),
+    )
+    journal_path(store.root).unlink(missing_ok=True)
+    print(
+        "Alert partitions: "
+        f"rewritten={stats['rewritten']} dropped={stats['dropped']} "
+        f"status_updates={stats['status_updates']}"
+    )
+    return pending
+
+
+def open_sqlite_alert_store(db_path: Path, legacy_csv: Path) -> SqliteAlertStore:
+    """Open the SQLite alert store, seeding an empty one from alerts.csv."""
+    store = SqliteAlertStore(db_path)
+    if store.count() == 0 and legacy_csv.exists():
+        imported = store.import_rows(read_alerts(legacy_csv), _row_dedupe_key)
+        print(f"Alert store: imported {imported} rows from {legacy_csv}")
+    return store
+
+
 def _alert_fieldnames() -> list[str]:
     return [field.name for field in fields(Alert)]
 
 
+def _candidate_fieldnames() -> list[str]:
+    return [field.name for field in fields(AlertCandidate)]
+
+
 def _ensure_backtest_header(path: Path) -> None:
     if path.exists():
         return
@@ -349,57 +417,161 @@ def update_alert_statuses(
     write_csv(path, rows, fieldnames, append=False)
 
 
+ALERT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "agentic-alert/alerts")
+
+
+@dataclass
+class AlertBuildStats:
+    pairs: int = 0
+    duplicates: int = 0
+    candidates: int = 0
+    alerts: int = 0
+
+    def report(self, elapsed: float) -> str:
+        return (
+            f"pairs={self.pairs} duplicates_skipped={self.duplicates} "
+            f"objects={self.candidates + self.alerts} "
+            f"(candidates={self.candidates} alerts={self.alerts}) "
+            f"wall_s={elapsed:.2f}"
+        )
+
+
+def alert_key_claimer(
+    existing_keys: Container[str],
+    on_claim: Callable[[str], object] | None = None,
+) -> Callable[[str], bool]:
+    """Return ``claim(key)``: True the first time a key not in history is seen.
+
+    ``on_claim`` is called with every newly claimed key (e.g. to record it in
+    the dedupe index).
+    """
+    run_keys: set[str] = set()
+
+    def claim(key: str) -> bool:
+        if key in run_keys or key in existing_keys:
+            return False
+        run_keys.add(key)
+        if on_claim is not None:
+            on_claim(key)
+        return True
+
+    return claim
+
+
 def build_alerts_for_article(
     news_item: NewsItem,
     company_matches: list[CompanyMatch],
     triggers: list[Trigger],
     created_at: str,
+    claim_key: Callable[[str], bool] | None = None,
+    all_candidates: bool = True,
+    stats: AlertBuildStats | None = None,
 ) -> tuple[list[AlertCandidate], list[Alert]]:
+    """Build candidates and alerts for each company x trigger pair.
+
+    With ``claim_key`` the dedupe key is checked before anything is built:
+    pairs whose key was already claimed produce no Alert, and no candidate
+    either unless ``all_candidates``. IDs are UUIDv5 of the dedupe key, so a
+    rerun yields the same ids.
+    """
     candidates: list[AlertCandidate] = []
     alerts: list[Alert] = []
     normalized_title = _normalize_title(news_item.title)
     published_date = _published_date(news_item.published_at)
+    stats = stats if stats is not None else AlertBuildStats()
 
     for company_match in company_matches:
+        company = company_match.company
+        contact_owner = None
         for trigger in triggers:
-            candidate_id = str(uuid.uuid4())
-            candidates.append(
-                AlertCandidate(
-                    candidate_id=candidate_id,
-                    article_id=news_item.article_id,
-                    company_id=company_match.company.company_id,
-                    trigger_id=trigger.trigger_id,
-                    match_method=company_match.match_method,
-                    confidence=company_match.confidence,
-                )
+            stats.pairs += 1
+            dedupe_key = (
+                f"{company.company_id}|{trigger.trigger_id}|"
+                f"{published_date}|{normalized_title}"
             )
+            is_new = claim_key is None or claim_key(dedupe_key)
+            if not is_new:
+                stats.duplicates += 1
+            if is_new or all_candidates:
+                candidates.append(
+                    AlertCandidate(
+                        candidate_id=str(
+                            uuid.uuid5(
+                                ALERT_ID_NAMESPACE,
+                                f"{news_item.article_id}|{dedupe_key}",
+                            )
+                        ),
+                        article_id=news_item.article_id,
+                        company_id=company.company_id,
+                        trigger_id=trigger.trigger_id,
+                        match_method=company_match.match_method,
+                        confidence=company_match.confidence,
+                    )
+                )
+            if not is_new:
+                continue
 
-            contact_owner = _resolve_contact_owner(company_match.company)
+            if contact_owner is None:
+                contact_owner = _resolve_contact_owner(company)
             alerts.append(
                 Alert(
-                    alert_id=str(uuid.uuid4()),
-                    company_id=company_match.company.company_id,
-                    company_name=company_match.company.name,
+                    alert_id=str(uuid.uuid5(ALERT_ID_NAMESPACE, dedupe_key)),
+                    company_id=company.company_id,
+                    company_name=company.name,
                     trigger_id=trigger.trigger_id,
                     trigger_name=trigger.name,
                     contact_owner=contact_owner,
                     source=news_item.source_name,
                     article_url=news_item.url,
                     published_at=news_item.published_at,
-                    dedupe_key=(
-                        f"{company_match.company.company_id}|"
-                        f"{trigger.trigger_id}|"
-                        f"{published_date}|"
-                        f"{normalized_title}"
-                    ),
+                    dedupe_key=dedupe_key,
                     created_at=created_at,
                     status="new",
                 )
             )
 
+    stats.candidates += len(candidates)
+    stats.alerts += len(alerts)
     return candidates, alerts
 
 
+def _url_dedupe_key(news_item: NewsItem, hinted_full_scan: bool) -> str:
+    """Canonical article URL used to drop exact cross-provider copies.
+
+    Without the hinted full scan a company-scoped copy only matches its
+    hinted company, so the hint becomes part of the key.
+    """
+    if not news_item.url.startswith(("http://", "https://")):
+        return ""
+    key = canonical_url(news_item.url)
+    if not hinted_full_scan and news_item.company_hint:
+        key = f"{key}|{news_item.company_hint}"
+    return key
+
+
+def _near_duplicate_scope(news_item: NewsItem, config: AppConfig) -> str:
+    """Like ``_url_dedupe_key``: hinted copies only cluster per company
+    unless hinted items are matched against every company."""
+    if config.match_hinted_full_scan:
+        return ""
+    return news_item.company_hint
+
+
+def attach_cluster_sources(
+    alerts: list[Alert],
+    alert_clusters: dict[str, str],
+    near_duplicates: NearDuplicateIndex,
+) -> list[Alert]:
+    """Join the sources of every copy in an alert's cluster into ``source``."""
+    attached: list[Alert] = []
+    for alert in alerts:
+        sources = near_duplicates.sources(alert_clusters.get(alert.alert_id, ""))
+        if len(sources) > 1:
+            alert = replace(alert, source="; ".join(sources))
+        attached.append(alert)
+    return attached
+
+
 def _select_providers(
     providers: list[Provider],
     backtest_enabled: bool,
@@ -418,8 +590,439 @@ def run_daily() -> None:
     _run_pipeline(config)
 
 
-def _run_pipeline(config: AppConfig) -> None:
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the daily pipeline, one shard of it, or merge shards."
+    )
+    parser.add_argument("command", nargs="?", choices=["run", "merge"], default="run")
+    parser.add_argument(
+        "--shard",
+        help="run: process only shard i/N of the companies (0 <= i < N).",
+    )
+    parser.add_argument(
+        "--shards", type=int, help="merge: number of shards N to combine."
+    )
+    args = parser.parse_args(argv)
+    config = load_config()
+    shard_value = args.shard or config.shard
+    try:
+        shard = Shard.parse(shard_value) if shard_value else None
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.command == "merge":
+        count = args.shards or (shard.count if shard is not None else 0)
+        if count < 1:
+            parser.error("merge needs --shards N")
+        merge_shards(config, count)
+        return
+    _run_pipeline(replace(config, shard=shard_value or ""))
+
+
+@dataclass
+class _AlertOutputs:
+    output_alerts_path: Path
+    alert_store: SqliteAlertStore | None
+    alert_partitions: PartitionedCsvStore | None
+    dedupe_index: DedupeIndex | None
+    existing_alert_keys: Container[str]
+    status_path: Path
+
+
+def _open_alert_outputs(config: AppConfig) -> _AlertOutputs:
+    """Open the configured alert store and the keys it already holds."""
     is_backtest = config.backtest_enabled
+    partitioned = config.alert_partitions_enabled and not is_backtest
+    output_alerts_path = (
+        config.backtest_output_csv if is_backtest else config.alerts_csv
+    )
+    alert_store = (
+        open_sqlite_alert_store(config.alert_store_sqlite_path, config.alerts_csv)
+        if config.alert_store == "sqlite" and not is_backtest
+        else None
+    )
+    alert_partitions = (
+        open_alert_partitions(config.alerts_partition_dir, config.alerts_csv)
+        if partitioned and alert_store is None
+        else None
+    )
+    status_path = (
+        config.alerts_partition_dir
+        if alert_partitions is not None
+        else output_alerts_path
+    )
+    dedupe_index = (
+        DedupeIndex.open(
+            output_alerts_path,
+            _row_dedupe_key,
+            config.alert_dedupe_retention_days,
+        )
+        if config.alert_dedupe_index
+        and alert_store is None
+        and alert_partitions is None
+        else None
+    )
+    existing_alert_keys: Container[str]
+    if alert_store is not None:
+        existing_alert_keys = alert_store
+    elif dedupe_index is not None:
+        existing_alert_keys = dedupe_index
+    elif alert_partitions is not None:
+        existing_alert_keys = load_partition_alert_keys(
+            alert_partitions, config.alert_partitions_dedupe_days
+        )
+    else:
+        existing_alert_keys = load_existing_alert_keys(output_alerts_path)
+    return _AlertOutputs(
+        output_alerts_path,
+        alert_store,
+        alert_partitions,
+        dedupe_index,
+        existing_alert_keys,
+        status_path,
+    )
+
+
+def _close_alert_outputs(
+    config: AppConfig, outputs: _AlertOutputs, sent_ids: set[str]
+) -> None:
+    """Record dispatched alerts as sent, then persist and close the store."""
+    alert_store = outputs.alert_store
+    alert_partitions = outputs.alert_partitions
+    dedupe_index = outputs.dedupe_index
+    if alert_store is not None:
+        if sent_ids:
+            alert_store.update_statuses(sent_ids, "sent")
+        if config.alert_store_export_csv:
+            alert_store.export_csv(config.alerts_csv)
+        alert_store.close()
+    elif config.alert_status_journal or alert_partitions is not None:
+        append_status_changes(
+            outputs.status_path,
+            sent_ids,
+            "sent",
+            datetime.now(timezone.utc).isoformat(),
+        )
+        if (
+            journal_rows(outputs.status_path)
+            >= config.alert_status_journal_compact_rows
+        ):
+            if alert_partitions is not None:
+                compacted = compact_partition_statuses(alert_partitions)
+            else:
+                compacted = compact_status_journal(outputs.output_alerts_path)
+            print(f"Status journal: compacted {compacted} rows")
+    elif sent_ids:
+        update_alert_statuses(outputs.output_alerts_path, sent_ids, "sent")
+    if dedupe_index is not None:
+        dedupe_index.save()
+        print(f"Dedupe index: {dedupe_index.report()}")
+        dedupe_index.close()
+
+
+class _ChainedKeys:
+    """Membership over several key containers, e.g. canonical + shard-local."""
+
+    def __init__(self, *containers: Container[str]) -> None:
+        self._containers = containers
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in container for container in self._containers)
+
+
+def _canonical_alert_keys(config: AppConfig) -> set[str]:
+    """Dedupe keys of the canonical alert store, read without modifying it."""
+    if config.alert_store == "sqlite" and config.alert_store_sqlite_path.exists():
+        with SqliteAlertStore(config.alert_store_sqlite_path) as store:
+            return {
+                key for row in store.iter_rows() if (key := _row_dedupe_key(row))
+            }
+    if config.alert_partitions_enabled and config.alerts_partition_dir.exists():
+        return load_partition_alert_keys(
+            PartitionedCsvStore(config.alerts_partition_dir),
+            config.alert_partitions_dedupe_days,
+        )
+    return load_existing_alert_keys(config.alerts_csv)
+
+
+def _shard_config(config: AppConfig, shard: Shard) -> AppConfig:
+    """Config of a shard run: plain shard-local CSVs and state, no dispatch.
+
+    Storing into the canonical outputs and sending alerts is left to
+    ``merge_shards``, so concurrent shards never write the same file.
+    """
+    return replace(
+        config,
+        alerts_csv=shard.path(config.alerts_csv),
+        alert_candidates_csv=shard.path(config.alert_candidates_csv),
+        seen_articles_path=shard.path(config.seen_articles_path),
+        near_duplicates_path=shard.path(config.near_duplicates_path),
+        alerts_enabled=False,
+        alert_store="csv",
+        alert_dedupe_index=False,
+        alert_status_journal=False,
+        alert_partitions_enabled=False,
+        shard="",
+    )
+
+
+def _candidate_from_values(*values: str) -> AlertCandidate:
+    *head, confidence = values
+    return AlertCandidate(*head, float(confidence or 0.0))
+
+
+def merge_shards(config: AppConfig, count: int) -> None:
+    """Combine the outputs of ``--shard i/N`` runs into the canonical outputs.
+
+    Alerts are deduped against the canonical store (and across shards), in a
+    fixed order that does not depend on which shard finished first, then
+    written and dispatched exactly as a single run would. Shard-local
+    alert/candidate files are removed once merged, and the GN rotation
+    pointer advances once.
+    """
+    shards = all_shards(count)
+    missing = [
+        str(shard)
+        for shard in shards
+        if read_shard_summary(config.alerts_csv, shard) is None
+    ]
+    if missing:
+        print(f"ERROR: shard runs missing or incomplete: {', '.join(missing)}")
+        raise SystemExit(1)
+    if (
+        config.alerts_enabled
+        and config.alert_channel == "slack"
+        and not config.slack_webhook_url
+    ):
+        print(
+            "ERROR: ALERTS_ENABLED=true and ALERT_CHANNEL=slack, but "
+            "SLACK_WEBHOOK_URL is empty."
+        )
+        raise SystemExit(1)
+
+    candidate_columns = _candidate_fieldnames()
+    alert_columns = _alert_fieldnames()
+    candidates: dict[str, AlertCandidate] = {}
+    shard_alerts: list[Alert] = []
+    for shard in shards:
+        for candidate in iter_csv(
+            shard.path(config.alert_candidates_csv),
+            columns=candidate_columns,
+            row_factory=_candidate_from_values,
+        ):
+            candidates.setdefault(candidate.candidate_id, candidate)
+        shard_alerts.extend(
+            iter_csv(
+                shard.path(config.alerts_csv),
+                columns=alert_columns,
+                row_factory=Alert,
+            )
+        )
+    shard_alerts.sort(key=lambda alert: (alert.published_at, alert.alert_id))
+
+    outputs = _open_alert_outputs(config)
+    claim_alert_key = alert_key_claimer(
+        outputs.existing_alert_keys,
+        on_claim=(
+            outputs.dedupe_index.add if outputs.dedupe_index is not None else None
+        ),
+    )
+    alerts = [alert for alert in shard_alerts if claim_alert_key(alert.dedupe_key)]
+    writer = _AlertWriter(
+        config,
+        outputs.output_alerts_path,
+        outputs.alert_store,
+        outputs.alert_partitions,
+        None,
+    )
+    ordered_candidates = sorted(
+        candidates.values(),
+        key=lambda candidate: (candidate.article_id, candidate.candidate_id),
+    )
+    writer.consume([(ordered_candidates, alerts, None)])
+    writer.finish()
+    _close_alert_outputs(config, outputs, writer.sent_ids)
+
+    rotation_report = merge_gn_rotation_states(shards)
+    if rotation_report:
+        print(f"GN rotation: {rotation_report}")
+    scheduler_report = merge_gn_scheduler_states(shards)
+    if scheduler_report:
+        print(f"GN scheduler: {scheduler_report}")
+    for shard in shards:
+        shard.path(config.alerts_csv).unlink(missing_ok=True)
+        shard.path(config.alert_candidates_csv).unlink(missing_ok=True)
+        summary_path(config.alerts_csv, shard).unlink(missing_ok=True)
+    print(
+        f"Shard merge: shards={count} candidates={len(candidates)} "
+        f"alerts={len(shard_alerts)} written={writer.alerts_written} "
+        f"duplicates={len(shard_alerts) - len(alerts)}"
+    )
+
+
+class _AlertWriter:
+    """Write stage of the streaming pipeline.
+
+    Receives ``(candidates, alerts, cluster_id)`` batches from the build
+    stage and flushes them every ``batch_size`` records: candidates to CSV or
+    partitions, alerts to the configured store, then dispatch. Alerts are
+    held back until the end when near-duplicate clustering is on, because
+    later copies can still add their source to an alert.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        output_alerts_path: Path,
+        alert_store: SqliteAlertStore | None,
+        alert_partitions: PartitionedCsvStore | None,
+        near_duplicates: NearDuplicateIndex | None,
+    ) -> None:
+        self.config = config
+        self.is_backtest = config.backtest_enabled
+        self.output_alerts_path = output_alerts_path
+        self.alert_store = alert_store
+        self.alert_partitions = alert_partitions
+        self.near_duplicates = near_duplicates
+        self.batch_size = max(1, config.stream_write_batch)
+        self.candidate_partitions = (
+            PartitionedCsvStore(config.alert_candidates_partition_dir)
+            if config.alert_partitions_enabled and not self.is_backtest
+            else None
+        )
+        self.pending_candidates: list[AlertCandidate] = []
+        self.pending_alerts: list[Alert] = []
+        self.alert_clusters: dict[str, str] = {}
+        self.alerts_built = 0
+        self.alerts_written = 0
+        self.batches = 0
+        self.sent_ids: set[str] = set()
+
+    def consume(
+        self, batches: Iterable[tuple[list[AlertCandidate], list[Alert], str | None]]
+    ) -> None:
+        for candidates, alerts, cluster_id in batches:
+            self.pending_candidates.extend(candidates)
+            self.pending_alerts.extend(alerts)
+            self.alerts_built += len(alerts)
+            if cluster_id is not None:
+                for alert in alerts:
+                    self.alert_clusters[alert.alert_id] = cluster_id
+            if len(self.pending_candidates) >= self.batch_size:
+                self._flush_candidates()
+            if (
+                self.near_duplicates is None
+                and len(self.pending_alerts) >= self.batch_size
+            ):
+                self._flush_alerts()
+
+    def finish(self) -> None:
+        self._flush_candidates()
+        if self.near_duplicates is not None:
+            self.pending_alerts = attach_cluster_sources(
+                self.pending_alerts, self.alert_clusters, self.near_duplicates
+            )
+        self._flush_alerts()
+        if self.alerts_written == 0:
+            if self.is_backtest and self.alert_store is None:
+                _ensure_backtest_header(self.output_alerts_path)
+            dispatch_alerts(
+                [],
+                self.config.alert_channel,
+                self.config.alerts_enabled,
+                self.config.slack_webhook_url,
+            )
+
+    def _flush_candidates(self) -> None:
+        if not self.pending_candidates:
+            return
+        fieldnames = _candidate_fieldnames()
+        if self.candidate_partitions is not None:
+            self.candidate_partitions.append(
+                record_rows(self.pending_candidates, fieldnames),
+                fieldnames,
+                day=datetime.now(timezone.utc).date().isoformat(),
+            )
+        else:
+            write_records(
+                self.config.alert_candidates_csv,
+                self.pending_candidates,
+                fieldnames,
+                append=True,
+            )
+        self.pending_candidates = []
+
+    def _flush_alerts(self) -> None:
+        if not self.pending_alerts:
+            return
+        new_alerts = self.pending_alerts
+        self.pending_alerts = []
+        fieldnames = _alert_fieldnames()
+        if self.alert_store is not None:
+            new_alerts = self.alert_store.insert_alerts(new_alerts)
+        elif self.alert_partitions is not None:
+            self.alert_partitions.append(
+                record_rows(new_alerts, fieldnames), fieldnames
+            )
+        elif self.is_backtest:
+            rows = record_rows(new_alerts, fieldnames)
+            for row in rows:
+                row["run_type"] = "backtest"
+            write_csv(
+                self.output_alerts_path,
+                rows,
+                fieldnames + ["run_type"],
+                append=True,
+            )
+        else:
+            write_records(
+                self.output_alerts_path, new_alerts, fieldnames, append=True
+            )
+        if not new_alerts:
+            return
+        self.batches += 1
+        self.alerts_written += len(new_alerts)
+        self.sent_ids |= dispatch_alerts(
+            new_alerts,
+            self.config.alert_channel,
+            self.config.alerts_enabled,
+            self.config.slack_webhook_url,
+        )
+
+
+def _fetch_stage(
+    providers: list[Provider],
+    fetch_kwargs: dict,
+    articles_csv: Path,
+    output: StageQueue[NewsItem],
+) -> None:
+    try:
+        for provider in providers:
+            for news_item in fetch_news(provider, articles_csv, **fetch_kwargs):
+                output.put(news_item)
+    finally:
+        output.close()
+
+
+def run_streaming_pipeline(config: AppConfig) -> None:
+    """Run fetch -> normalize/match/build/dedupe -> write as concurrent stages.
+
+    A fetch thread walks the providers and feeds items into a bounded queue
+    while this thread normalizes them (URL dedupe, near-duplicate
+    clustering), matches, builds and dedupes alerts; a writer thread flushes
+    candidates and alerts in batches and dispatches them. Queues are bounded
+    by ``STREAM_QUEUE_SIZE``, so memory does not grow with the day's volume.
+    """
+    run_started = time.perf_counter()
+    is_backtest = config.backtest_enabled
+    shard = Shard.parse(config.shard) if config.shard else None
+    if shard is not None:
+        if is_backtest:
+            print("ERROR: --shard cannot be combined with BACKTEST=true.")
+            raise SystemExit(1)
+        canonical_alerts_csv = config.alerts_csv
+        canonical_keys = _canonical_alert_keys(config)
+        config = _shard_config(config, shard)
+        print(f"Shard: {shard} outputs={config.alerts_csv}")
     if (
         config.alerts_enabled
         and config.alert_channel == "slack"
@@ -430,11 +1033,19 @@ def _run_pipeline(config: AppConfig) -> None:
             "SLACK_WEBHOOK_URL is empty."
         )
         raise SystemExit(1)
-    companies = load_companies(config.companies_csv)
+    company_index = load_company_index(
+        config.companies_csv,
+        config.company_index_cache_dir
+        if config.company_index_cache_enabled
+        else None,
+    )
+    companies = company_index.companies
     if is_backtest:
         companies = _filter_companies_by_ids(
             companies, config.backtest_company_ids
         )
+        if companies is not company_index.companies:
+            company_index = CompanyIndex.from_companies(companies)
     triggers = load_triggers(config.triggers_csv)
     all_providers = load_providers(config.providers_csv)
     _print_provenance(
@@ -446,82 +1057,236 @@ def _run_pipeline(config: AppConfig) -> None:
     )
     providers = _select_providers(all_providers, is_backtest)
     print(f"Providers processed: {len(providers)}")
+    # Reloaded every run: the scheduler's notion of "today" is fixed at load.
+    reset_shared_gn_scheduler()
+    gn_company_providers = {
+        provider.provider_id
+        for provider in providers
+        if provider.type == "gn_company"
+    }
+    gn_scheduler = shared_gn_scheduler() if gn_company_providers else None
+    seen_store = (
+        SeenArticleStore.load(
+            config.seen_articles_path, config.seen_articles_ttl_days
+        )
+        if config.seen_articles_enabled and not is_backtest
+        else None
+    )
 
-    all_candidates: list[AlertCandidate] = []
-    all_alerts: list[Alert] = []
-    created_at = datetime.now(timezone.utc).isoformat()
-    total_news_items = 0
-
-    for provider in providers:
-        news_items = fetch_news(
-            provider,
-            config.articles_csv,
-            companies=companies,
-            triggers=triggers,
-            lookback_days=config.backtest_lookback_days if is_backtest else None,
-            backtest_mode=is_backtest,
+    near_duplicates = None
+    if config.near_duplicates_enabled:
+        near_duplicates = (
+            NearDuplicateIndex(
+                max_distance=config.near_duplicates_max_distance
+            )
+            if is_backtest
+            else NearDuplicateIndex.load(
+                config.near_duplicates_path,
+                config.near_duplicates_max_distance,
+                config.near_duplicates_ttl_days,
+            )
         )
-        total_news_items += len(news_items)
-        for news_item in news_items:
-            company_matches = match_companies(news_item, companies)
-            if not company_matches:
-                continue
-            matched_triggers = match_triggers(_article_text(news_item), triggers)
-            if not matched_triggers:
+    seen_urls: set[str] = set()
+    url_duplicates = 0
+
+    outputs = _open_alert_outputs(config)
+    if shard is not None:
+        outputs.existing_alert_keys = _ChainedKeys(
+            canonical_keys, outputs.existing_alert_keys
+        )
+    claim_alert_key = alert_key_claimer(
+        outputs.existing_alert_keys,
+        on_claim=(
+            outputs.dedupe_index.add if outputs.dedupe_index is not None else None
+        ),
+    )
+    build_stats = AlertBuildStats()
+
+    created_at = datetime.now(timezone.utc).isoformat()
+    company_matcher = company_index.matcher
+    trigger_matcher = TriggerMatcher(triggers)
+    planner: EvaluationPlanner[NewsItem] = EvaluationPlanner(
+        [
+            (
+                "triggers",
+                lambda item: trigger_matcher.match(article_text(item)).triggers,
+            ),
+            (
+                "companies",
+                lambda item: company_matcher.match(
+                    item, full_scan=config.match_hinted_full_scan
+                ),
+            )
+            if shard is None
+            else (
+                "companies",
+                lambda item: [
+                    match
+                    for match in company_matcher.match(
+                        item, full_scan=config.match_hinted_full_scan
+                    )
+                    if shard.owns(match.company.company_id)
+                ],
+            ),
+        ]
+    )
+
+    # Forked before the stage threads start (see ParallelMatcher).
+    parallel_matcher: ParallelMatcher[str | None] = ParallelMatcher(
+        planner,
+        triggers,
+        company_index.companies,
+        workers=config.match_workers,
+        batch_size=config.match_batch_size,
+    )
+
+    cancel = threading.Event()
+    items_queue: StageQueue[NewsItem] = StageQueue(
+        "fetch", config.stream_queue_size, cancel
+    )
+    build_queue: StageQueue[
+        tuple[list[AlertCandidate], list[Alert], str | None]
+    ] = StageQueue("build", config.stream_queue_size, cancel)
+    writer = _AlertWriter(
+        config,
+        outputs.output_alerts_path,
+        outputs.alert_store,
+        outputs.alert_partitions,
+        near_duplicates,
+    )
+    fetch_thread = StageThread(
+        "fetch",
+        _fetch_stage,
+        cancel,
+        providers,
+        {
+            "companies": companies,
+            "company_index": company_index,
+            "triggers": triggers,
+            "lookback_days": (
+                config.backtest_lookback_days if is_backtest else None
+            ),
+            "backtest_mode": is_backtest,
+            "seen_store": seen_store,
+            "shard": shard,
+        },
+        config.articles_csv,
+        items_queue,
+    )
+    write_thread = StageThread("write", writer.consume, cancel, build_queue)
+    def _normalized_items() -> Iterator[tuple[NewsItem, str | None]]:
+        nonlocal url_duplicates
+        for news_item in items_queue:
+            url_key = _url_dedupe_key(news_item, config.match_hinted_full_scan)
+            if url_key:
+                if url_key in seen_urls:
+                    url_duplicates += 1
+                    continue
+                seen_urls.add(url_key)
+            cluster_id = None
+            if near_duplicates is not None:
+                cluster_id, is_representative = near_duplicates.assign(
+                    news_item, _near_duplicate_scope(news_item, config)
+                )
+                if not is_representative:
+                    continue
+            yield news_item, cluster_id
+
+    fetch_thread.start()
+    write_thread.start()
+    try:
+        for news_item, cluster_id, stage_results in parallel_matcher.evaluate_stream(
+            _normalized_items()
+        ):
+            if stage_results is None:
                 continue
 
             candidates, alerts = build_alerts_for_article(
                 news_item,
-                company_matches,
-                matched_triggers,
+                stage_results["companies"],
+                stage_results["triggers"],
                 created_at,
+                claim_key=claim_alert_key,
+                all_candidates=config.alert_candidates_all,
+                stats=build_stats,
             )
-            all_candidates.extend(candidates)
-            all_alerts.extend(alerts)
-
-    if all_candidates:
-        rows = [asdict(candidate) for candidate in all_candidates]
-        fieldnames = list(rows[0].keys())
-        write_csv(config.alert_candidates_csv, rows, fieldnames, append=True)
-
-    output_alerts_path = (
-        config.backtest_output_csv if is_backtest else config.alerts_csv
+            if candidates or alerts:
+                build_queue.put((candidates, alerts, cluster_id))
+            if (
+                alerts
+                and gn_scheduler is not None
+                and news_item.provider_id in gn_company_providers
+                and news_item.company_hint
+            ):
+                # Under full scan the article can alert other companies too;
+                # only the polled company's alerts measure its feed's yield.
+                hinted_alerts = sum(
+                    1 for alert in alerts if alert.company_id == news_item.company_hint
+                )
+                if hinted_alerts:
+                    gn_scheduler.record_alerts(news_item.company_hint, hinted_alerts)
+    except BaseException:
+        cancel.set()
+        raise
+    finally:
+        parallel_matcher.close()
+        build_queue.close()
+        fetch_thread.join_stage()
+        write_thread.join_stage()
+    writer.finish()
+
+    if near_duplicates is not None:
+        print(f"Near duplicates: {near_duplicates.report()}")
+    print(f"URL dedupe: urls={len(seen_urls)} skipped={url_duplicates}")
+    print(f"Match planner: {planner.report()}")
+    if parallel_matcher.stats.workers:
+        print(f"Parallel match: {parallel_matcher.stats.report()}")
+    print(
+        f"Stream: {items_queue.report()} | {build_queue.report()} | "
+        f"write_batches={writer.batches}"
+    )
+    for line in http_pool_report():
+        print(line)
+    cache_report = http_cache_report()
+    if cache_report:
+        print(f"HTTP cache: {cache_report}")
+    gn_url_report = save_gn_url_cache()
+    if gn_url_report:
+        print(f"GN URLs: {gn_url_report}")
+    if gn_scheduler is not None and not is_backtest:
+        scheduler_report = save_gn_scheduler(shard)
+        if scheduler_report:
+            print(f"GN scheduler: {scheduler_report}")
+
+    dedupe_skipped = (
+        build_stats.duplicates + writer.alerts_built - writer.alerts_written
     )
-    existing_alert_keys = load_existing_alert_keys(output_alerts_path)
-    new_alerts: list[Alert] = []
-    for alert in all_alerts:
-        key = alert.dedupe_key
-        if key in existing_alert_keys:
-            continue
-        existing_alert_keys.add(key)
-        new_alerts.append(alert)
-
-    dedupe_skipped = len(all_alerts) - len(new_alerts)
     print(
         "Total news items: "
-        f"{total_news_items} | Alerts generated: {len(new_alerts)} | "
+        f"{items_queue.items} | Alerts generated: {writer.alerts_written} | "
         f"Dedupe skipped: {dedupe_skipped}"
     )
 
-    if new_alerts:
-        rows = [asdict(alert) for alert in new_alerts]
-        if is_backtest:
-            for row in rows:
-                row["run_type"] = "backtest"
-        fieldnames = list(rows[0].keys())
-        write_csv(output_alerts_path, rows, fieldnames, append=True)
-    elif is_backtest:
-        _ensure_backtest_header(output_alerts_path)
+    _close_alert_outputs(config, outputs, writer.sent_ids)
+
+    if seen_store is not None:
+        seen_store.save()
+        print(f"Seen articles: {seen_store.report()}")
+    if near_duplicates is not None and not is_backtest:
+        near_duplicates.save()
+    if shard is not None:
+        write_shard_summary(
+            canonical_alerts_csv,
+            shard,
+            {"items": items_queue.items, "alerts": writer.alerts_written},
+        )
+    print(f"Alert build: {build_stats.report(time.perf_counter() - run_started)}")
 
-    sent_ids = dispatch_alerts(
-        new_alerts,
-        config.alert_channel,
-        config.alerts_enabled,
-        config.slack_webhook_url,
-    )
-    if sent_ids:
-        update_alert_statuses(output_alerts_path, sent_ids, "sent")
+
+def _run_pipeline(config: AppConfig) -> None:
+    """Compatibility wrapper; the pipeline now runs as streaming stages."""
+    run_streaming_pipeline(config)
 
 
 if __name__ == "__main__":
-    run_daily()
+    main()
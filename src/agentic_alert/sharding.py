@@ -0,0 +1,71 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of ``count`` disjoint slices of the company universe.
+
+    A company belongs to the shard picked by a stable hash of its
+    ``company_id``, so every run (and every machine) agrees on the split
+    without coordination.
+    """
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        """Parse ``i/N`` (0 <= i < N)."""
+        index_text, sep, count_text = value.strip().partition("/")
+        try:
+            index, count = int(index_text), int(count_text)
+        except ValueError:
+            index, count = -1, 0
+        if not sep or count < 1 or not 0 <= index < count:
+            raise ValueError(f"Invalid shard {value!r}: expected i/N with 0 <= i < N")
+        return cls(index, count)
+
+    @property
+    def label(self) -> str:
+        return f"{self.index}-of-{self.count}"
+
+    def owns(self, company_id: str) -> bool:
+        return shard_of(company_id, self.count) == self.index
+
+    def path(self, path: Path) -> Path:
+        """Shard-local sibling of a canonical output path."""
+        return path.with_name(f"{path.stem}.shard-{self.label}{path.suffix}")
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def shard_of(company_id: str, count: int) -> int:
+    digest = hashlib.blake2b(company_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count
+
+
+def all_shards(count: int) -> list[Shard]:
+    return [Shard(index, count) for index in range(count)]
+
+
+def summary_path(alerts_csv: Path, shard: Shard) -> Path:
+    return shard.path(alerts_csv).with_suffix(".json")
+
+
+def write_shard_summary(alerts_csv: Path, shard: Shard, counts: dict[str, int]) -> None:
+    """Mark a shard run as complete; ``merge`` refuses to run without it."""
+    path = summary_path(alerts_csv, shard)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"shard": str(shard), **counts}
+    path.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def read_shard_summary(alerts_csv: Path, shard: Shard) -> dict | None:
+    try:
+        return json.loads(summary_path(alerts_csv, shard).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,336 @@
+import json
+import math
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from agentic_alert.models.schemas import Company, NewsItem
+from agentic_alert.sharding import Shard
+
+GN_SCHEDULER_FORMAT_VERSION = 1
+
+# Non-matching articles still signal a company that is in the news, but far
+# less than an alert does.
+_ITEM_WEIGHT = 0.1
+# Pseudo-days of the universe-wide rate blended into each company's rate,
+# so one lucky (or empty) poll does not dominate the estimate.
+_PRIOR_DAYS = 8.0
+
+
+@dataclass
+class CompanyPollState:
+    last_polled: str = ""
+    polls: int = 0
+    covered_days: float = 0.0
+    items: int = 0
+    alerts: int = 0
+    last_published_at: str = ""
+
+
+@dataclass
+class GnSchedulerStats:
+    selected: int = 0
+    overdue: int = 0
+    never_polled: int = 0
+    polled: int = 0
+    items: int = 0
+    alerts: int = 0
+
+
+class GnScheduler:
+    """Picks each day's Google News company batch by expected alert yield.
+
+    Every polled company keeps its last poll day, the news-days its polls
+    covered, the items and alerts they produced and its newest
+    ``published_at``. A company's yield rate is its (alerts + a fraction of
+    items) per covered day, smoothed toward the universe-wide rate; the
+    expected yield of polling it today is that rate times the days of news
+    accumulated since its last poll, capped at ``window_days`` (older
+    articles fall outside the feed's recency window anyway).
+
+    Companies not polled for ``max_staleness_days`` (and companies never
+    polled) are taken first, stalest first, so no company waits longer than
+    that as long as ``batch * max_staleness_days`` covers the universe; the
+    remaining slots go to the highest expected yield.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_staleness_days: int = 7,
+        window_days: int = 4,
+        today: date | None = None,
+    ) -> None:
+        self.path = path
+        self.max_staleness_days = max(max_staleness_days, 1)
+        self.window_days = max(window_days, 1)
+        self.today = today or datetime.now(timezone.utc).date()
+        self.stats = GnSchedulerStats()
+        self._companies: dict[str, CompanyPollState] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        max_staleness_days: int = 7,
+        window_days: int = 4,
+        today: date | None = None,
+    ) -> "GnScheduler":
+        scheduler = cls(path, max_staleness_days, window_days, today)
+        scheduler._companies = _read_states(path)
+        return scheduler
+
+    def state(self, company_id: str) -> CompanyPollState | None:
+        return self._companies.get(company_id)
+
+    def days_since_poll(self, company_id: str) -> int | None:
+        state = self._companies.get(company_id)
+        if state is None or not state.last_polled:
+            return None
+        try:
+            return (self.today - date.fromisoformat(state.last_polled)).days
+        except ValueError:
+            return None
+
+    def _prior_rate(self) -> float:
+        covered = sum(state.covered_days for state in self._companies.values())
+        if covered <= 0:
+            return 1.0
+        signal = sum(
+            state.alerts + _ITEM_WEIGHT * state.items
+            for state in self._companies.values()
+        )
+        return signal / covered
+
+    def expected_yield(self, company_id: str, prior_rate: float) -> float:
+        state = self._companies.get(company_id) or CompanyPollState()
+        rate = (
+            state.alerts + _ITEM_WEIGHT * state.items + prior_rate * _PRIOR_DAYS
+        ) / (state.covered_days + _PRIOR_DAYS)
+        return rate * self._accumulated_days(company_id)
+
+    def _accumulated_days(self, company_id: str) -> int:
+        days = self.days_since_poll(company_id)
+        if days is None:
+            return self.window_days
+        return min(max(days, 0), self.window_days)
+
+    def select(self, universe: list[Company], batch_size: int) -> list[Company]:
+        """The companies to poll today, in universe (rank) order."""
+        if batch_size <= 0 or not universe:
+            return []
+        if batch_size >= len(universe):
+            self.stats.selected = len(universe)
+            return list(universe)
+        prior_rate = self._prior_rate()
+        overdue: list[tuple[float, int]] = []
+        scored: list[tuple[float, float, float, int]] = []
+        for rank, company in enumerate(universe):
+            days = self.days_since_poll(company.company_id)
+            staleness = math.inf if days is None else days
+            if days is None:
+                self.stats.never_polled += 1
+            if staleness >= self.max_staleness_days:
+                overdue.append((-staleness, rank))
+                continue
+            state = self._companies.get(company.company_id)
+            scored.append(
+                (
+                    -self.expected_yield(company.company_id, prior_rate),
+                    # Among equal yields: most recent news, then stalest.
+                    -_timestamp(state.last_published_at if state else ""),
+                    -staleness,
+                    rank,
+                )
+            )
+        overdue.sort()
+        self.stats.overdue = len(overdue)
+        # Never-polled companies are only "overdue" while the state is being
+        # built up; warn when companies polled before miss the guarantee.
+        stale = sum(1 for negated, _rank in overdue if negated > -math.inf)
+        if stale > batch_size:
+            print(
+                f"WARNING: GN scheduler: {stale} companies overdue "
+                f"(max {self.max_staleness_days} days) but batch={batch_size}; "
+                "raise GN_COMPANY_DAILY_BATCH or GN_MAX_STALENESS_DAYS."
+            )
+        picked = [rank for _staleness, rank in overdue[:batch_size]]
+        scored.sort()
+        picked.extend(entry[-1] for entry in scored[: batch_size - len(picked)])
+        self.stats.selected = len(picked)
+        return [universe[rank] for rank in sorted(picked)]
+
+    def record_poll(self, company_id: str, items: list[NewsItem]) -> None:
+        """Account one poll of ``company_id`` returning ``items`` (new ones)."""
+        newest = max((item.published_at for item in items), default="")
+        with self._lock:
+            state = self._companies.setdefault(company_id, CompanyPollState())
+            state.covered_days += self._accumulated_days(company_id)
+            state.last_polled = self.today.isoformat()
+            state.polls += 1
+            state.items += len(items)
+            if newest > state.last_published_at:
+                state.last_published_at = newest
+            self.stats.polled += 1
+            self.stats.items += len(items)
+
+    def record_alerts(self, company_id: str, count: int) -> None:
+        with self._lock:
+            state = self._companies.get(company_id)
+            if state is None:
+                return
+            state.alerts += count
+            self.stats.alerts += count
+
+    def __len__(self) -> int:
+        return len(self._companies)
+
+    def save(self, path: Path | None = None, shard: Shard | None = None) -> None:
+        """Write the state; a shard only writes the companies it owns."""
+        path = path or self.path
+        with self._lock:
+            companies = {
+                company_id: asdict(state)
+                for company_id, state in sorted(self._companies.items())
+                if shard is None or shard.owns(company_id)
+            }
+        _write_states(path, companies)
+
+    def report(self) -> str:
+        return (
+            f"selected={self.stats.selected} overdue={self.stats.overdue} "
+            f"never_polled={self.stats.never_polled} polled={self.stats.polled} "
+            f"items={self.stats.items} alerts={self.stats.alerts} "
+            f"tracked={len(self)} max_staleness_days={self.max_staleness_days}"
+        )
+
+
+def _timestamp(value: str) -> float:
+    if not value:
+        return 0.0
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return 0.0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _read_states(path: Path) -> dict[str, CompanyPollState]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if payload.get("version") != GN_SCHEDULER_FORMAT_VERSION:
+        return {}
+    states: dict[str, CompanyPollState] = {}
+    for company_id, raw in (payload.get("companies") or {}).items():
+        try:
+            states[company_id] = CompanyPollState(**raw)
+        except TypeError:
+            continue
+    return states
+
+
+def _write_states(path: Path, companies: dict[str, dict]) -> None:
+    # One company per line keeps the daily diff of the committed file small.
+    lines = ",\n".join(
+        f"{json.dumps(company_id)}: {json.dumps(state, sort_keys=True)}"
+        for company_id, state in companies.items()
+    )
+    text = (
+        f'{{"version": {GN_SCHEDULER_FORMAT_VERSION}, "companies": {{\n'
+        f"{lines}\n}}}}\n"
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def gn_scheduler_state_path() -> Path:
+    value = os.getenv("GN_SCHEDULER_STATE_PATH")
+    return Path(value) if value else Path("data/gn_scheduler_state.json")
+
+
+_shared_scheduler: GnScheduler | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_gn_scheduler() -> GnScheduler | None:
+    """Scheduler for this run, or None unless GN_SCHEDULER=adaptive."""
+    global _shared_scheduler
+    if (os.getenv("GN_SCHEDULER") or "rotation").strip().lower() != "adaptive":
+        return None
+    path = gn_scheduler_state_path()
+    with _shared_lock:
+        if _shared_scheduler is None or _shared_scheduler.path != path:
+            recency_hours = _env_int("GN_RECENCY_HOURS", 0)
+            max_staleness = _env_int("GN_MAX_STALENESS_DAYS", 7)
+            _shared_scheduler = GnScheduler.load(
+                path,
+                max_staleness_days=max_staleness,
+                window_days=(
+                    math.ceil(recency_hours / 24)
+                    if recency_hours > 0
+                    else max_staleness
+                ),
+            )
+        return _shared_scheduler
+
+
+def reset_shared_gn_scheduler() -> None:
+    global _shared_scheduler
+    with _shared_lock:
+        _shared_scheduler = None
+
+
+def save_gn_scheduler(shard: Shard | None = None) -> str | None:
+    """Persist the shared scheduler (shard-locally for shard runs)."""
+    with _shared_lock:
+        scheduler = _shared_scheduler
+    if scheduler is None or not scheduler.stats.selected:
+        return None
+    if shard is None:
+        scheduler.save()
+    else:
+        scheduler.save(shard.path(scheduler.path), shard)
+    return scheduler.report()
+
+
+def merge_gn_scheduler_states(shards: list[Shard]) -> str | None:
+    """Fold shard-local scheduler states into the canonical state file."""
+    path = gn_scheduler_state_path()
+    merged = {
+        company_id: asdict(state)
+        for company_id, state in _read_states(path).items()
+    }
+    merged_shards = 0
+    for shard in shards:
+        shard_path = shard.path(path)
+        if not shard_path.exists():
+            continue
+        for company_id, state in _read_states(shard_path).items():
+            if shard.owns(company_id):
+                merged[company_id] = asdict(state)
+        merged_shards += 1
+    if not merged_shards:
+        return None
+    _write_states(path, dict(sorted(merged.items())))
+    for shard in shards:
+        shard.path(path).unlink(missing_ok=True)
+    return f"companies={len(merged)} shards={merged_shards}"
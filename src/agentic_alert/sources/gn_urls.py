@@ -0,0 +1,286 @@
+import base64
+import binascii
+import json
+import os
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from pathlib import Path
+
+GN_URL_CACHE_FORMAT_VERSION = 2
+
+_GN_HOST = "news.google.com"
+_TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "oc", "ocid", "ref", "cmpid", "xtor", "__twitter_impression"}
+)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data) or shift > 63:
+            raise ValueError("truncated varint")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _first_url_field(data: bytes) -> str | None:
+    """Walk a protobuf message and return the first http(s) string field."""
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        wire_type = key & 0x7
+        if wire_type == 0:
+            _value, pos = _read_varint(data, pos)
+        elif wire_type == 2:
+            length, pos = _read_varint(data, pos)
+            chunk = data[pos : pos + length]
+            if len(chunk) != length:
+                raise ValueError("truncated field")
+            pos += length
+            if chunk[:7] == b"http://" or chunk[:8] == b"https://":
+                return chunk.decode("utf-8")
+        elif wire_type == 5:
+            pos += 4
+        elif wire_type == 1:
+            pos += 8
+        else:
+            raise ValueError(f"unsupported wire type {wire_type}")
+    return None
+
+
+def gn_article_token(url: str) -> str | None:
+    """The encoded article id of a news.google.com article link, if any."""
+    parsed = urllib.parse.urlsplit(url or "")
+    if parsed.hostname != _GN_HOST:
+        return None
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) < 2 or parts[-2] not in {"articles", "read"}:
+        return None
+    return parts[-1]
+
+
+def decode_gn_article_url(url: str) -> str | None:
+    """Recover the publisher URL from a Google News article link, offline.
+
+    Article ids starting with ``CBMi`` (and the other legacy ``CB...``
+    prefixes) are base64url-encoded protobuf messages that embed the
+    publisher URL. Newer ids (``AU_yqL...`` payloads) only carry an opaque
+    token that Google resolves server-side; those return None.
+    """
+    token = gn_article_token(url)
+    if not token:
+        return None
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        return _first_url_field(data)
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        return None
+
+
+def canonical_url(url: str) -> str:
+    """Normalized URL for cross-provider dedupe.
+
+    Lowercases scheme and host, drops ``www.``, the fragment, a trailing
+    slash and tracking parameters (``utm_*`` and the usual click ids).
+    """
+    parsed = urllib.parse.urlsplit((url or "").strip())
+    if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+        return url or ""
+    host = parsed.hostname
+    if host.startswith("www."):
+        host = host[4:]
+    if parsed.port and parsed.port not in {80, 443}:
+        host = f"{host}:{parsed.port}"
+    query = urllib.parse.urlencode(
+        [
+            (name, value)
+            for name, value in urllib.parse.parse_qsl(
+                parsed.query, keep_blank_values=True
+            )
+            if not name.lower().startswith("utm_")
+            and name.lower() not in _TRACKING_PARAMS
+        ]
+    )
+    path = parsed.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit(("https", host, path, query, ""))
+
+
+@dataclass
+class GnUrlStats:
+    decoded: int = 0
+    cached: int = 0
+    undecodable: int = 0
+    evicted: int = 0
+
+    def report(self) -> str:
+        return (
+            f"decoded={self.decoded} cached={self.cached} "
+            f"undecodable={self.undecodable} evicted={self.evicted}"
+        )
+
+
+class GnUrlCache:
+    """Persistent map from Google News article ids to publisher URLs.
+
+    Only decoded URLs are persisted, each with the time it was last used;
+    entries unused for ``ttl_days`` are dropped on save, and beyond
+    ``max_entries`` the least recently used go first. Undecodable ids are
+    only remembered for the current run: decoding is local and cheap, and
+    most new-format ids never decode.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_days: int = 30,
+        max_entries: int = 50_000,
+        now: float | None = None,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = max(ttl_days, 0) * 86400
+        self.max_entries = max_entries
+        self.now = time.time() if now is None else now
+        self.stats = GnUrlStats()
+        self._urls: dict[str, tuple[str, float]] = {}
+        self._undecodable: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("version") != GN_URL_CACHE_FORMAT_VERSION:
+            return
+        for token, entry in (payload.get("urls") or {}).items():
+            try:
+                url, last_used = str(entry[0]), float(entry[1])
+            except (TypeError, ValueError, IndexError, KeyError):
+                continue
+            if url:
+                self._urls[token] = (url, last_used)
+
+    def resolve(self, url: str) -> str | None:
+        """Publisher URL for a GN article link, or None if it cannot be decoded."""
+        token = gn_article_token(url)
+        if token is None:
+            return None
+        with self._lock:
+            cached = self._urls.get(token)
+            if cached is not None:
+                self.stats.cached += 1
+                if cached[1] < self.now:
+                    self._urls[token] = (cached[0], self.now)
+                    self._dirty = True
+                return cached[0]
+            if token in self._undecodable:
+                self.stats.cached += 1
+                return None
+        decoded = decode_gn_article_url(url)
+        with self._lock:
+            if decoded:
+                self._urls[token] = (decoded, self.now)
+                self._dirty = True
+                self.stats.decoded += 1
+            else:
+                self._undecodable.add(token)
+                self.stats.undecodable += 1
+        return decoded
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def _prune(self) -> None:
+        if self.ttl_seconds:
+            cutoff = self.now - self.ttl_seconds
+            for token in [
+                token
+                for token, (_url, last_used) in self._urls.items()
+                if last_used < cutoff
+            ]:
+                del self._urls[token]
+                self.stats.evicted += 1
+        overflow = len(self._urls) - self.max_entries
+        if self.max_entries > 0 and overflow > 0:
+            oldest = sorted(self._urls, key=lambda token: self._urls[token][1])
+            for token in oldest[:overflow]:
+                del self._urls[token]
+                self.stats.evicted += 1
+
+    def save(self) -> None:
+        with self._lock:
+            before = len(self._urls)
+            self._prune()
+            if not self._dirty and len(self._urls) == before:
+                return
+            payload = {
+                "version": GN_URL_CACHE_FORMAT_VERSION,
+                "urls": {
+                    token: [url, round(last_used)]
+                    for token, (url, last_used) in self._urls.items()
+                },
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            tmp_path.replace(self.path)
+            self._dirty = False
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _env_enabled(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+_shared_cache: GnUrlCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_gn_url_cache() -> GnUrlCache | None:
+    """Cache at GN_URL_CACHE_PATH, or None when GN_DECODE_URLS is disabled."""
+    global _shared_cache
+    if not _env_enabled("GN_DECODE_URLS", True):
+        return None
+    path = Path(os.getenv("GN_URL_CACHE_PATH") or ".cache/gn_urls.json")
+    with _shared_lock:
+        if _shared_cache is None or _shared_cache.path != path:
+            _shared_cache = GnUrlCache(
+                path,
+                ttl_days=_env_int("GN_URL_CACHE_TTL_DAYS", 30),
+                max_entries=_env_int("GN_URL_CACHE_MAX_ENTRIES", 50_000),
+            )
+        return _shared_cache
+
+
+def reset_shared_gn_url_cache() -> None:
+    global _shared_cache
+    with _shared_lock:
+        _shared_cache = None
+
+
+def save_gn_url_cache() -> str | None:
+    """Persist the shared cache and return its report, if it was used."""
+    with _shared_lock:
+        cache = _shared_cache
+    if cache is None:
+        return None
+    cache.save()
+    return f"{cache.stats.report()} entries={len(cache)}"
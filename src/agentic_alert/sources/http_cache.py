@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from agentic_alert.models.schemas import NewsItem
+
+HTTP_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    etag: str = ""
+    last_modified: str = ""
+    content_sha256: str = ""
+    content_length: int = 0
+    items: list[dict[str, str]] = field(default_factory=list)
+
+    def validator_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def news_items(self) -> list[NewsItem] | None:
+        """Cached items, or None if they no longer fit the NewsItem fields."""
+        try:
+            return [NewsItem(**row) for row in self.items]
+        except (TypeError, KeyError):
+            return None
+
+
+@dataclass
+class HttpCacheStats:
+    hits: int = 0
+    unchanged: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    def report(self) -> str:
+        return (
+            f"hits={self.hits} unchanged={self.unchanged} "
+            f"misses={self.misses} bytes_saved={self.bytes_saved}"
+        )
+
+
+class HttpValidatorCache:
+    """On-disk ETag/Last-Modified cache for RSS feeds, one JSON file per URL.
+
+    Each entry keeps the validators of the last 200 response, the SHA-256 of
+    its body and the NewsItems parsed from it, so a 304 (or a 200 with an
+    identical body) is answered without running feedparser again.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.stats = HttpCacheStats()
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str, url: str) -> Path:
+        digest = hashlib.sha256(f"{key}\n{url}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str, url: str) -> CacheEntry | None:
+        path = self._entry_path(key, url)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != HTTP_CACHE_FORMAT_VERSION:
+            return None
+        entry = payload.get("entry") or {}
+        if entry.get("url") != url:
+            return None
+        try:
+            return CacheEntry(**entry)
+        except TypeError:
+            return None
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        path = self._entry_path(key, entry.url)
+        payload = {"version": HTTP_CACHE_FORMAT_VERSION, "entry": asdict(entry)}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as exc:
+            print(f"HTTP cache: write failed for {entry.url}: {exc}")
+
+    def record_hit(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_saved += entry.content_length
+
+    def record_unchanged(self) -> None:
+        with self._lock:
+            self.stats.unchanged += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.stats.misses += 1
+
+
+def content_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def entry_from_response(
+    url: str,
+    headers,
+    data: bytes,
+    items: list[NewsItem],
+) -> CacheEntry:
+    return CacheEntry(
+        url=url,
+        etag=headers.get("ETag") or "",
+        last_modified=headers.get("Last-Modified") or "",
+        content_sha256=content_sha256(data),
+        content_length=len(data),
+        items=[asdict(item) for item in items],
+    )
+
+
+def _env_enabled(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+_shared_cache: HttpValidatorCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_http_cache() -> HttpValidatorCache | None:
+    """Cache under HTTP_CACHE_DIR, or None when HTTP_CACHE is disabled."""
+    global _shared_cache
+    if not _env_enabled("HTTP_CACHE", True):
+        return None
+    directory = Path(os.getenv("HTTP_CACHE_DIR") or ".cache/http")
+    with _shared_lock:
+        if _shared_cache is None or _shared_cache.directory != directory:
+            _shared_cache = HttpValidatorCache(directory)
+        return _shared_cache
+
+
+def reset_shared_http_cache() -> None:
+    global _shared_cache
+    with _shared_lock:
+        _shared_cache = None
+
+
+def http_cache_report() -> str | None:
+    with _shared_lock:
+        cache = _shared_cache
+    if cache is None:
+        return None
+    return cache.stats.report()
@@ -0,0 +1,168 @@
+import os
+import ssl
+import threading
+from dataclasses import dataclass
+
+import certifi
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "Mozilla/5.0 (AgenticAlert/0.1)"
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter that verifies every HTTPS pool with one shared SSL context.
+
+    requests otherwise hands the CA bundle path to each new connection, which
+    makes urllib3 reload the bundle into the context on every handshake.
+    ``build_connection_pool_key_attributes`` and ``cert_verify`` are
+    subclassing hooks whose behaviour changes between requests releases, so
+    pyproject caps requests to the versions tested here.
+    """
+
+    def __init__(
+        self,
+        ssl_context: ssl.SSLContext,
+        ca_bundle: str,
+        pool_connections: int,
+        pool_maxsize: int,
+    ) -> None:
+        self._ssl_context = ssl_context
+        self._ca_bundle = ca_bundle
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+
+    def _uses_shared_context(self, verify) -> bool:
+        return verify is True or verify == self._ca_bundle
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["ssl_context"] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if self._uses_shared_context(verify):
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs.pop("ca_cert_dir", None)
+            pool_kwargs["ssl_context"] = self._ssl_context
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert) -> None:
+        if url.lower().startswith("https") and self._uses_shared_context(verify):
+            conn.cert_reqs = "CERT_REQUIRED"
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+            return
+        super().cert_verify(conn, url, verify, cert)
+
+
+@dataclass
+class HostPoolStats:
+    host: str
+    requests: int
+    connections: int
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections, 0)
+
+
+class HttpClient:
+    """Process-wide keep-alive HTTP client.
+
+    One requests.Session with pooled connections per host, a single SSL
+    context built from the certifi bundle and gzip/deflate negotiation.
+    Connection reuse is read back from the urllib3 pools for the run log.
+    """
+
+    def __init__(self, pool_maxsize: int = 4, pool_connections: int = 64) -> None:
+        self.ca_bundle = certifi.where()
+        self.ssl_context = ssl.create_default_context(cafile=self.ca_bundle)
+        self._adapter = _PooledAdapter(
+            self.ssl_context,
+            self.ca_bundle,
+            pool_connections=pool_connections,
+            pool_maxsize=max(pool_maxsize, 1),
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self.session.headers.update(
+            {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", 20)
+        return self.session.get(url, **kwargs)
+
+    def pool_stats(self) -> list[HostPoolStats]:
+        pools = self._adapter.poolmanager.pools
+        stats: dict[str, HostPoolStats] = {}
+        with pools.lock:
+            keyed = [pools[key] for key in pools.keys()]
+        for pool in keyed:
+            if not pool.num_requests:
+                continue
+            current = stats.get(pool.host)
+            if current is None:
+                stats[pool.host] = HostPoolStats(
+                    pool.host, pool.num_requests, pool.num_connections
+                )
+                continue
+            current.requests += pool.num_requests
+            current.connections += pool.num_connections
+        return sorted(stats.values(), key=lambda item: (-item.requests, item.host))
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+_shared_client: HttpClient | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_http_client() -> HttpClient:
+    """Client sized to FETCH_MAX_WORKERS so every fetch thread keeps a socket."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient(
+                pool_maxsize=_env_int("FETCH_MAX_WORKERS", 4)
+            )
+        return _shared_client
+
+
+def reset_shared_http_client() -> None:
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+        _shared_client = None
+
+
+def http_pool_report() -> list[str]:
+    """One log line per host; empty when nothing went over the network."""
+    with _shared_lock:
+        client = _shared_client
+    if client is None:
+        return []
+    return [
+        f"HTTP pool: host={item.host} requests={item.requests} "
+        f"connections={item.connections} reused={item.reused}"
+        for item in client.pool_stats()
+    ]
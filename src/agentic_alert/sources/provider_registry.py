@@ -6,8 +6,8 @@ import socket
 import ssl
 import time
 import urllib.error
-import urllib.request
 import urllib.parse
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -15,8 +15,28 @@ import certifi
 import feedparser
 import requests
 
+from agentic_alert.matching.company_index import (
+    CompanyIndex,
+    is_active_company,
+    is_bank_company,
+    load_companies_csv,
+    parse_revenue_value,
+)
+from agentic_alert.matching.companies import CompanyMatcher
 from agentic_alert.models.schemas import Provider, NewsItem, Company, Trigger
-from agentic_alert.storage.csv_store import read_csv
+from agentic_alert.sharding import Shard
+from agentic_alert.sources.fetch_executor import shared_fetch_executor
+from agentic_alert.sources.http_cache import (
+    HttpValidatorCache,
+    content_sha256,
+    entry_from_response,
+    shared_http_cache,
+)
+from agentic_alert.sources.gn_scheduler import shared_gn_scheduler
+from agentic_alert.sources.gn_urls import canonical_url, shared_gn_url_cache
+from agentic_alert.sources.http_client import shared_http_client
+from agentic_alert.storage.csv_store import iter_csv
+from agentic_alert.storage.seen_articles import SeenArticleStore
 
 
 def fetch_news(
@@ -24,21 +44,31 @@ def fetch_news(
     articles_path: Path,
     *,
     companies: list[Company] | None = None,
+    company_index: CompanyIndex | None = None,
     triggers: list[Trigger] | None = None,
     lookback_days: int | None = None,
     backtest_mode: bool = False,
+    seen_store: SeenArticleStore | None = None,
+    shard: Shard | None = None,
 ) -> list[NewsItem]:
-    """Load RSS or dummy articles, depending on provider type."""
+    """Load RSS or dummy articles, depending on provider type.
+
+    With ``shard``, company-scoped providers only query the companies that
+    shard owns.
+    """
     if provider.type == "gdelt_doc":
         return _load_gdelt_doc(
-            provider, companies, triggers, lookback_days, backtest_mode
+            provider, companies, triggers, lookback_days, backtest_mode, shard
         )
 
     if provider.type == "gdelt_snapshot":
         return _load_gdelt_snapshot(provider)
 
+    if provider.type == "gn_topic":
+        return _load_gn_topic(provider, triggers, seen_store)
+
     if _is_rss_provider(provider):
-        return _load_rss(provider, companies)
+        return _load_rss(provider, companies, company_index, seen_store, shard)
 
     if provider.type not in {"site_stub", "dummy"}:
         return []
@@ -60,9 +90,17 @@ def _is_gn_provider(provider: Provider) -> bool:
     return provider.name.startswith("GN_") or "news.google.com" in provider.base_url
 
 
-def _load_rss(provider: Provider, companies: list[Company] | None) -> list[NewsItem]:
+def _load_rss(
+    provider: Provider,
+    companies: list[Company] | None,
+    company_index: CompanyIndex | None = None,
+    seen_store: SeenArticleStore | None = None,
+    shard: Shard | None = None,
+) -> list[NewsItem]:
     if provider.type == "gn_company":
-        return _load_gn_company(provider, companies)
+        return _load_gn_company(
+            provider, companies, company_index, seen_store, shard
+        )
 
     is_file = provider.type == "rss_file" or provider.base_url.startswith("file://")
     items: list[NewsItem] = []
@@ -82,9 +120,25 @@ def _load_rss(provider: Provider, companies: list[Company] | None) -> list[NewsI
             else:
                 if _is_gn_provider(provider):
                     print(f"GN SSL CA bundle: {_ca_bundle_path()}")
-                feed = _parse_rss_from_url(provider.base_url)
-            _log_gn_debug(provider, feed)
-        items = _entries_to_items(provider, getattr(feed, "entries", []) or [])
+                cache = shared_http_cache()
+                if cache is not None:
+                    feed = None
+                    items = _drop_seen_items(
+                        _fetch_rss_items_cached(provider, cache), seen_store
+                    )
+                else:
+                    result = shared_fetch_executor().fetch(
+                        _parse_rss_from_url, provider.base_url
+                    )
+                    if result.error is not None:
+                        raise result.error
+                    feed = result.value
+        if feed is not None:
+            if not is_file:
+                _log_gn_debug(provider, feed)
+            items = _entries_to_items(
+                provider, getattr(feed, "entries", []) or [], seen_store
+            )
     except Exception as exc:  # noqa: BLE001 - log and continue for failing providers
         if _is_gn_provider(provider):
             print(
@@ -108,14 +162,10 @@ def _fetch_url_bytes(url: str) -> bytes:
     parsed = urllib.parse.urlparse(url)
     if parsed.scheme not in {"http", "https"}:
         raise ValueError(f"Unsupported URL scheme: {parsed.scheme}")
-    ca = _ca_bundle_path()
-    ctx = ssl.create_default_context(cafile=ca)
-    req = urllib.request.Request(
-        url, headers={"User-Agent": "Mozilla/5.0 (AgenticAlert/0.1)"}
-    )
     try:
-        with urllib.request.urlopen(req, context=ctx, timeout=20) as resp:
-            return resp.read()
+        response = shared_http_client().get(url, timeout=20)
+        response.raise_for_status()
+        return response.content
     except Exception as exc:  # noqa: BLE001 - log and continue for failing providers
         if _is_ssl_verification_error(exc):
             print(
@@ -129,52 +179,63 @@ def _parse_rss_from_url(url: str) -> feedparser.FeedParserDict:
     return feedparser.parse(data)
 
 
+def _fetch_conditional(url: str, headers: dict[str, str]) -> requests.Response:
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme not in {"http", "https"}:
+        raise ValueError(f"Unsupported URL scheme: {parsed.scheme}")
+    response = shared_http_client().get(url, headers=headers, timeout=20)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+def _fetch_rss_items_cached(
+    provider: Provider, cache: HttpValidatorCache
+) -> list[NewsItem]:
+    url = provider.base_url
+    entry = cache.get(provider.provider_id, url)
+    cached_items = entry.news_items() if entry is not None else None
+    if cached_items is None:
+        # Entries written with other NewsItem fields are refetched without
+        # validators and overwritten below.
+        entry = None
+    headers = entry.validator_headers() if entry else {}
+    result = shared_fetch_executor().fetch(
+        lambda target: _fetch_conditional(target, headers), url
+    )
+    if result.error is not None:
+        raise result.error
+    response = result.value
+    if response.status_code == 304 and cached_items is not None:
+        cache.record_hit(entry)
+        return cached_items
+
+    data = response.content or b""
+    if cached_items is not None and entry.content_sha256 == content_sha256(data):
+        cache.record_unchanged()
+        items = cached_items
+    else:
+        cache.record_miss()
+        feed = feedparser.parse(data)
+        _log_gn_debug(provider, feed)
+        items = _entries_to_items(provider, getattr(feed, "entries", []) or [])
+    cache.put(
+        provider.provider_id,
+        entry_from_response(url, response.headers, data, items),
+    )
+    return items
+
+
 def _companies_csv_path() -> Path:
     value = os.getenv("COMPANIES_CSV")
     return Path(value) if value else Path("data/companies.csv")
 
 def _load_companies_from_csv(path: Path) -> list[Company]:
-    rows = read_csv(path)
-    companies: list[Company] = []
-    for row in rows:
-        aliases_raw = row.get("aliases", "")
-        aliases = [alias.strip() for alias in aliases_raw.split(";") if alias.strip()]
-        companies.append(
-            Company(
-                company_id=row.get("company_id", ""),
-                name=row.get("name", ""),
-                aliases=aliases,
-                revenue_eur=row.get("revenue_eur", ""),
-                industry_code=row.get("industry_code", ""),
-                industry_description=row.get("industry_description", ""),
-                website=row.get("website", ""),
-                website_domain=row.get("website_domain", ""),
-                country=row.get("country", ""),
-                contact_owner=row.get("contact_owner", ""),
-                status=row.get("status", ""),
-            )
-        )
-    return companies
+    return load_companies_csv(path)
 
 
 def _active_companies(companies: list[Company]) -> list[Company]:
-    active: list[Company] = []
-    for company in companies:
-        status = company.status.strip().lower()
-        if status and status != "active":
-            continue
-        if not company.name:
-            continue
-        active.append(company)
-    return active
-
-
-def _company_is_bank(company: Company) -> bool:
-    value = getattr(company, "is_bank", "")
-    if isinstance(value, bool):
-        return value
-    normalized = str(value).strip().lower()
-    return normalized in {"1", "true", "yes", "y"}
+    return [company for company in companies if is_active_company(company)]
 
 
 def _gn_company_candidates(companies: list[Company]) -> list[Company]:
@@ -183,7 +244,7 @@ def _gn_company_candidates(companies: list[Company]) -> list[Company]:
         country = company.country.strip().upper()
         if country != "IT":
             continue
-        if _company_is_bank(company):
+        if is_bank_company(company):
             continue
         candidates.append(company)
     return candidates
@@ -263,14 +324,25 @@ def _save_rotation_pointer(path: Path, pointer: int) -> None:
         print(f"GN rotation state write failed: {exc}")
 
 
-def _parse_revenue_value(value: str) -> float:
-    if not value:
-        return 0.0
-    cleaned = value.replace(",", "").strip()
-    try:
-        return float(cleaned)
-    except ValueError:
-        return 0.0
+def merge_gn_rotation_states(shards: list[Shard]) -> str | None:
+    """Fold the shard-local rotation pointers back into the canonical state.
+
+    Every shard starts from the canonical pointer and advances it by the
+    whole (unsharded) batch, so the shards agree on the next pointer.
+    """
+    state_path = _gn_rotation_state_path()
+    shard_paths = [shard.path(state_path) for shard in shards]
+    pointers = [
+        _load_rotation_pointer(path) for path in shard_paths if path.exists()
+    ]
+    if not pointers:
+        return None
+    if len(set(pointers)) > 1:
+        print(f"WARNING: GN rotation pointers differ across shards: {pointers}")
+    _save_rotation_pointer(state_path, pointers[0])
+    for path in shard_paths:
+        path.unlink(missing_ok=True)
+    return f"pointer={pointers[0]} shards={len(pointers)}"
 
 
 def _build_gn_universe(
@@ -282,7 +354,7 @@ def _build_gn_universe(
     ordered = sorted(companies, key=lambda company: company.company_id or "")
     ordered = sorted(
         ordered,
-        key=lambda company: _parse_revenue_value(company.revenue_eur),
+        key=lambda company: parse_revenue_value(company.revenue_eur),
         reverse=True,
     )
     return ordered[:universe_size]
@@ -351,10 +423,12 @@ def _filter_entries_by_recency(
 def _load_gn_company(
     provider: Provider,
     companies: list[Company] | None,
+    company_index: CompanyIndex | None = None,
+    seen_store: SeenArticleStore | None = None,
+    shard: Shard | None = None,
 ) -> list[NewsItem]:
-    if companies is None:
+    if companies is None and company_index is None:
         companies = _load_companies_from_csv(_companies_csv_path())
-    candidates = _gn_company_candidates(companies)
     universe_size = _gn_company_universe_size()
     batch_size = _gn_company_daily_batch()
     if os.getenv("GITHUB_ACTIONS") == "true" and os.getenv("GN_MODE") == "rotation_sla":
@@ -366,13 +440,39 @@ def _load_gn_company(
             raise RuntimeError(
                 "GN SLA misconfig: GN_COMPANY_UNIVERSE_SIZE must be >= 1000 in Actions."
             )
-    universe = _build_gn_universe(candidates, universe_size)
-    state_path = _gn_rotation_state_path()
-    pointer_before = _load_rotation_pointer(state_path)
-    companies, pointer_after = _select_gn_batch(
-        universe, batch_size, pointer_before
-    )
-    _save_rotation_pointer(state_path, pointer_after)
+    if company_index is not None:
+        universe = (
+            company_index.ranked(company_index.gn_candidates, limit=universe_size)
+            if universe_size > 0
+            else []
+        )
+    else:
+        universe = _build_gn_universe(
+            _gn_company_candidates(companies or []), universe_size
+        )
+    scheduler = shared_gn_scheduler()
+    if scheduler is not None:
+        companies = scheduler.select(universe, batch_size)
+        batch_state = f"scheduler=adaptive overdue={scheduler.stats.overdue}"
+    else:
+        state_path = _gn_rotation_state_path()
+        pointer_before = _load_rotation_pointer(state_path)
+        companies, pointer_after = _select_gn_batch(
+            universe, batch_size, pointer_before
+        )
+        batch_state = f"pointer={pointer_before}->{pointer_after}"
+    if shard is not None:
+        # The batch is selected over the whole universe so the shards split
+        # exactly the companies a single run would have queried.
+        companies = [
+            company for company in companies if shard.owns(company.company_id)
+        ]
+        print(f"GN company shard: {shard} companies={len(companies)}")
+    if scheduler is None:
+        _save_rotation_pointer(
+            shard.path(state_path) if shard is not None else state_path,
+            pointer_after,
+        )
     skipped = max(len(universe) - len(companies), 0)
     if _is_gn_provider(provider) and not _rss_diagnostics_enabled():
         print(f"GN SSL CA bundle: {_ca_bundle_path()}")
@@ -390,8 +490,7 @@ def _load_gn_company(
     )
     print(
         "GN company batch: "
-        f"size={len(companies)} (requested={batch_size}) "
-        f"pointer={pointer_before}->{pointer_after}"
+        f"size={len(companies)} (requested={batch_size}) {batch_state}"
     )
     print(
         "GN company feeds processed: "
@@ -399,19 +498,38 @@ def _load_gn_company(
     )
     print(f"GN company feeds skipped: {skipped}")
 
-    items: list[NewsItem] = []
-    for idx, company in enumerate(companies):
-        company_id = company.company_id or "unknown"
+    requests_to_fetch: list[tuple[Company, str]] = []
+    for company in companies:
         query = _build_gn_company_query(company)
         if not query:
+            if scheduler is not None:
+                # Nothing to poll; count it so it does not stay overdue.
+                scheduler.record_poll(company.company_id, [])
             continue
-        url = _build_gn_company_url(provider.base_url, query)
-        try:
-            feed = _parse_rss_from_url(url)
-        except Exception as exc:  # noqa: BLE001 - log and continue
+        requests_to_fetch.append(
+            (company, _build_gn_company_url(provider.base_url, query))
+        )
+
+    started = time.perf_counter()
+    results = shared_fetch_executor().map(
+        _parse_rss_from_url, [url for _, url in requests_to_fetch]
+    )
+    print(
+        "GN company fetch: "
+        f"feeds={len(results)} "
+        f"failed={sum(1 for result in results if not result.ok)} "
+        f"elapsed={time.perf_counter() - started:.1f}s"
+    )
+
+    items: list[NewsItem] = []
+    for (company, _), result in zip(requests_to_fetch, results):
+        company_id = company.company_id or "unknown"
+        if result.error is not None:
+            exc = result.error
             reason = str(exc).strip() or exc.__class__.__name__
             print(f"GN company feed failed for {company_id}: {reason}")
             continue
+        feed = result.value
         entries = getattr(feed, "entries", []) or []
         max_items = _gn_max_items_per_feed()
         if max_items > 0:
@@ -419,11 +537,110 @@ def _load_gn_company(
         recency_hours = _gn_recency_hours()
         if recency_hours:
             entries = _filter_entries_by_recency(entries, recency_hours)
-        items.extend(
-            _entries_to_items_for_company(provider, company_id, entries)
+        company_items = _entries_to_items_for_company(
+            provider,
+            company_id,
+            entries,
+            company_hint=company.company_id,
+            seen_store=seen_store,
         )
-        if idx < len(companies) - 1:
-            time.sleep(1)
+        if scheduler is not None:
+            scheduler.record_poll(company.company_id, company_items)
+        items.extend(company_items)
+    return items
+
+
+def _gn_topic_max_terms() -> int:
+    value = os.getenv("GN_TOPIC_MAX_TERMS")
+    if not value:
+        return 8
+    try:
+        size = int(value)
+    except ValueError:
+        return 8
+    return max(size, 1)
+
+
+def _gn_topic_when() -> str:
+    value = os.getenv("GN_TOPIC_WHEN")
+    return "1d" if value is None else value.strip()
+
+
+def _build_gn_topic_queries(
+    triggers: list[Trigger] | None,
+) -> list[tuple[str, str]]:
+    """``(trigger_id, query)`` pairs: one OR query per trigger keyword group.
+
+    Keywords already used by an earlier trigger are skipped, and long
+    keyword lists are split into groups of ``GN_TOPIC_MAX_TERMS``.
+    """
+    max_terms = _gn_topic_max_terms()
+    when = _gn_topic_when()
+    suffix = " -banca -banche -bank -banks" + (f" when:{when}" if when else "")
+    queries: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for trigger in triggers or []:
+        terms: list[str] = []
+        for keyword in trigger.keywords:
+            cleaned = keyword.replace("\"", "").strip()
+            if not cleaned or cleaned.lower() in seen:
+                continue
+            seen.add(cleaned.lower())
+            terms.append(f"\"{cleaned}\"")
+        for start in range(0, len(terms), max_terms):
+            group = terms[start : start + max_terms]
+            query = "(" + " OR ".join(group) + ")" + suffix
+            queries.append((trigger.trigger_id, query))
+    return queries
+
+
+def _load_gn_topic(
+    provider: Provider,
+    triggers: list[Trigger] | None,
+    seen_store: SeenArticleStore | None = None,
+) -> list[NewsItem]:
+    """Search Google News once per trigger keyword group (Italian edition).
+
+    Items carry no company hint: the pipeline matches them against the whole
+    company index, so a few dozen requests cover every company.
+    """
+    queries = _build_gn_topic_queries(triggers)
+    started = time.perf_counter()
+    results = shared_fetch_executor().map(
+        _parse_rss_from_url,
+        [_build_gn_company_url(provider.base_url, query) for _, query in queries],
+    )
+    recency_hours = _gn_recency_hours()
+    items: list[NewsItem] = []
+    seen_ids: set[str] = set()
+    failed = 0
+    for (trigger_id, _query), result in zip(queries, results):
+        if result.error is not None:
+            failed += 1
+            exc = result.error
+            reason = str(exc).strip() or exc.__class__.__name__
+            print(f"GN topic feed failed for {trigger_id}: {reason}")
+            continue
+        entries = getattr(result.value, "entries", []) or []
+        if recency_hours:
+            entries = _filter_entries_by_recency(entries, recency_hours)
+        for item in _entries_to_items_for_company(
+            provider,
+            trigger_id,
+            entries,
+            seen_store=seen_store,
+            source_label="GN Topic",
+        ):
+            # The same article often answers several keyword groups.
+            if item.article_id in seen_ids:
+                continue
+            seen_ids.add(item.article_id)
+            items.append(item)
+    print(
+        "GN topic fetch: "
+        f"queries={len(queries)} failed={failed} items={len(items)} "
+        f"elapsed={time.perf_counter() - started:.1f}s"
+    )
     return items
 
 
@@ -469,7 +686,7 @@ def _collect_trigger_keywords(triggers: list[Trigger] | None) -> list[str]:
     return keywords
 
 
-def _build_gdelt_query(company: Company, trigger_keywords: list[str]) -> str:
+def _gdelt_company_terms(company: Company) -> list[str]:
     terms = [company.name] + list(company.aliases)
     parts: list[str] = []
     seen: set[str] = set()
@@ -484,15 +701,59 @@ def _build_gdelt_query(company: Company, trigger_keywords: list[str]) -> str:
         parts.append(f"\"{cleaned}\"")
     if company.website_domain:
         parts.append(f"site:{company.website_domain}")
-    if not parts:
+    return parts
+
+
+def _gdelt_query(company_terms: list[str], trigger_keywords: list[str]) -> str:
+    if not company_terms:
         return ""
-    company_clause = "(" + " OR ".join(parts) + ")"
+    company_clause = "(" + " OR ".join(company_terms) + ")"
     if not trigger_keywords:
         return company_clause
     keyword_clause = "(" + " OR ".join(f"\"{kw}\"" for kw in trigger_keywords) + ")"
     return f"{company_clause} AND {keyword_clause}"
 
 
+def _gdelt_max_query_chars() -> int:
+    value = os.getenv("GDELT_MAX_QUERY_CHARS")
+    if not value:
+        return 1800
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1800
+
+
+def _pack_gdelt_queries(
+    companies: list[Company],
+    trigger_keywords: list[str],
+    max_chars: int,
+) -> list[tuple[list[Company], str]]:
+    """Pack companies into OR queries no longer than ``max_chars``.
+
+    The company terms stay one flat OR list (GDELT does not nest
+    parentheses); a company whose own query is over the limit still gets a
+    query of its own, as before batching.
+    """
+    batches: list[tuple[list[Company], str]] = []
+    batch: list[Company] = []
+    terms: list[str] = []
+    for company in companies:
+        company_terms = _gdelt_company_terms(company)
+        if not company_terms:
+            continue
+        if batch and len(
+            _gdelt_query(terms + company_terms, trigger_keywords)
+        ) > max_chars:
+            batches.append((batch, _gdelt_query(terms, trigger_keywords)))
+            batch, terms = [], []
+        batch.append(company)
+        terms.extend(company_terms)
+    if batch:
+        batches.append((batch, _gdelt_query(terms, trigger_keywords)))
+    return batches
+
+
 def _parse_gdelt_seendate(value: str) -> str:
     if not value:
         return datetime.now(timezone.utc).isoformat()
@@ -505,51 +766,116 @@ def _parse_gdelt_seendate(value: str) -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _gdelt_doc_endpoint() -> str:
+    value = os.getenv("GDELT_DOC_ENDPOINT")
+    return value if value else "https://api.gdeltproject.org/api/v2/doc/doc"
+
+
+def _fetch_gdelt_payload(url: str) -> dict:
+    response = shared_http_client().get(url, timeout=20)
+    response.raise_for_status()
+    return response.json()
+
+
+_GDELT_MAX_RECORDS = 250
+# Windows are not split below this: a slice still at the cap keeps its
+# first 250 records.
+_GDELT_MIN_SLICE = timedelta(hours=1)
+
+
+def _gdelt_datetime(value: datetime) -> str:
+    return value.strftime("%Y%m%d%H%M%S")
+
+
 def _load_gdelt_doc(
     provider: Provider,
     companies: list[Company] | None,
     triggers: list[Trigger] | None,
     lookback_days: int | None,
     backtest_mode: bool,
+    shard: Shard | None = None,
 ) -> list[NewsItem]:
-    """Fetch GDELT Doc 2.0 articles with a capped, rolling lookback window."""
+    """Fetch GDELT Doc 2.0 articles with a capped, rolling lookback window.
+
+    Companies are packed into OR queries up to ``GDELT_MAX_QUERY_CHARS``;
+    the returned articles are assigned back to the batch companies they
+    mention with a local matcher. A window returning the 250-record cap is
+    bisected and both halves re-queried, so packing loses no articles.
+    """
     if companies is None:
         companies = _load_companies_from_csv(_companies_csv_path())
     companies = _active_companies(companies)
+    if shard is not None:
+        companies = [
+            company for company in companies if shard.owns(company.company_id)
+        ]
     trigger_keywords = _collect_trigger_keywords(triggers)
     window_days = lookback_days if lookback_days and lookback_days > 0 else 14
-    max_records = 250
     items: list[NewsItem] = []
     had_failure = False
 
-    endpoint = "https://api.gdeltproject.org/api/v2/doc/doc"
-
-    for company in companies:
-        query = _build_gdelt_query(company, trigger_keywords)
-        if not query:
-            continue
-        params = {
-            "query": query,
-            "mode": "artlist",
-            "format": "json",
-            "timespan": f"{window_days}d",
-            "maxrecords": str(max_records),
-        }
-        try:
-            response = requests.get(endpoint, params=params, timeout=20)
-            response.raise_for_status()
-            payload = response.json()
-        except Exception as exc:  # noqa: BLE001 - log and continue
-            reason = str(exc).strip() or exc.__class__.__name__
-            print(f"GDELT {provider.name}: fetch failed for {company.company_id}: {reason}")
-            had_failure = True
-            continue
-
-        articles = payload.get("articles") or payload.get("results") or []
-        for article in articles[:max_records]:
-            url = article.get("url") or ""
-            if not url:
+    endpoint = _gdelt_doc_endpoint()
+    batches = _pack_gdelt_queries(
+        companies, trigger_keywords, _gdelt_max_query_chars()
+    )
+    end = datetime.now(timezone.utc).replace(microsecond=0)
+    pending = [
+        (position, end - timedelta(days=window_days), end)
+        for position in range(len(batches))
+    ]
+    articles_by_batch: list[dict[str, dict]] = [{} for _ in batches]
+    requests_sent = 0
+    sliced = 0
+    while pending:
+        urls = [
+            f"{endpoint}?"
+            + urllib.parse.urlencode(
+                {
+                    "query": batches[position][1],
+                    "mode": "artlist",
+                    "format": "json",
+                    "startdatetime": _gdelt_datetime(start),
+                    "enddatetime": _gdelt_datetime(stop),
+                    "maxrecords": str(_GDELT_MAX_RECORDS),
+                }
+            )
+            for position, start, stop in pending
+        ]
+        requests_sent += len(urls)
+        results = shared_fetch_executor().map(_fetch_gdelt_payload, urls)
+        next_pending: list[tuple[int, datetime, datetime]] = []
+        for (position, start, stop), result in zip(pending, results):
+            if result.error is not None:
+                exc = result.error
+                reason = str(exc).strip() or exc.__class__.__name__
+                first_id = batches[position][0][0].company_id
+                print(
+                    f"GDELT {provider.name}: fetch failed for batch "
+                    f"{first_id}+{len(batches[position][0]) - 1}: {reason}"
+                )
+                had_failure = True
+                continue
+            payload = result.value or {}
+            articles = payload.get("articles") or payload.get("results") or []
+            if len(articles) >= _GDELT_MAX_RECORDS and stop - start > _GDELT_MIN_SLICE:
+                middle = start + (stop - start) / 2
+                next_pending.append((position, start, middle))
+                next_pending.append((position, middle, stop))
+                sliced += 1
                 continue
+            for article in articles[:_GDELT_MAX_RECORDS]:
+                url = article.get("url") or ""
+                if url:
+                    articles_by_batch[position].setdefault(url, article)
+        pending = next_pending
+
+    unmatched = 0
+    unhinted_urls: set[str] = set()
+    for (batch, _query), articles in zip(batches, articles_by_batch):
+        if not articles:
+            continue
+        matcher = CompanyMatcher(batch)
+        for url, article in articles.items():
             title = article.get("title") or "TBD"
             published_at = _parse_gdelt_seendate(
                 article.get("seendate") or article.get("date") or ""
@@ -563,18 +889,35 @@ def _load_gdelt_doc(
                 or article.get("language")
                 or ""
             )
-            items.append(
-                NewsItem(
-                    article_id=article_id,
-                    provider_id=provider.provider_id,
-                    source_name="GDELT",
-                    title=title,
-                    url=url,
-                    published_at=published_at,
-                    content_snippet=content_snippet,
-                )
+            item = NewsItem(
+                article_id=article_id,
+                provider_id=provider.provider_id,
+                source_name="GDELT",
+                title=title,
+                url=url,
+                published_at=published_at,
+                content_snippet=content_snippet,
             )
-    print(f"GDELT {provider.name}: fetched {len(items)} items")
+            # GDELT also matches the article body, which artlist does not
+            # return; without a hint the regular scan over every company
+            # still sees the article, as before batching.
+            matches = matcher.match(item)
+            if not matches:
+                if url not in unhinted_urls:
+                    unhinted_urls.add(url)
+                    unmatched += 1
+                    items.append(item)
+                continue
+            items.extend(
+                replace(item, company_hint=match.company.company_id)
+                for match in matches
+            )
+    print(
+        f"GDELT {provider.name}: fetched {len(items)} items "
+        f"companies={sum(len(batch) for batch, _ in batches)} "
+        f"queries={len(batches)} requests={requests_sent} sliced={sliced} "
+        f"unmatched={unmatched}"
+    )
     if backtest_mode and had_failure and not items:
         print(
             "GDELT live fetch failed (network). "
@@ -650,34 +993,47 @@ def _entries_to_items_for_company(
     provider: Provider,
     company_id: str,
     entries: list[feedparser.FeedParserDict],
+    company_hint: str = "",
+    seen_store: SeenArticleStore | None = None,
+    source_label: str = "GN Company",
 ) -> list[NewsItem]:
+    scope = SeenArticleStore.scope_key(provider.provider_id, company_id)
     items: list[NewsItem] = []
     for index, entry in enumerate(entries):
         published_at = _published_at(entry)
+        link = entry.get("link", "TBD")
+        publisher_url = _decode_gn_link(link)
         article_id = (
-            entry.get("id")
+            canonical_url(publisher_url)
+            if publisher_url
+            else entry.get("id")
             or entry.get("guid")
             or entry.get("link")
             or f"{provider.provider_id}-{company_id}-{index + 1}"
         )
+        if seen_store is not None and not seen_store.admit(
+            scope, str(article_id), published_at
+        ):
+            continue
         items.append(
             NewsItem(
                 article_id=str(article_id),
                 provider_id=provider.provider_id,
-                source_name=f"GN Company | {company_id}",
+                source_name=f"{source_label} | {company_id}",
                 title=entry.get("title", "TBD"),
-                url=entry.get("link", "TBD"),
+                url=publisher_url or link,
                 published_at=published_at,
                 content_snippet=entry.get("summary")
                 or entry.get("description")
                 or "TBD",
+                company_hint=company_hint,
             )
         )
     return items
 
 
 def _is_ssl_verification_error(exc: Exception) -> bool:
-    if isinstance(exc, ssl.SSLError):
+    if isinstance(exc, (ssl.SSLError, requests.exceptions.SSLError)):
         return True
     if isinstance(exc, urllib.error.URLError) and isinstance(
         exc.reason, ssl.SSLError
@@ -719,23 +1075,32 @@ def _log_gn_debug(provider: Provider, feed: feedparser.FeedParserDict) -> None:
 def _entries_to_items(
     provider: Provider,
     entries: list[feedparser.FeedParserDict],
+    seen_store: SeenArticleStore | None = None,
 ) -> list[NewsItem]:
     items: list[NewsItem] = []
     for index, entry in enumerate(entries):
         published_at = _published_at(entry)
+        link = entry.get("link", "TBD")
+        publisher_url = _decode_gn_link(link)
         article_id = (
-            entry.get("id")
+            canonical_url(publisher_url)
+            if publisher_url
+            else entry.get("id")
             or entry.get("guid")
             or entry.get("link")
             or f"{provider.provider_id}-{index + 1}"
         )
+        if seen_store is not None and not seen_store.admit(
+            provider.provider_id, str(article_id), published_at
+        ):
+            continue
         items.append(
             NewsItem(
                 article_id=str(article_id),
                 provider_id=provider.provider_id,
                 source_name=provider.name,
                 title=entry.get("title", "TBD"),
-                url=entry.get("link", "TBD"),
+                url=publisher_url or link,
                 published_at=published_at,
                 content_snippet=entry.get("summary")
                 or entry.get("description")
@@ -745,6 +1110,26 @@ def _entries_to_items(
     return items
 
 
+def _decode_gn_link(link: str) -> str | None:
+    """Publisher URL behind a Google News article link, decoded offline."""
+    cache = shared_gn_url_cache()
+    if cache is None:
+        return None
+    return cache.resolve(link)
+
+
+def _drop_seen_items(
+    items: list[NewsItem], seen_store: SeenArticleStore | None
+) -> list[NewsItem]:
+    if seen_store is None:
+        return items
+    return [
+        item
+        for item in items
+        if seen_store.admit(item.provider_id, item.article_id, item.published_at)
+    ]
+
+
 def _published_at(entry: feedparser.FeedParserDict) -> str:
     published = entry.get("published_parsed") or entry.get("updated_parsed")
     if published:
@@ -758,24 +1143,27 @@ def _read_rss_file(base_url: str) -> bytes:
     return path.read_bytes()
 
 
+ARTICLE_COLUMNS = (
+    "article_id",
+    "provider_id",
+    "source_name",
+    "title",
+    "url",
+    "published_at",
+    "content_snippet",
+    "company_hint",
+)
+
+
 def _load_articles(path: Path, provider_id: str) -> list[NewsItem]:
-    rows = read_csv(path)
-    items: list[NewsItem] = []
-    for row in rows:
-        if row.get("provider_id") != provider_id:
-            continue
-        items.append(
-            NewsItem(
-                article_id=row.get("article_id", ""),
-                provider_id=row.get("provider_id", ""),
-                source_name=row.get("source_name", ""),
-                title=row.get("title", ""),
-                url=row.get("url", ""),
-                published_at=row.get("published_at", ""),
-                content_snippet=row.get("content_snippet", ""),
-            )
+    return list(
+        iter_csv(
+            path,
+            ARTICLE_COLUMNS,
+            where={"provider_id": provider_id},
+            row_factory=NewsItem,
         )
-    return items
+    )
 
 
 def _rss_diagnostics_enabled() -> bool:
@@ -894,7 +1282,7 @@ def _fetch_rss_with_diagnostics(
         }
         if _is_gn_provider_id(provider.provider_id):
             request_kwargs["verify"] = certifi.where()
-        response = requests.get(url, **request_kwargs)
+        response = shared_http_client().get(url, **request_kwargs)
         status = response.status_code
         req_status = str(status)
         final_url = response.url or ""
@@ -1,6 +1,17 @@
 import csv
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List, Dict
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 
 def read_csv(path: Path) -> List[Dict[str, str]]:
@@ -11,6 +22,54 @@ def read_csv(path: Path) -> List[Dict[str, str]]:
         return list(reader)
 
 
+def iter_csv(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    where: Optional[Mapping[str, str]] = None,
+    predicate: Optional[Callable[[Tuple[str, ...]], bool]] = None,
+    row_factory: Optional[Callable[..., object]] = None,
+) -> Iterator:
+    """Stream rows of ``path`` without building a dict per row.
+
+    ``columns`` projects (and orders) the fields of each row; columns missing
+    from the header or from a short row read as "". ``where`` keeps rows whose
+    raw value equals the given one for every listed column, checked before the
+    projection is built. ``predicate`` is then applied to the projected tuple.
+    Rows are yielded as tuples, or as ``row_factory(*values)`` when given, so a
+    dataclass whose leading fields match ``columns`` can be built directly.
+    """
+    if not path.exists():
+        return
+    with path.open("r", newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        positions = {name: index for index, name in enumerate(header)}
+        if columns is None:
+            columns = header
+        picks = [positions.get(name, -1) for name in columns]
+        filters = [
+            (positions.get(name, -1), expected)
+            for name, expected in (where or {}).items()
+        ]
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            if filters and any(
+                (row[index] if index >= 0 else "") != expected
+                for index, expected in filters
+            ):
+                continue
+            values = tuple(row[index] if index >= 0 else "" for index in picks)
+            if predicate is not None and not predicate(values):
+                continue
+            yield row_factory(*values) if row_factory is not None else values
+
+
 def write_csv(
     path: Path,
     rows: Iterable[Dict[str, str]],
@@ -25,3 +84,40 @@ def write_csv(
             writer.writeheader()
         for row in rows:
             writer.writerow(row)
+
+
+def record_values(fieldnames: Sequence[str]) -> Callable[[object], Tuple]:
+    """Return a getter that reads ``fieldnames`` off a record as a tuple.
+
+    This is the cheap alternative to ``dataclasses.asdict``: no deep copies
+    and no per-row dict.
+    """
+    if len(fieldnames) == 1:
+        getter = attrgetter(fieldnames[0])
+        return lambda record: (getter(record),)
+    return attrgetter(*fieldnames)
+
+
+def record_rows(
+    records: Iterable[object], fieldnames: Sequence[str]
+) -> List[Dict[str, object]]:
+    """Shallow dict rows for consumers that still need mappings."""
+    getter = record_values(fieldnames)
+    return [dict(zip(fieldnames, getter(record))) for record in records]
+
+
+def write_records(
+    path: Path,
+    records: Iterable[object],
+    fieldnames: Sequence[str],
+    append: bool = False,
+) -> None:
+    """``write_csv`` for dataclass records, written with a plain csv.writer."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = "a" if append else "w"
+    getter = record_values(fieldnames)
+    with path.open(mode, newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        if not append or path.stat().st_size == 0:
+            writer.writerow(fieldnames)
+        writer.writerows(map(getter, records))
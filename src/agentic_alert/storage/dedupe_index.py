@@ -0,0 +1,352 @@
+import bisect
+import csv
+import hashlib
+import io
+import json
+import mmap
+import struct
+from array import array
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+DEDUPE_INDEX_FORMAT_VERSION = 1
+
+_MAGIC = b"AADX"
+_HEADER = struct.Struct("=4sIQ")
+_BLOOM_HEADER = struct.Struct("=4sIQI")
+_BLOOM_HASHES = 7
+_BLOOM_BITS_PER_KEY = 10
+_TAIL_BYTES = 256
+_EPOCH = date(1970, 1, 1)
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def _day_number(value: str) -> Optional[int]:
+    try:
+        return (date.fromisoformat(value[:10]) - _EPOCH).days
+    except ValueError:
+        return None
+
+
+def _today_number() -> int:
+    return (datetime.now(timezone.utc).date() - _EPOCH).days
+
+
+def _tail_fingerprint(path: Path, offset: int) -> str:
+    start = max(offset - _TAIL_BYTES, 0)
+    with path.open("rb") as handle:
+        handle.seek(start)
+        return hashlib.sha256(handle.read(offset - start)).hexdigest()
+
+
+class _Bloom:
+    def __init__(self, bits: int) -> None:
+        self.bits = max(bits, 8 * 1024)
+        self.data = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, value: int):
+        first = value & 0xFFFFFFFF
+        second = (value >> 32) | 1
+        for index in range(_BLOOM_HASHES):
+            yield (first + index * second) % self.bits
+
+    def add(self, value: int) -> None:
+        for position in self._positions(value):
+            self.data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: int) -> bool:
+        return all(
+            self.data[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def write(self, path: Path, capacity: int) -> None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(
+                _BLOOM_HEADER.pack(
+                    _MAGIC, DEDUPE_INDEX_FORMAT_VERSION, self.bits, capacity
+                )
+            )
+            handle.write(self.data)
+        tmp_path.replace(path)
+
+    @classmethod
+    def read(cls, path: Path) -> Optional[tuple["_Bloom", int]]:
+        try:
+            payload = path.read_bytes()
+        except OSError:
+            return None
+        if len(payload) < _BLOOM_HEADER.size:
+            return None
+        magic, version, bits, capacity = _BLOOM_HEADER.unpack_from(payload)
+        if magic != _MAGIC or version != DEDUPE_INDEX_FORMAT_VERSION:
+            return None
+        bloom = cls(bits)
+        if len(payload) - _BLOOM_HEADER.size != len(bloom.data):
+            return None
+        bloom.data[:] = payload[_BLOOM_HEADER.size:]
+        return bloom, capacity
+
+
+class DedupeIndex:
+    """Persistent dedupe-key index kept next to an alerts CSV.
+
+    Keys are stored as 64-bit BLAKE2b hashes with the day of the alert in a
+    sorted base segment that is memory-mapped, plus a small sorted delta of
+    recent additions, both fronted by a Bloom filter. A checkpoint records
+    the CSV byte offset already indexed and a fingerprint of the bytes just
+    before it; on open only rows appended after the offset are parsed, and
+    any mismatch (file truncated or rewritten by someone else) triggers a
+    full rebuild. The delta is merged into the base once it grows past an
+    eighth of it, and that merge also drops entries older than
+    ``retention_days`` (0 keeps everything).
+    """
+
+    def __init__(
+        self,
+        csv_path: Path,
+        key_for_row: Callable[[Dict[str, str]], str],
+        retention_days: int = 0,
+        today: Optional[int] = None,
+    ) -> None:
+        self.csv_path = csv_path
+        self.key_for_row = key_for_row
+        self.retention_days = max(retention_days, 0)
+        self.today = today if today is not None else _today_number()
+        self.base_path = csv_path.with_name(csv_path.name + ".dedupe.idx")
+        self.delta_path = csv_path.with_name(csv_path.name + ".dedupe.delta")
+        self.bloom_path = csv_path.with_name(csv_path.name + ".dedupe.bloom")
+        self.meta_path = csv_path.with_name(csv_path.name + ".dedupe.json")
+        self.rows_scanned = 0
+        self.rebuilt = False
+        self._mmap: Optional[mmap.mmap] = None
+        self._hashes = memoryview(b"").cast("Q")
+        self._days = memoryview(b"").cast("I")
+        self._delta: Dict[int, int] = {}
+        self._bloom = _Bloom(0)
+        self._capacity = 0
+        self._base_min_day: Optional[int] = None
+
+    @classmethod
+    def open(
+        cls,
+        csv_path: Path,
+        key_for_row: Callable[[Dict[str, str]], str],
+        retention_days: int = 0,
+        today: Optional[int] = None,
+    ) -> "DedupeIndex":
+        index = cls(csv_path, key_for_row, retention_days, today)
+        offset = index._load()
+        if offset is None:
+            index._reset()
+            index.rebuilt = True
+            offset = 0
+        index._scan_from(offset)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._hashes) + len(self._delta)
+
+    def __contains__(self, key: str) -> bool:
+        value = key_hash(key)
+        if value not in self._bloom:
+            return False
+        if value in self._delta:
+            return True
+        position = bisect.bisect_left(self._hashes, value)
+        return position < len(self._hashes) and self._hashes[position] == value
+
+    def add(self, key: str, fallback_day: Optional[int] = None) -> None:
+        """Index a key, dated by its published date (third ``|`` field)."""
+        parts = key.split("|")
+        day = _day_number(parts[2]) if len(parts) > 2 else None
+        if day is None:
+            day = fallback_day if fallback_day is not None else self.today
+        value = key_hash(key)
+        self._delta[value] = day
+        self._bloom.add(value)
+
+    def add_row(self, row: Dict[str, str]) -> None:
+        key = self.key_for_row(row)
+        if key:
+            self.add(key, _day_number(row.get("created_at") or ""))
+
+    def save(self) -> None:
+        """Checkpoint at the current end of the CSV.
+
+        Callers must have added every key they wrote to the CSV since
+        ``open`` (the pipeline adds each alert before appending it).
+        """
+        if self._needs_compaction():
+            self._compact()
+        self._write_segment(self.delta_path, sorted(self._delta.items()))
+        self._bloom.write(self.bloom_path, self._capacity)
+        offset = self.csv_path.stat().st_size if self.csv_path.exists() else 0
+        meta = {
+            "version": DEDUPE_INDEX_FORMAT_VERSION,
+            "offset": offset,
+            "tail_sha256": _tail_fingerprint(self.csv_path, offset)
+            if offset
+            else "",
+            "base_min_day": self._base_min_day,
+        }
+        tmp_path = self.meta_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        tmp_path.replace(self.meta_path)
+
+    def close(self) -> None:
+        self._hashes.release()
+        self._days.release()
+        self._hashes = memoryview(b"").cast("Q")
+        self._days = memoryview(b"").cast("I")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def report(self) -> str:
+        return (
+            f"keys={len(self)} base={len(self._hashes)} delta={len(self._delta)} "
+            f"rows_scanned={self.rows_scanned} rebuilt={str(self.rebuilt).lower()}"
+        )
+
+    def _load(self) -> Optional[int]:
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("version") != DEDUPE_INDEX_FORMAT_VERSION:
+            return None
+        offset = int(meta.get("offset") or 0)
+        if not self.csv_path.exists():
+            return None
+        if self.csv_path.stat().st_size < offset:
+            return None
+        if offset and _tail_fingerprint(self.csv_path, offset) != meta.get(
+            "tail_sha256"
+        ):
+            return None
+        bloom = _Bloom.read(self.bloom_path)
+        if bloom is None or not self._map_base():
+            return None
+        delta = self._read_segment(self.delta_path)
+        if delta is None:
+            return None
+        self._bloom, self._capacity = bloom
+        self._delta = delta
+        self._base_min_day = meta.get("base_min_day")
+        return offset
+
+    def _reset(self) -> None:
+        self.close()
+        self._delta = {}
+        self._capacity = 0
+        self._base_min_day = None
+        self._bloom = _Bloom(0)
+        for path in (self.base_path, self.delta_path):
+            path.unlink(missing_ok=True)
+
+    def _map_base(self) -> bool:
+        try:
+            handle = self.base_path.open("rb")
+        except OSError:
+            return False
+        with handle:
+            header = handle.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return False
+            magic, version, count = _HEADER.unpack(header)
+            if magic != _MAGIC or version != DEDUPE_INDEX_FORMAT_VERSION:
+                return False
+            if count == 0:
+                return True
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) != _HEADER.size + count * 12:
+            mapped.close()
+            return False
+        view = memoryview(mapped)
+        self._mmap = mapped
+        self._hashes = view[_HEADER.size:_HEADER.size + count * 8].cast("Q")
+        self._days = view[_HEADER.size + count * 8:].cast("I")
+        return True
+
+    def _read_segment(self, path: Path) -> Optional[Dict[int, int]]:
+        if not path.exists():
+            return {}
+        payload = path.read_bytes()
+        if len(payload) < _HEADER.size:
+            return None
+        magic, version, count = _HEADER.unpack_from(payload)
+        if magic != _MAGIC or version != DEDUPE_INDEX_FORMAT_VERSION:
+            return None
+        if len(payload) != _HEADER.size + count * 12:
+            return None
+        hashes = array("Q", payload[_HEADER.size:_HEADER.size + count * 8])
+        days = array("I", payload[_HEADER.size + count * 8:])
+        return dict(zip(hashes, days))
+
+    def _write_segment(self, path: Path, entries) -> None:
+        hashes = array("Q", (value for value, _ in entries))
+        days = array("I", (day for _, day in entries))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(
+                _HEADER.pack(_MAGIC, DEDUPE_INDEX_FORMAT_VERSION, len(hashes))
+            )
+            hashes.tofile(handle)
+            days.tofile(handle)
+        tmp_path.replace(path)
+
+    def _scan_from(self, offset: int) -> None:
+        if not self.csv_path.exists():
+            return
+        with self.csv_path.open("rb") as handle:
+            header_line = handle.readline()
+            start = max(offset, len(header_line))
+            handle.seek(start)
+            tail = handle.read()
+        if not header_line or not tail:
+            return
+        fieldnames = next(csv.reader([header_line.decode("utf-8").strip("\r\n")]))
+        reader = csv.DictReader(
+            io.StringIO(tail.decode("utf-8"), newline=""), fieldnames=fieldnames
+        )
+        for row in reader:
+            self.rows_scanned += 1
+            self.add_row(row)
+
+    def _needs_compaction(self) -> bool:
+        base = len(self._hashes)
+        if len(self) > self._capacity:
+            return True
+        if len(self._delta) > max(base // 8, 4096):
+            return True
+        if self.retention_days and self._base_min_day is not None:
+            return self._base_min_day < self.today - self.retention_days
+        return False
+
+    def _compact(self) -> None:
+        cutoff = self.today - self.retention_days if self.retention_days else None
+        merged: Dict[int, int] = dict(zip(self._hashes, self._days))
+        merged.update(self._delta)
+        entries = sorted(
+            (value, day)
+            for value, day in merged.items()
+            if cutoff is None or day >= cutoff
+        )
+        self.close()
+        self._write_segment(self.base_path, entries)
+        self._delta = {}
+        self._base_min_day = min((day for _, day in entries), default=None)
+        self._capacity = max(len(entries) * 2, 1024)
+        self._bloom = _Bloom(self._capacity * _BLOOM_BITS_PER_KEY)
+        for value, _ in entries:
+            self._bloom.add(value)
+        self._map_base()
@@ -0,0 +1,223 @@
+import csv
+import gzip
+import io
+import json
+import shutil
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+PARTITIONS_FORMAT_VERSION = 1
+
+
+def _partition_day(value: str) -> str:
+    day = (value or "")[:10]
+    try:
+        date.fromisoformat(day)
+    except ValueError:
+        return "unknown"
+    return day
+
+
+class PartitionedCsvStore:
+    """Append-only CSV rows split into one gzip file per day.
+
+    Rows land in ``<root>/YYYY/MM/DD.csv.gz`` according to the date prefix
+    of ``day_field``; each append adds a new gzip member, so a daily run only
+    touches (and git only sees) the partitions it wrote. ``manifest.json``
+    lists every partition with its row count and columns, which lets readers
+    prune by date range without opening files. ``compact`` rewrites closed
+    partitions into a single member, folds status overrides in and applies
+    retention.
+    """
+
+    def __init__(self, root: Path, day_field: str = "created_at") -> None:
+        self.root = root
+        self.day_field = day_field
+        self.manifest_path = root / "manifest.json"
+        self._manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            payload = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if payload.get("version") != PARTITIONS_FORMAT_VERSION:
+            return {}
+        return payload.get("partitions") or {}
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": PARTITIONS_FORMAT_VERSION,
+            "partitions": dict(sorted(self._manifest.items())),
+        }
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        tmp_path.replace(self.manifest_path)
+
+    def partition_path(self, day: str) -> Path:
+        if day == "unknown":
+            return self.root / "unknown.csv.gz"
+        year, month, dom = day.split("-")
+        return self.root / year / month / f"{dom}.csv.gz"
+
+    @property
+    def days(self) -> List[str]:
+        return sorted(self._manifest)
+
+    def __len__(self) -> int:
+        return sum(entry["rows"] for entry in self._manifest.values())
+
+    def rows_by_day(self) -> Dict[str, int]:
+        return {day: self._manifest[day]["rows"] for day in self.days}
+
+    def append(
+        self,
+        rows: Iterable[Dict[str, str]],
+        fieldnames: List[str],
+        day: Optional[str] = None,
+    ) -> List[str]:
+        """Append rows to their day partitions; returns the days touched.
+
+        Rows without ``day_field`` (alert candidates) go to ``day``, the run
+        date, instead of the never-pruned ``unknown`` partition.
+        """
+        grouped: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        for row in rows:
+            value = row.get(self.day_field) or day or ""
+            grouped[_partition_day(value)].append(row)
+        for day, day_rows in grouped.items():
+            entry = self._manifest.get(day)
+            if entry is not None and entry["fieldnames"] != fieldnames:
+                existing = list(self._read_partition(day))
+                self._rewrite(day, existing + day_rows, fieldnames)
+                continue
+            path = self.partition_path(day)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_member(path, day_rows, fieldnames, "ab", entry is None)
+            if entry is None:
+                entry = {
+                    "path": path.relative_to(self.root).as_posix(),
+                    "rows": 0,
+                    "members": 0,
+                    "fieldnames": fieldnames,
+                }
+                self._manifest[day] = entry
+            entry["rows"] += len(day_rows)
+            entry["members"] += 1
+        if grouped:
+            self._save_manifest()
+        return sorted(grouped)
+
+    def iter_rows(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Iterator[Dict[str, str]]:
+        """Rows of the partitions whose day lies in [start, end] (inclusive)."""
+        for day in self.days:
+            if day != "unknown":
+                if start and day < start:
+                    continue
+                if end and day > end:
+                    continue
+            yield from self._read_partition(day)
+
+    def compact(
+        self,
+        today: Optional[date] = None,
+        retention_days: int = 0,
+        status_overrides: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, int]:
+        """Apply retention, fold status overrides and merge gzip members."""
+        today = today or date.today()
+        today_key = today.isoformat()
+        cutoff = (
+            (today - timedelta(days=retention_days)).isoformat()
+            if retention_days > 0
+            else None
+        )
+        overrides = status_overrides or {}
+        stats = {"dropped": 0, "rewritten": 0, "status_updates": 0}
+        for day in list(self.days):
+            if cutoff and day != "unknown" and day < cutoff:
+                self.partition_path(day).unlink(missing_ok=True)
+                del self._manifest[day]
+                stats["dropped"] += 1
+                continue
+            entry = self._manifest[day]
+            rows = None
+            updates = 0
+            if overrides:
+                rows = list(self._read_partition(day))
+                for row in rows:
+                    status = overrides.get(row.get("alert_id", ""))
+                    if status and row.get("status") != status:
+                        row["status"] = status
+                        updates += 1
+            if updates or (entry["members"] > 1 and day < today_key):
+                if rows is None:
+                    rows = list(self._read_partition(day))
+                self._rewrite(day, rows, entry["fieldnames"])
+                stats["rewritten"] += 1
+                stats["status_updates"] += updates
+        self._remove_empty_dirs()
+        self._save_manifest()
+        return stats
+
+    def import_rows(
+        self, rows: Iterable[Dict[str, str]], fieldnames: List[str]
+    ) -> int:
+        rows = list(rows)
+        self.append(rows, fieldnames)
+        return len(rows)
+
+    def _read_partition(self, day: str) -> Iterator[Dict[str, str]]:
+        path = self.partition_path(day)
+        if not path.exists():
+            return
+        with gzip.open(path, "rt", newline="", encoding="utf-8") as handle:
+            yield from csv.DictReader(handle)
+
+    def _write_member(
+        self,
+        path: Path,
+        rows: List[Dict[str, str]],
+        fieldnames: List[str],
+        mode: str,
+        header: bool,
+    ) -> None:
+        buffer = io.StringIO(newline="")
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+        if header:
+            writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+        with open(path, mode) as raw:
+            with gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as handle:
+                handle.write(buffer.getvalue().encode("utf-8"))
+
+    def _rewrite(
+        self, day: str, rows: List[Dict[str, str]], fieldnames: List[str]
+    ) -> None:
+        path = self.partition_path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        self._write_member(tmp_path, rows, fieldnames, "wb", True)
+        tmp_path.replace(path)
+        self._manifest[day] = {
+            "path": path.relative_to(self.root).as_posix(),
+            "rows": len(rows),
+            "members": 1,
+            "fieldnames": fieldnames,
+        }
+
+    def _remove_empty_dirs(self) -> None:
+        if not self.root.exists():
+            return
+        for directory in sorted(self.root.glob("*/*"), reverse=True):
+            if directory.is_dir() and not any(directory.iterdir()):
+                shutil.rmtree(directory)
+        for directory in self.root.glob("*"):
+            if directory.is_dir() and not any(directory.iterdir()):
+                shutil.rmtree(directory)
@@ -0,0 +1,126 @@
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+SEEN_ARTICLES_FORMAT_VERSION = 1
+
+
+def _timestamp(value: str) -> float | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+@dataclass
+class _Scope:
+    watermark: float = 0.0
+    seen: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class SeenStats:
+    admitted: int = 0
+    skipped_seen: int = 0
+    skipped_watermark: int = 0
+    evicted: int = 0
+
+
+class SeenArticleStore:
+    """Per-feed / per-company set of already processed article ids.
+
+    A scope is a provider id, or ``provider_id|company_id`` for
+    company-scoped feeds. Each scope keeps the ids it has admitted with the
+    time they were first seen, plus a watermark: the newest ``published_at``
+    observed. Ids older than the TTL are evicted on load, and anything
+    published more than a TTL before the watermark is treated as seen, so
+    eviction cannot bring old articles back.
+    """
+
+    def __init__(self, path: Path, ttl_days: int = 7, now: float | None = None) -> None:
+        self.path = path
+        self.ttl_seconds = max(ttl_days, 1) * 86400
+        self.now = now if now is not None else datetime.now(timezone.utc).timestamp()
+        self.stats = SeenStats()
+        self._scopes: dict[str, _Scope] = {}
+
+    @classmethod
+    def load(cls, path: Path, ttl_days: int = 7, now: float | None = None) -> "SeenArticleStore":
+        store = cls(path, ttl_days=ttl_days, now=now)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return store
+        if payload.get("version") != SEEN_ARTICLES_FORMAT_VERSION:
+            return store
+        cutoff = store.now - store.ttl_seconds
+        for key, raw in (payload.get("scopes") or {}).items():
+            seen = raw.get("seen") or {}
+            kept = {
+                article_id: float(first_seen)
+                for article_id, first_seen in seen.items()
+                if float(first_seen) >= cutoff
+            }
+            store.stats.evicted += len(seen) - len(kept)
+            store._scopes[key] = _Scope(
+                watermark=float(raw.get("watermark") or 0.0), seen=kept
+            )
+        return store
+
+    @staticmethod
+    def scope_key(provider_id: str, company_id: str = "") -> str:
+        return f"{provider_id}|{company_id}" if company_id else provider_id
+
+    def admit(self, scope: str, article_id: str, published_at: str = "") -> bool:
+        """Record the article and return True when it was not processed before."""
+        state = self._scopes.get(scope)
+        if state is None:
+            state = _Scope()
+            self._scopes[scope] = state
+        if article_id in state.seen:
+            self.stats.skipped_seen += 1
+            return False
+        published = _timestamp(published_at)
+        if (
+            published is not None
+            and state.watermark
+            and published < state.watermark - self.ttl_seconds
+        ):
+            self.stats.skipped_watermark += 1
+            return False
+        state.seen[article_id] = self.now
+        if published is not None and published > state.watermark:
+            state.watermark = min(published, self.now)
+        self.stats.admitted += 1
+        return True
+
+    def __len__(self) -> int:
+        return sum(len(state.seen) for state in self._scopes.values())
+
+    def save(self) -> None:
+        payload = {
+            "version": SEEN_ARTICLES_FORMAT_VERSION,
+            "scopes": {
+                key: {"watermark": state.watermark, "seen": state.seen}
+                for key, state in sorted(self._scopes.items())
+                if state.seen or state.watermark
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def report(self) -> str:
+        return (
+            f"scopes={len(self._scopes)} ids={len(self)} "
+            f"admitted={self.stats.admitted} skipped_seen={self.stats.skipped_seen} "
+            f"skipped_watermark={self.stats.skipped_watermark} "
+            f"evicted={self.stats.evicted}"
+        )
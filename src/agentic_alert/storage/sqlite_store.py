@@ -0,0 +1,126 @@
+import csv
+import sqlite3
+import threading
+from dataclasses import fields
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+from agentic_alert.models.schemas import Alert
+from agentic_alert.storage.csv_store import record_values
+
+ALERT_COLUMNS = [field.name for field in fields(Alert)]
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS alerts ("
+    + ", ".join(f"{column} TEXT" for column in ALERT_COLUMNS)
+    + ")",
+    "CREATE UNIQUE INDEX IF NOT EXISTS alerts_dedupe_key ON alerts (dedupe_key)",
+    "CREATE INDEX IF NOT EXISTS alerts_alert_id ON alerts (alert_id)",
+    "CREATE INDEX IF NOT EXISTS alerts_status ON alerts (status)",
+    "CREATE INDEX IF NOT EXISTS alerts_created_at ON alerts (created_at)",
+]
+
+
+class SqliteAlertStore:
+    """Alert history in SQLite, an alternative to appending to alerts.csv.
+
+    Dedupe is enforced by the UNIQUE index on ``dedupe_key`` (rows without
+    a key are stored as NULL and never collide), so a run only touches the
+    rows it inserts or updates instead of re-reading the whole history.
+    Columns mirror the ``Alert`` dataclass so ``export_csv`` reproduces the
+    alerts.csv schema.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # The streaming pipeline checks keys from the build stage and inserts
+        # from the write stage; the lock serializes use of the connection.
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SqliteAlertStore":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+
+    def __contains__(self, dedupe_key: object) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM alerts WHERE dedupe_key = ? LIMIT 1", (dedupe_key,)
+            ).fetchone()
+        return row is not None
+
+    def insert_alerts(self, alerts: Iterable[Alert]) -> List[Alert]:
+        """INSERT OR IGNORE each alert and return the ones actually stored."""
+        placeholders = ", ".join("?" for _ in ALERT_COLUMNS)
+        statement = (
+            f"INSERT OR IGNORE INTO alerts ({', '.join(ALERT_COLUMNS)}) "
+            f"VALUES ({placeholders})"
+        )
+        inserted: List[Alert] = []
+        alert_values = record_values(ALERT_COLUMNS)
+        with self._lock, self._conn:
+            for alert in alerts:
+                values = [
+                    value if value != "" else None for value in alert_values(alert)
+                ]
+                cursor = self._conn.execute(statement, values)
+                if cursor.rowcount:
+                    inserted.append(alert)
+        return inserted
+
+    def update_statuses(self, alert_ids: Iterable[str], status: str) -> int:
+        with self._conn:
+            cursor = self._conn.executemany(
+                "UPDATE alerts SET status = ? WHERE alert_id = ?",
+                [(status, alert_id) for alert_id in alert_ids],
+            )
+        return cursor.rowcount
+
+    def import_rows(
+        self,
+        rows: Iterable[Dict[str, str]],
+        dedupe_key_for_row: Callable[[Dict[str, str]], str],
+    ) -> int:
+        """Load legacy alerts.csv rows, filling missing keys via the callback."""
+        alerts = []
+        for row in rows:
+            values = {column: row.get(column) or "" for column in ALERT_COLUMNS}
+            values["dedupe_key"] = dedupe_key_for_row(row)
+            alerts.append(Alert(**values))
+        return len(self.insert_alerts(alerts))
+
+    def iter_rows(self) -> Iterable[Dict[str, str]]:
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(ALERT_COLUMNS)} FROM alerts ORDER BY rowid"
+        )
+        for values in cursor:
+            yield {
+                column: "" if value is None else value
+                for column, value in zip(ALERT_COLUMNS, values)
+            }
+
+    def export_csv(self, path: Path) -> int:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=ALERT_COLUMNS)
+            writer.writeheader()
+            for row in self.iter_rows():
+                writer.writerow(row)
+                written += 1
+        tmp_path.replace(path)
+        return written
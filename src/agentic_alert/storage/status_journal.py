@@ -0,0 +1,75 @@
+import csv
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from agentic_alert.storage.csv_store import read_csv, write_csv
+
+ALERT_STATUSES = ("new", "sent", "failed", "acked")
+JOURNAL_FIELDS = ["alert_id", "status", "changed_at"]
+
+
+def journal_path(alerts_path: Path) -> Path:
+    return alerts_path.with_name(f"{alerts_path.stem}_status_journal.csv")
+
+
+def append_status_changes(
+    alerts_path: Path,
+    alert_ids: Iterable[str],
+    status: str,
+    changed_at: str,
+) -> int:
+    """Append one journal row per alert; I/O is proportional to ``alert_ids``."""
+    if status not in ALERT_STATUSES:
+        raise ValueError(f"Unknown alert status: {status}")
+    rows = [
+        {"alert_id": alert_id, "status": status, "changed_at": changed_at}
+        for alert_id in sorted(alert_ids)
+    ]
+    if rows:
+        write_csv(journal_path(alerts_path), rows, JOURNAL_FIELDS, append=True)
+    return len(rows)
+
+
+def load_status_overrides(alerts_path: Path) -> Dict[str, str]:
+    """Latest journaled status per alert_id (later rows win)."""
+    overrides: Dict[str, str] = {}
+    for row in read_csv(journal_path(alerts_path)):
+        alert_id = row.get("alert_id", "")
+        if alert_id:
+            overrides[alert_id] = row.get("status", "")
+    return overrides
+
+
+def journal_rows(alerts_path: Path) -> int:
+    path = journal_path(alerts_path)
+    if not path.exists():
+        return 0
+    with path.open("r", newline="", encoding="utf-8") as handle:
+        return max(sum(1 for _ in csv.reader(handle)) - 1, 0)
+
+
+def read_alerts(alerts_path: Path) -> List[Dict[str, str]]:
+    """Rows of the alerts CSV with journaled status transitions applied."""
+    rows = read_csv(alerts_path)
+    overrides = load_status_overrides(alerts_path)
+    if overrides:
+        for row in rows:
+            status = overrides.get(row.get("alert_id", ""))
+            if status:
+                row["status"] = status
+    return rows
+
+
+def compact_status_journal(alerts_path: Path) -> int:
+    """Fold the journal into the alerts CSV and remove it.
+
+    Returns the number of journal rows folded in.
+    """
+    pending = journal_rows(alerts_path)
+    if not pending:
+        return 0
+    rows = read_alerts(alerts_path)
+    if rows:
+        write_csv(alerts_path, rows, list(rows[0].keys()), append=False)
+    journal_path(alerts_path).unlink()
+    return pending
@@ -0,0 +1,105 @@
+import queue
+import threading
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+ItemT = TypeVar("ItemT")
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+class StageCancelled(Exception):
+    """Raised inside a stage when another stage failed."""
+
+
+class StageQueue(Generic[ItemT]):
+    """Bounded hand-off between two pipeline stages.
+
+    ``put`` blocks while the queue is full, which is what keeps memory
+    bounded when a downstream stage is slower; it gives up with
+    StageCancelled once ``cancel`` is set so a failing consumer cannot leave
+    its producer blocked forever. Iterating yields items until ``close``.
+    """
+
+    def __init__(self, name: str, maxsize: int, cancel: threading.Event) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.cancel = cancel
+        self.items = 0
+        self.blocked_puts = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+
+    def put(self, item: ItemT) -> None:
+        self._put(item)
+        self.items += 1
+
+    def _put(self, item: object) -> None:
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            self.blocked_puts += 1
+        while True:
+            if self.cancel.is_set():
+                raise StageCancelled(self.name)
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def close(self) -> None:
+        try:
+            self._put(_DONE)
+        except StageCancelled:
+            pass
+
+    def __iter__(self) -> Iterator[ItemT]:
+        while True:
+            try:
+                item = self._queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if self.cancel.is_set():
+                    raise StageCancelled(self.name)
+                continue
+            if item is _DONE:
+                return
+            yield item
+
+    def report(self) -> str:
+        return (
+            f"{self.name}: items={self.items} maxsize={self.maxsize} "
+            f"blocked_puts={self.blocked_puts}"
+        )
+
+
+class StageThread(threading.Thread):
+    """Runs one stage; an exception cancels the other stages and is re-raised
+    by ``join_stage`` in the coordinating thread."""
+
+    def __init__(
+        self,
+        name: str,
+        target: Callable[..., Any],
+        cancel: threading.Event,
+        *args: Any,
+    ) -> None:
+        super().__init__(name=f"stage-{name}", daemon=True)
+        self._target_fn = target
+        self._args = args
+        self._cancel = cancel
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        try:
+            self._target_fn(*self._args)
+        except StageCancelled:
+            pass
+        except BaseException as exc:  # noqa: BLE001 - re-raised by join_stage
+            self.error = exc
+            self._cancel.set()
+
+    def join_stage(self) -> None:
+        self.join()
+        if self.error is not None:
+            raise self.error
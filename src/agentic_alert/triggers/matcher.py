@@ -1,12 +1,78 @@
+from dataclasses import dataclass
+
+from agentic_alert.matching.aho_corasick import AhoCorasick
 from agentic_alert.models.schemas import Trigger
 
 
+@dataclass
+class TriggerHit:
+    trigger_id: str
+    keyword: str
+    start: int
+    end: int
+
+
+@dataclass
+class TriggerMatchResult:
+    triggers: list[Trigger]
+    hits: list[TriggerHit]
+
+
+class TriggerMatcher:
+    """Keyword matcher for all triggers, compiled once from load_triggers.
+
+    Every keyword of every trigger is found in one pass over the lowercased
+    text. Hit offsets refer to that lowercased text; matched triggers keep
+    the order of the input list.
+    """
+
+    def __init__(self, triggers: list[Trigger]) -> None:
+        self._triggers = triggers
+        self._automaton = AhoCorasick()
+        self._targets: list[list[tuple[int, str]]] = []
+        self._always: list[tuple[int, str]] = []
+
+        for position, trigger in enumerate(triggers):
+            for keyword in trigger.keywords:
+                pattern = keyword.lower()
+                if not pattern:
+                    self._always.append((position, keyword))
+                    continue
+                pattern_id = self._automaton.add(pattern)
+                if pattern_id == len(self._targets):
+                    self._targets.append([])
+                self._targets[pattern_id].append((position, keyword))
+        self._automaton.build()
+
+    @property
+    def triggers(self) -> list[Trigger]:
+        return self._triggers
+
+    def match(self, text: str) -> TriggerMatchResult:
+        haystack = text.lower()
+        matched: set[int] = set()
+        hits: list[TriggerHit] = []
+
+        for position, keyword in self._always:
+            matched.add(position)
+            hits.append(
+                TriggerHit(self._triggers[position].trigger_id, keyword, 0, 0)
+            )
+        for start, end, pattern_id in self._automaton.iter_matches(haystack):
+            for position, keyword in self._targets[pattern_id]:
+                matched.add(position)
+                hits.append(
+                    TriggerHit(
+                        self._triggers[position].trigger_id, keyword, start, end
+                    )
+                )
+
+        hits.sort(key=lambda hit: (hit.start, hit.end))
+        return TriggerMatchResult(
+            triggers=[self._triggers[position] for position in sorted(matched)],
+            hits=hits,
+        )
+
+
 def match_triggers(text: str, triggers: list[Trigger]) -> list[Trigger]:
-    haystack = text.lower()
-    matched: list[Trigger] = []
-    for trigger in triggers:
-        for keyword in trigger.keywords:
-            if keyword.lower() in haystack:
-                matched.append(trigger)
-                break
-    return matched
+    return TriggerMatcher(triggers).match(text).triggers
@@ -0,0 +1,72 @@
+from agentic_alert.matching.companies import CompanyMatch
+from agentic_alert.models.schemas import Company, NewsItem, Trigger
+from agentic_alert.pipeline import (
+    AlertBuildStats,
+    alert_key_claimer,
+    build_alerts_for_article,
+)
+
+
+def _company(company_id: str) -> Company:
+    return Company(
+        company_id=company_id,
+        name=f"Company {company_id}",
+        aliases=[],
+        revenue_eur="",
+        industry_code="",
+        industry_description="",
+        website="",
+        website_domain="",
+        country="IT",
+        contact_owner="owner@example.com",
+        status="active",
+    )
+
+
+def _item(article_id: str) -> NewsItem:
+    return NewsItem(
+        article_id=article_id,
+        provider_id="p001",
+        source_name="Feed",
+        title="Alpha acquisisce Beta",
+        url=f"https://example.com/{article_id}",
+        published_at="2026-02-01T08:00:00+00:00",
+        content_snippet="",
+    )
+
+
+def test_dedupe_runs_before_objects_are_built() -> None:
+    matches = [
+        CompanyMatch(_company("c001"), "name", 1.0),
+        CompanyMatch(_company("c002"), "alias", 0.9),
+    ]
+    triggers = [Trigger("t001", "Acquisizione", ["acquisisce"], "high", "")]
+    existing = {"c002|t001|2026-02-01|alpha acquisisce beta"}
+    stats = AlertBuildStats()
+    claim = alert_key_claimer(existing)
+
+    first = build_alerts_for_article(
+        _item("a1"), matches, triggers, "now", claim, stats=stats, all_candidates=False
+    )
+    # The same story re-surfaced under another article id is a duplicate too.
+    second = build_alerts_for_article(
+        _item("a2"), matches, triggers, "now", claim, stats=stats, all_candidates=False
+    )
+
+    candidates, alerts = first
+    assert [alert.company_id for alert in alerts] == ["c001"]
+    assert [candidate.company_id for candidate in candidates] == ["c001"]
+    assert second == ([], [])
+    assert (stats.pairs, stats.duplicates, stats.candidates, stats.alerts) == (
+        4,
+        3,
+        1,
+        1,
+    )
+
+    rerun_candidates, rerun_alerts = build_alerts_for_article(
+        _item("a1"), matches, triggers, "later", alert_key_claimer(existing)
+    )
+    assert rerun_alerts[0].alert_id == alerts[0].alert_id
+    assert rerun_candidates[0].candidate_id == candidates[0].candidate_id
+    assert len(rerun_candidates) == 2
@@ -0,0 +1,105 @@
+import gzip
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from agentic_alert.config import AppConfig
+from agentic_alert.pipeline import _run_pipeline
+from agentic_alert.storage.partitions import PartitionedCsvStore
+
+FIELDS = ["alert_id", "dedupe_key", "created_at", "status"]
+
+
+def _row(alert_id: str, created_at: str) -> dict[str, str]:
+    return {
+        "alert_id": alert_id,
+        "dedupe_key": f"k-{alert_id}",
+        "created_at": created_at,
+        "status": "new",
+    }
+
+
+def test_partitions_append_prune_and_compact(tmp_path: Path) -> None:
+    store = PartitionedCsvStore(tmp_path / "alerts")
+    touched = store.append(
+        [_row("a1", "2026-10-01T08:00:00+00:00"), _row("a2", "2026-10-15T08:00:00")],
+        FIELDS,
+    )
+    store.append([_row("a3", "2026-10-15T09:00:00+00:00")], FIELDS)
+
+    assert touched == ["2026-10-01", "2026-10-15"]
+    assert (tmp_path / "alerts/2026/10/15.csv.gz").exists()
+    reopened = PartitionedCsvStore(tmp_path / "alerts")
+    assert reopened.rows_by_day() == {"2026-10-01": 1, "2026-10-15": 2}
+    assert [row["alert_id"] for row in reopened.iter_rows(start="2026-10-10")] == [
+        "a2",
+        "a3",
+    ]
+
+    stats = reopened.compact(
+        today=date(2026, 10, 20),
+        retention_days=10,
+        status_overrides={"a3": "sent"},
+    )
+
+    assert stats == {"dropped": 1, "rewritten": 1, "status_updates": 1}
+    assert not (tmp_path / "alerts/2026/10/01.csv.gz").exists()
+    with gzip.open(tmp_path / "alerts/2026/10/15.csv.gz", "rt") as handle:
+        assert handle.read().count("alert_id") == 1
+    final = PartitionedCsvStore(tmp_path / "alerts")
+    assert [(row["alert_id"], row["status"]) for row in final.iter_rows()] == [
+        ("a2", "new"),
+        ("a3", "sent"),
+    ]
+
+
+def test_pipeline_writes_partitions_and_dedupes(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,website_domain,country,status\n"
+        "c001,Alpha Energia,,alphaenergia.it,IT,active\n",
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisizione,high,Deal trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\np001,Local Dummy,dummy,,true\n",
+        encoding="utf-8",
+    )
+    (data_dir / "articles.csv").write_text(
+        "article_id,provider_id,source_name,title,url,published_at,content_snippet\n"
+        "a001,p001,Local Dummy,Acquisizione di Alpha Energia,https://example.com/a,"
+        "2026-02-01T00:00:00+00:00,Alpha Energia annuncia un'acquisizione\n",
+        encoding="utf-8",
+    )
+    config = AppConfig(
+        companies_csv=data_dir / "companies.csv",
+        triggers_csv=data_dir / "triggers.csv",
+        providers_csv=data_dir / "providers.csv",
+        articles_csv=data_dir / "articles.csv",
+        alert_candidates_csv=data_dir / "alert_candidates.csv",
+        alerts_csv=data_dir / "alerts.csv",
+        company_index_cache_enabled=False,
+        alert_partitions_enabled=True,
+        alerts_partition_dir=data_dir / "alerts",
+        alert_candidates_partition_dir=data_dir / "alert_candidates",
+    )
+
+    _run_pipeline(config)
+    _run_pipeline(config)
+
+    alerts = PartitionedCsvStore(config.alerts_partition_dir)
+    candidates = PartitionedCsvStore(config.alert_candidates_partition_dir)
+    assert len(alerts) == 1
+    assert len(candidates) == 1
+    today = datetime.now(timezone.utc).date()
+    assert candidates.days == [today.isoformat()]
+    assert (
+        config.alert_candidates_partition_dir / today.strftime("%Y/%m/%d.csv.gz")
+    ).exists()
+    assert not (config.alert_candidates_partition_dir / "unknown.csv.gz").exists()
+    assert not config.alerts_csv.exists()
+    assert not config.alert_candidates_csv.exists()
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+from agentic_alert.matching import company_index as ci
+from agentic_alert.models.schemas import NewsItem
+from agentic_alert.sources import provider_registry as pr
+
+
+def _write_companies(path: Path, rows: list[str]) -> None:
+    header = (
+        "company_id,name,aliases,revenue_eur,website_domain,country,status"
+    )
+    path.write_text(header + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+
+def test_company_index_warm_start_reuses_snapshot(tmp_path: Path, monkeypatch) -> None:
+    csv_path = tmp_path / "companies.csv"
+    cache_dir = tmp_path / "cache"
+    _write_companies(
+        csv_path,
+        [
+            "c001,Alpha Energia,Alpha SpA,100,alpha.it,IT,active",
+            "c002,Beta Foods,,300,beta.it,IT,inactive",
+        ],
+    )
+
+    cold = ci.load_company_index(csv_path, cache_dir)
+    assert len(list(cache_dir.glob("*.idx"))) == 1
+
+    def _fail_parse(_path):
+        raise AssertionError("warm start must not re-parse the CSV")
+
+    monkeypatch.setattr(ci, "load_companies_csv", _fail_parse)
+    warm = ci.load_company_index(csv_path, cache_dir)
+
+    assert [company.company_id for company in warm.companies] == ["c001", "c002"]
+    assert warm.source_hash == cold.source_hash
+    assert warm.companies[0].aliases == ["Alpha SpA"]
+    assert warm._matcher is not None
+    item = NewsItem(
+        article_id="a1",
+        provider_id="p",
+        source_name="s",
+        title="Alpha SpA annuncia",
+        url="https://www.alpha.it/news",
+        published_at="",
+        content_snippet="",
+    )
+    assert [
+        (match.company.company_id, match.match_method)
+        for match in warm.matcher.match(item)
+    ] == [("c001", "domain")]
+    assert warm.active == [0]
+    assert warm.get("c002").name == "Beta Foods"
+
+
+def test_company_index_rebuilds_when_csv_changes(tmp_path: Path) -> None:
+    csv_path = tmp_path / "companies.csv"
+    cache_dir = tmp_path / "cache"
+    _write_companies(csv_path, ["c001,Alpha Energia,,100,alpha.it,IT,active"])
+    first = ci.load_company_index(csv_path, cache_dir)
+
+    _write_companies(csv_path, ["c009,Gamma,,100,gamma.it,IT,active"])
+    second = ci.load_company_index(csv_path, cache_dir)
+
+    assert second.source_hash != first.source_hash
+    assert [company.company_id for company in second.companies] == ["c009"]
+
+
+def test_company_index_ranked_gn_candidates_match_gn_universe(tmp_path: Path) -> None:
+    csv_path = tmp_path / "companies.csv"
+    _write_companies(
+        csv_path,
+        [
+            "c001,Alpha,,100,,IT,active",
+            "c002,Beta,,300,,IT,active",
+            "c003,Gamma,,300,,FR,active",
+            "c004,Delta,,200,,IT,inactive",
+            "c005,Epsilon,,200,,IT,",
+        ],
+    )
+    index = ci.load_company_index(csv_path)
+
+    ranked = index.ranked(index.gn_candidates, limit=2)
+    expected = pr._build_gn_universe(pr._gn_company_candidates(index.companies), 2)
+
+    assert [company.company_id for company in ranked] == ["c002", "c005"]
+    assert ranked == expected
+
+
+def test_company_index_ignores_corrupted_snapshot(tmp_path: Path) -> None:
+    csv_path = tmp_path / "companies.csv"
+    cache_dir = tmp_path / "cache"
+    _write_companies(csv_path, ["c001,Alpha Energia,,100,alpha.it,IT,active"])
+    ci.load_company_index(csv_path, cache_dir)
+    (snapshot,) = cache_dir.glob("*.idx")
+    data = snapshot.read_bytes()
+    snapshot.write_bytes(data[: ci._HEADER.size] + b"\x80\x05garbage" + data[-8:])
+
+    index = ci.load_company_index(csv_path, cache_dir)
+
+    assert [company.company_id for company in index.companies] == ["c001"]
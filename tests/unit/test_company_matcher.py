@@ -0,0 +1,162 @@
+from dataclasses import replace
+
+from agentic_alert.matching.aho_corasick import AhoCorasick
+from agentic_alert.matching.companies import CompanyMatcher
+from agentic_alert.models.schemas import Company, NewsItem
+from agentic_alert.pipeline import match_companies
+
+
+def _company(
+    company_id: str,
+    name: str,
+    aliases: list[str],
+    domain: str = "",
+    status: str = "active",
+) -> Company:
+    return Company(
+        company_id=company_id,
+        name=name,
+        aliases=aliases,
+        revenue_eur="",
+        industry_code="",
+        industry_description="",
+        website="",
+        website_domain=domain,
+        country="IT",
+        contact_owner="",
+        status=status,
+    )
+
+
+def _news(title: str, snippet: str = "", url: str = "https://example.com/a") -> NewsItem:
+    return NewsItem(
+        article_id="a001",
+        provider_id="p001",
+        source_name="Test",
+        title=title,
+        url=url,
+        published_at="2026-02-01T10:00:00+00:00",
+        content_snippet=snippet,
+    )
+
+
+def test_aho_corasick_finds_overlapping_patterns() -> None:
+    automaton = AhoCorasick()
+    ids = {pattern: automaton.add(pattern) for pattern in ["he", "she", "hers", "his"]}
+    automaton.build()
+
+    hits = sorted(
+        (start, end, automaton.patterns[pattern_id])
+        for start, end, pattern_id in automaton.iter_matches("ushers")
+    )
+
+    assert hits == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+    assert automaton.find_ids("this") == {ids["his"]}
+    assert automaton.add("she") == ids["she"]
+
+
+def test_company_matcher_keeps_best_method_and_input_order() -> None:
+    companies = [
+        _company("c001", "Alpha Energia", ["Alpha Energia Italia"], "alphaenergia.it"),
+        _company("c002", "Beta", [], "beta.com"),
+        _company("c003", "Gamma Foods", ["Gamma"], ""),
+        _company("c004", "Delta", [], "", status="inactive"),
+    ]
+    news_item = _news(
+        "Gamma e Alpha Energia Italia annunciano accordo con Delta",
+        snippet="Fonte: beta.com",
+    )
+
+    matches = CompanyMatcher(companies).match(news_item)
+
+    assert [
+        (match.company.company_id, match.match_method, match.confidence)
+        for match in matches
+    ] == [
+        ("c001", "alias", 0.85),
+        ("c002", "domain", 0.95),
+        ("c003", "alias", 0.85),
+    ]
+    assert match_companies(news_item, companies) == matches
+
+
+def test_company_matcher_is_case_insensitive_on_name() -> None:
+    companies = [_company("c001", "Futura Tech", [])]
+
+    matches = CompanyMatcher(companies).match(_news("FUTURA TECH cresce"))
+
+    assert [(m.company.company_id, m.match_method) for m in matches] == [
+        ("c001", "name")
+    ]
+
+
+def test_company_matcher_domain_uses_host_suffixes() -> None:
+    companies = [
+        _company("c001", "Safilo Group", [], "safilo.com"),
+        _company("c002", "Ente Nazionale Idrocarburi", [], "eni.it"),
+    ]
+    matcher = CompanyMatcher(companies)
+
+    from_subdomain = matcher.match(
+        _news("Risultati trimestrali", url="https://news.safilo.com/q3")
+    )
+    from_snippet = matcher.match(
+        _news("Risultati", snippet="Dettagli su https://www.eni.it/it/news")
+    )
+    unrelated = matcher.match(
+        _news("Altro", url="https://www.alitalia-seni.it/x", snippet="veni.it")
+    )
+
+    assert [(m.company.company_id, m.match_method) for m in from_subdomain] == [
+        ("c001", "domain")
+    ]
+    assert [m.company.company_id for m in from_snippet] == ["c002"]
+    assert unrelated == []
+
+
+def test_company_matcher_hinted_item_skips_full_scan_when_disabled() -> None:
+    companies = [
+        _company("c001", "Alpha Energia", []),
+        _company("c002", "Beta Foods", []),
+    ]
+    matcher = CompanyMatcher(companies)
+    hinted = NewsItem(
+        article_id="a001",
+        provider_id="gn_company_it",
+        source_name="GN Company | c002",
+        title="Beta Foods acquisisce Alpha Energia",
+        url="https://news.google.com/rss/articles/x",
+        published_at="2026-02-01T10:00:00+00:00",
+        content_snippet="",
+        company_hint="c002",
+    )
+
+    assert [m.company.company_id for m in matcher.match(hinted)] == ["c001", "c002"]
+    assert [
+        (m.company.company_id, m.match_method)
+        for m in matcher.match(hinted, full_scan=False)
+    ] == [("c002", "name")]
+    assert matcher.match(
+        replace(hinted, title="Altro"), full_scan=False
+    ) == []
+
+
+def test_company_matcher_hinted_path_avoids_universe_scan(monkeypatch) -> None:
+    matcher = CompanyMatcher(
+        [_company(f"c{index:03d}", f"Impresa {index:03d}", []) for index in range(50)]
+    )
+    scans = []
+    real_scan = matcher._scan
+    monkeypatch.setattr(
+        matcher, "_scan", lambda item: scans.append(item) or real_scan(item)
+    )
+    hinted = _news("Impresa 007 acquisisce Impresa 012")
+    hinted = replace(hinted, company_hint="c007")
+
+    verified = matcher.match(hinted, full_scan=False)
+    assert scans == []
+    scanned = matcher.match(hinted)
+
+    assert [m.company.company_id for m in verified] == ["c007"]
+    assert len(scans) == 1
+    assert [m.company.company_id for m in scanned] == ["c007", "c012"]
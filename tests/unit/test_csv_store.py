@@ -0,0 +1,99 @@
+import sys
+from dataclasses import FrozenInstanceError, asdict, fields
+from pathlib import Path
+
+import pytest
+
+from agentic_alert.models.schemas import AlertCandidate, NewsItem
+from agentic_alert.pipeline import load_companies, load_existing_alert_keys
+from agentic_alert.storage.csv_store import (
+    iter_csv,
+    read_csv,
+    record_rows,
+    write_csv,
+    write_records,
+)
+
+
+def test_iter_csv_projects_filters_and_builds_rows(tmp_path: Path) -> None:
+    path = tmp_path / "companies.csv"
+    path.write_text(
+        "company_id,name,country,status\n"
+        "c001,Alpha,IT,active\n"
+        "\n"
+        "c002,Beta,FR,active\n"
+        "c003,Gamma,IT\n"
+        "c004,Delta,IT,inactive\n",
+        encoding="utf-8",
+    )
+
+    rows = iter_csv(path, ["name", "status", "missing"], where={"country": "IT"})
+
+    assert next(rows) == ("Alpha", "active", "")
+    assert list(rows) == [("Gamma", "", ""), ("Delta", "inactive", "")]
+    assert list(
+        iter_csv(
+            path,
+            ["company_id"],
+            where={"status": "active"},
+            predicate=lambda values: values[0] != "c002",
+        )
+    ) == [("c001",)]
+    assert list(iter_csv(path, ["name"], row_factory=str.upper))[-1] == "DELTA"
+    assert list(iter_csv(tmp_path / "absent.csv")) == []
+
+
+def test_loaders_stream_into_models(tmp_path: Path) -> None:
+    companies = tmp_path / "companies.csv"
+    companies.write_text(
+        "company_id,name,aliases,country,status\n"
+        "c001,Alpha Energia,Alpha SpA; AE ,IT,active\n",
+        encoding="utf-8",
+    )
+    alerts = tmp_path / "alerts.csv"
+    alerts.write_text(
+        "alert_id,company_id,trigger_id,dedupe_key,published_at,article_title\n"
+        "a1,c001,t001,explicit,,\n"
+        "a2,c001,t002,,2026-02-01T00:00:00+00:00,Titolo\n"
+        "a3,,t002,ignored,,\n",
+        encoding="utf-8",
+    )
+
+    [company] = load_companies(companies)
+    keys = load_existing_alert_keys(alerts)
+
+    assert company.aliases == ["Alpha SpA", "AE"]
+    assert (company.country, company.status, company.website) == ("IT", "active", "")
+    assert len(keys) == 2 and "explicit" in keys
+    assert "ignored" not in keys
+
+
+def test_write_records_matches_asdict_rows(tmp_path: Path) -> None:
+    candidates = [
+        AlertCandidate("k1", "a1", "c001", "t001", "name", 0.9),
+        AlertCandidate("k2", "a2", "c002", "t001", "alias, domain", 1 / 3),
+    ]
+    fieldnames = [field.name for field in fields(AlertCandidate)]
+
+    write_csv(tmp_path / "legacy.csv", [asdict(c) for c in candidates], fieldnames)
+    write_records(tmp_path / "fast.csv", candidates[:1], fieldnames)
+    write_records(tmp_path / "fast.csv", candidates[1:], fieldnames, append=True)
+
+    assert (tmp_path / "fast.csv").read_bytes() == (
+        tmp_path / "legacy.csv"
+    ).read_bytes()
+    assert record_rows(candidates, fieldnames) == [asdict(c) for c in candidates]
+    assert read_csv(tmp_path / "fast.csv")[1]["match_method"] == "alias, domain"
+
+
+def test_models_are_slotted_frozen_and_interned() -> None:
+    provider_id = "".join(["p", "001"])
+    first = NewsItem("a1", provider_id, "Feed", "T", "u", "", "")
+    second = NewsItem("a2", "".join(["p", "001"]), "Feed", "T", "u", "", "")
+
+    assert not hasattr(first, "__dict__")
+    assert first.provider_id is second.provider_id
+    candidate = AlertCandidate("k1", "a1", "c001", "".join(["t", "001"]), "name", 1.0)
+    assert candidate.trigger_id is sys.intern("t001")
+    with pytest.raises(FrozenInstanceError):
+        candidate.confidence = 0.5
@@ -0,0 +1,81 @@
+from datetime import date
+from pathlib import Path
+
+from agentic_alert.pipeline import _row_dedupe_key
+from agentic_alert.storage.dedupe_index import DedupeIndex
+
+HEADER = "alert_id,company_id,trigger_id,published_at,dedupe_key,created_at,status\n"
+
+
+def _row(alert_id: str, key: str) -> str:
+    day = key.split("|")[2]
+    return f"{alert_id},c1,t1,{day},{key},{day}T00:00:00+00:00,new\n"
+
+
+def _day(value: str) -> int:
+    return (date.fromisoformat(value) - date(1970, 1, 1)).days
+
+
+def test_dedupe_index_scans_only_appended_rows(tmp_path: Path) -> None:
+    alerts = tmp_path / "alerts.csv"
+    alerts.write_text(
+        HEADER + _row("a1", "c1|t1|2026-01-01|x") + _row("a2", "c1|t1|2026-01-02|y"),
+        encoding="utf-8",
+    )
+    first = DedupeIndex.open(alerts, _row_dedupe_key)
+    assert first.rebuilt and first.rows_scanned == 2
+    first.save()
+    first.close()
+
+    with alerts.open("a", encoding="utf-8") as handle:
+        handle.write(_row("a3", "c1|t1|2026-01-03|z"))
+    second = DedupeIndex.open(alerts, _row_dedupe_key)
+
+    assert not second.rebuilt
+    assert second.rows_scanned == 1
+    assert "c1|t1|2026-01-01|x" in second
+    assert "c1|t1|2026-01-03|z" in second
+    assert "c1|t1|2026-01-04|w" not in second
+    assert len(second) == 3
+    second.close()
+
+
+def test_dedupe_index_rebuilds_after_foreign_rewrite(tmp_path: Path) -> None:
+    alerts = tmp_path / "alerts.csv"
+    alerts.write_text(HEADER + _row("a1", "c1|t1|2026-01-01|x"), encoding="utf-8")
+    index = DedupeIndex.open(alerts, _row_dedupe_key)
+    index.save()
+    index.close()
+
+    alerts.write_text(HEADER + _row("b1", "c2|t2|2026-02-01|q"), encoding="utf-8")
+    reopened = DedupeIndex.open(alerts, _row_dedupe_key)
+
+    assert reopened.rebuilt
+    assert "c2|t2|2026-02-01|q" in reopened
+    assert "c1|t1|2026-01-01|x" not in reopened
+    reopened.close()
+
+
+def test_dedupe_index_retention_drops_old_keys(tmp_path: Path) -> None:
+    alerts = tmp_path / "alerts.csv"
+    alerts.write_text(
+        HEADER + _row("a1", "c1|t1|2025-01-01|old") + _row("a2", "c1|t1|2026-01-01|new"),
+        encoding="utf-8",
+    )
+    index = DedupeIndex.open(alerts, _row_dedupe_key, today=_day("2026-01-10"))
+    index.save()
+    index.close()
+
+    later = DedupeIndex.open(
+        alerts, _row_dedupe_key, retention_days=30, today=_day("2026-01-10")
+    )
+    later.save()
+    later.close()
+    pruned = DedupeIndex.open(
+        alerts, _row_dedupe_key, retention_days=30, today=_day("2026-01-10")
+    )
+
+    assert not pruned.rebuilt
+    assert "c1|t1|2025-01-01|old" not in pruned
+    assert "c1|t1|2026-01-01|new" in pruned
+    pruned.close()
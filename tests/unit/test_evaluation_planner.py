@@ -0,0 +1,30 @@
+from agentic_alert.matching.planner import EvaluationPlanner
+
+
+def test_planner_skips_later_stages_and_reorders_by_selectivity() -> None:
+    calls = {"broad": 0, "selective": 0}
+
+    def broad(item: int) -> list[int]:
+        calls["broad"] += 1
+        return [item]
+
+    def selective(item: int) -> list[int]:
+        calls["selective"] += 1
+        return [item] if item % 10 == 0 else []
+
+    planner: EvaluationPlanner[int] = EvaluationPlanner(
+        [("broad", broad), ("selective", selective)], replan_every=5
+    )
+
+    survivors = [
+        (item, results)
+        for item in range(100)
+        if (results := planner.evaluate(item)) is not None
+    ]
+
+    assert [item for item, _ in survivors] == list(range(0, 100, 10))
+    assert survivors[1][1] == {"selective": [10], "broad": [10]}
+    assert planner.order == ["selective", "broad"]
+    assert calls["selective"] == 100
+    assert calls["broad"] < 20
+    assert "order=selective>broad" in planner.report()
@@ -0,0 +1,79 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agentic_alert.sources import provider_registry
+from agentic_alert.sources.fetch_executor import FetchExecutor, TokenBucket
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    flaky_calls = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        if self.path == "/flaky":
+            with self.lock:
+                type(self).flaky_calls += 1
+                first = type(self).flaky_calls == 1
+            if first:
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.end_headers()
+                return
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = self.path.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture
+def stand_in_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _StandInHandler.flaky_calls = 0
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_executor_keeps_order_and_retries_429(stand_in_url: str) -> None:
+    sleeps: list[float] = []
+    executor = FetchExecutor(
+        max_workers=4, rate_per_host=1000.0, burst=10.0, sleep=sleeps.append
+    )
+    urls = [f"{stand_in_url}/item/{index}" for index in range(8)]
+    urls.insert(3, f"{stand_in_url}/flaky")
+    urls.append(f"{stand_in_url}/missing")
+
+    results = executor.map(provider_registry._fetch_url_bytes, urls)
+
+    assert [result.url for result in results] == urls
+    assert results[0].value == b"/item/0"
+    assert results[3].value == b"/flaky"
+    assert results[3].attempts == 2
+    assert 0.0 in sleeps
+    assert results[-1].error is not None
+    assert results[-1].attempts == 1
+
+
+def test_token_bucket_paces_requests_after_burst() -> None:
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, burst=2.0, clock=lambda: now[0])
+
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+
+    bucket.slow_down()
+    assert bucket.rate == 1.0
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
@@ -0,0 +1,145 @@
+import re
+import urllib.parse
+from datetime import datetime, timedelta, timezone
+
+from agentic_alert.models.schemas import Company, Provider, Trigger
+from agentic_alert.sources import provider_registry as pr
+from agentic_alert.sources.fetch_executor import FetchExecutor
+
+NOW = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+
+def _company(index: int) -> Company:
+    return Company(
+        company_id=f"c{index:03d}",
+        name=f"Impresa{index} Industrie",
+        aliases=[],
+        revenue_eur="",
+        industry_code="",
+        industry_description="",
+        website="",
+        website_domain=f"impresa{index}.it" if index % 5 == 0 else "",
+        country="IT",
+        contact_owner="",
+        status="active",
+    )
+
+
+def _corpus(companies: list[Company]) -> list[dict]:
+    """Two deals a company, 400 for c001 (over the 250 cap) and noise."""
+    articles = []
+    for company in companies:
+        count = 400 if company.company_id == "c001" else 2
+        for number in range(count):
+            seen = NOW - timedelta(hours=number * 0.1)
+            articles.append(
+                {
+                    "url": f"https://news.example.com/{company.company_id}/{number}",
+                    "title": f"{company.name}: acquisizione {number}",
+                    "seendate": seen.strftime("%Y%m%d%H%M%S"),
+                }
+            )
+        if company.website_domain:
+            articles.append(
+                {
+                    "url": f"https://{company.website_domain}/comunicato",
+                    "title": "Comunicato: fusione",
+                    "seendate": NOW.strftime("%Y%m%d%H%M%S"),
+                }
+            )
+    articles.append(
+        {
+            "url": "https://news.example.com/body-only",
+            "title": "Acquisizione nel settore",
+            "body": "Impresa3 Industrie",
+            "seendate": NOW.strftime("%Y%m%d%H%M%S"),
+        }
+    )
+    return articles
+
+
+class _GdeltStandIn:
+    """Answers artlist queries like GDELT: OR'd company terms AND keywords,
+    filtered by start/end datetime, newest first, capped at maxrecords."""
+
+    def __init__(self, articles: list[dict]) -> None:
+        self.articles = articles
+        self.requests = 0
+
+    def __call__(self, url: str) -> dict:
+        self.requests += 1
+        params = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(url).query))
+        company_clause, _, keyword_clause = params["query"].partition(" AND ")
+        names = [term.lower() for term in re.findall(r'"([^"]+)"', company_clause)]
+        sites = re.findall(r"site:(\S+?)\)?(?: |$)", company_clause)
+        keywords = [term.lower() for term in re.findall(r'"([^"]+)"', keyword_clause)]
+        hits = []
+        for article in self.articles:
+            title = f"{article['title']} {article.get('body', '')}".lower()
+            host = urllib.parse.urlparse(article["url"]).hostname or ""
+            if not (any(name in title for name in names) or host in sites):
+                continue
+            if keywords and not any(keyword in title for keyword in keywords):
+                continue
+            if not params["startdatetime"] <= article["seendate"] < params[
+                "enddatetime"
+            ]:
+                continue
+            hits.append({key: value for key, value in article.items() if key != "body"})
+        hits.sort(key=lambda article: article["seendate"], reverse=True)
+        return {"articles": hits[: int(params["maxrecords"])]}
+
+
+def _load(monkeypatch, max_chars: int, companies: list[Company]):
+    standin = _GdeltStandIn(_corpus(companies))
+    monkeypatch.setattr(pr, "_fetch_gdelt_payload", standin)
+    monkeypatch.setattr(
+        pr,
+        "shared_fetch_executor",
+        lambda: FetchExecutor(max_workers=1, sleep=lambda _seconds: None),
+    )
+    monkeypatch.setenv("GDELT_MAX_QUERY_CHARS", str(max_chars))
+    provider = Provider(
+        provider_id="gdelt_doc",
+        name="GDELT Doc",
+        type="gdelt_doc",
+        base_url="",
+        enabled=True,
+    )
+    triggers = [
+        Trigger(
+            trigger_id="t001",
+            name="M&A",
+            keywords=["acquisizione", "fusione"],
+            priority="high",
+            description="",
+        )
+    ]
+    items = pr._load_gdelt_doc(provider, companies, triggers, 3, True)
+    return standin.requests, {(item.url, item.company_hint) for item in items}
+
+
+def test_batched_gdelt_queries_demultiplex_to_companies(monkeypatch) -> None:
+    companies = [_company(index) for index in range(200)]
+
+    per_company_requests, per_company = _load(monkeypatch, 1, companies)
+    batched_requests, batched = _load(monkeypatch, 1800, companies)
+
+    assert batched == per_company
+    assert len(batched) == 2 * 199 + 400 + 40 + 1
+    # Matched by GDELT on the body only: forwarded without a hint.
+    assert ("https://news.example.com/body-only", "") in batched
+    assert ("https://impresa5.it/comunicato", "c005") in batched
+    assert ("https://news.example.com/c001/399", "c001") in batched
+    assert per_company_requests >= 200
+    assert batched_requests * 10 <= per_company_requests
+
+
+def test_pack_gdelt_queries_respects_length_limit() -> None:
+    companies = [_company(index) for index in range(50)]
+    batches = pr._pack_gdelt_queries(companies, ["acquisizione"], 300)
+
+    assert [company for batch, _ in batches for company in batch] == companies
+    assert all(len(query) <= 300 for _, query in batches)
+    assert batches[0][1].startswith('("Impresa0 Industrie" OR site:impresa0.it OR ')
+    assert batches[0][1].endswith(') AND ("acquisizione")')
@@ -0,0 +1,197 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import feedparser
+
+from agentic_alert import pipeline
+from agentic_alert.config import AppConfig
+from agentic_alert.models.schemas import Company, NewsItem, Provider
+from agentic_alert.sources import gn_scheduler
+from agentic_alert.sources import provider_registry as pr
+from agentic_alert.sources.gn_scheduler import GnScheduler
+
+START = date(2026, 10, 1)
+WINDOW_DAYS = 4
+HOT = {"c000", "c013", "c026", "c039"}
+
+
+def _company(index: int) -> Company:
+    return Company(
+        company_id=f"c{index:03d}",
+        name=f"Company {index}",
+        aliases=[],
+        revenue_eur=str(1000 - index),
+        industry_code="",
+        industry_description="",
+        website="",
+        website_domain="",
+        country="IT",
+        contact_owner="",
+        status="active",
+    )
+
+
+def _poll(company: Company, day: int, last_polled: dict[str, int]) -> list[NewsItem]:
+    """Hot companies publish one alert-worthy article a day; the feed only
+    returns the last WINDOW_DAYS days."""
+    since = last_polled.get(company.company_id, -1_000)
+    last_polled[company.company_id] = day
+    if company.company_id not in HOT:
+        return []
+    first = max(since + 1, day - WINDOW_DAYS + 1)
+    return [
+        NewsItem(
+            article_id=f"{company.company_id}-{news_day}",
+            provider_id="gn",
+            source_name="GN",
+            title="Acquisizione",
+            url="",
+            published_at=(START + timedelta(days=news_day)).isoformat(),
+            content_snippet="",
+        )
+        for news_day in range(first, day + 1)
+    ]
+
+
+def test_adaptive_schedule_yields_more_alerts_per_request(tmp_path: Path) -> None:
+    universe = [_company(index) for index in range(40)]
+    batch_size = 5
+    days = 60
+
+    rotation_alerts = 0
+    rotation_polled: dict[str, int] = {}
+    pointer = 0
+    for day in range(days):
+        selected, pointer = pr._select_gn_batch(universe, batch_size, pointer)
+        for company in selected:
+            rotation_alerts += len(_poll(company, day, rotation_polled))
+
+    state_path = tmp_path / "gn_scheduler_state.json"
+    adaptive_alerts = 0
+    adaptive_polled: dict[str, int] = {}
+    max_gap = 0
+    for day in range(days):
+        scheduler = GnScheduler.load(
+            state_path,
+            max_staleness_days=10,
+            window_days=WINDOW_DAYS,
+            today=START + timedelta(days=day),
+        )
+        selected = scheduler.select(universe, batch_size)
+        assert len(selected) == batch_size
+        for company in selected:
+            previous = adaptive_polled.get(company.company_id)
+            if previous is not None:
+                max_gap = max(max_gap, day - previous)
+            items = _poll(company, day, adaptive_polled)
+            scheduler.record_poll(company.company_id, items)
+            scheduler.record_alerts(company.company_id, len(items))
+            adaptive_alerts += len(items)
+        scheduler.save()
+
+    requests = days * batch_size
+    assert adaptive_alerts / requests > 1.3 * rotation_alerts / requests
+    assert set(adaptive_polled) == {company.company_id for company in universe}
+    assert max_gap <= 10
+    state = GnScheduler.load(state_path).state("c013")
+    assert state is not None and state.alerts > 0
+    assert state.last_published_at.startswith("2026-11")
+
+
+def test_gn_company_provider_uses_adaptive_scheduler(
+    tmp_path: Path, monkeypatch
+) -> None:
+    state_path = tmp_path / "gn_scheduler_state.json"
+    rotation_path = tmp_path / "gn_rotation_state.json"
+    monkeypatch.setenv("GN_SCHEDULER", "adaptive")
+    monkeypatch.setenv("GN_SCHEDULER_STATE_PATH", str(state_path))
+    monkeypatch.setenv("GN_ROTATION_STATE_PATH", str(rotation_path))
+    monkeypatch.setenv("GN_COMPANY_UNIVERSE_SIZE", "6")
+    monkeypatch.setenv("GN_COMPANY_DAILY_BATCH", "2")
+    monkeypatch.setenv("GN_MAX_STALENESS_DAYS", "3")
+    gn_scheduler.reset_shared_gn_scheduler()
+    feed = feedparser.FeedParserDict(
+        {
+            "entries": [
+                feedparser.FeedParserDict(
+                    {"title": "Notizia", "link": "https://example.com/a"}
+                )
+            ]
+        }
+    )
+    monkeypatch.setattr(pr, "_parse_rss_from_url", lambda url: feed)
+    provider = Provider(
+        provider_id="gn_company",
+        name="GN_Company",
+        type="gn_company",
+        base_url="https://news.google.com/rss/search",
+        enabled=True,
+    )
+
+    items = pr._load_gn_company(provider, [_company(index) for index in range(6)])
+
+    assert {item.company_hint for item in items} == {"c000", "c001"}
+    assert gn_scheduler.save_gn_scheduler() is not None
+    saved = GnScheduler.load(state_path)
+    assert sorted(saved._companies) == ["c000", "c001"]
+    assert saved.state("c000").items == 1
+    assert not rotation_path.exists()
+    gn_scheduler.reset_shared_gn_scheduler()
+
+
+def test_pipeline_credits_only_hinted_company_alerts(
+    tmp_path: Path, monkeypatch
+) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,revenue_eur,website_domain,country,status\n"
+        "c000,Alpha Energia,,200,,IT,active\n"
+        "c001,Beta Foods,,100,,IT,active\n",
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisisce,high,Deal trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\n"
+        "gn_company_it,GN Company,gn_company,https://news.google.com/rss/search,true\n",
+        encoding="utf-8",
+    )
+    state_path = tmp_path / "gn_scheduler_state.json"
+    monkeypatch.setenv("GN_SCHEDULER", "adaptive")
+    monkeypatch.setenv("GN_SCHEDULER_STATE_PATH", str(state_path))
+    monkeypatch.setenv("GN_ROTATION_STATE_PATH", str(tmp_path / "rotation.json"))
+    monkeypatch.setenv("GN_COMPANY_UNIVERSE_SIZE", "2")
+    monkeypatch.setenv("GN_COMPANY_DAILY_BATCH", "1")
+    feed = feedparser.FeedParserDict(
+        {
+            "entries": [
+                feedparser.FeedParserDict(
+                    {
+                        "title": "Alpha Energia acquisisce Beta Foods",
+                        "link": "https://example.com/deal",
+                    }
+                )
+            ]
+        }
+    )
+    monkeypatch.setattr(pr, "_parse_rss_from_url", lambda url: feed)
+    config = AppConfig(
+        companies_csv=data_dir / "companies.csv",
+        triggers_csv=data_dir / "triggers.csv",
+        providers_csv=data_dir / "providers.csv",
+        articles_csv=data_dir / "articles.csv",
+        alert_candidates_csv=tmp_path / "alert_candidates.csv",
+        alerts_csv=tmp_path / "alerts.csv",
+        company_index_cache_enabled=False,
+    )
+
+    pipeline._run_pipeline(config)
+
+    saved = GnScheduler.load(state_path)
+    assert saved.state("c000").alerts == 1
+    assert saved.state("c001") is None
+    gn_scheduler.reset_shared_gn_scheduler()
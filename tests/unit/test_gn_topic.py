@@ -0,0 +1,79 @@
+import urllib.parse
+from pathlib import Path
+
+import feedparser
+
+from agentic_alert.models.schemas import Provider, Trigger
+from agentic_alert.sources import provider_registry as pr
+
+
+def _trigger(trigger_id: str, keywords: list[str]) -> Trigger:
+    return Trigger(
+        trigger_id=trigger_id,
+        name=trigger_id,
+        keywords=keywords,
+        priority="high",
+        description="",
+    )
+
+
+def test_gn_topic_queries_group_trigger_keywords(monkeypatch) -> None:
+    monkeypatch.setenv("GN_TOPIC_MAX_TERMS", "2")
+    monkeypatch.setenv("GN_TOPIC_WHEN", "")
+    queries = pr._build_gn_topic_queries(
+        [
+            _trigger("t001", ["acquisizione", "fusione", "joint venture"]),
+            _trigger("t002", ["Fusione", "nuovo CEO"]),
+        ]
+    )
+
+    assert queries == [
+        ("t001", '("acquisizione" OR "fusione") -banca -banche -bank -banks'),
+        ("t001", '("joint venture") -banca -banche -bank -banks'),
+        ("t002", '("nuovo CEO") -banca -banche -bank -banks'),
+    ]
+
+
+def test_gn_topic_provider_dedupes_items_without_company_hint(monkeypatch) -> None:
+    monkeypatch.delenv("GN_TOPIC_MAX_TERMS", raising=False)
+    monkeypatch.delenv("GN_RECENCY_HOURS", raising=False)
+    requested: list[str] = []
+
+    def fake_parse(url: str) -> feedparser.FeedParserDict:
+        requested.append(url)
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)["q"][0]
+        links = ["https://example.com/shared"]
+        if "acquisizione" in query:
+            links.append("https://example.com/deal")
+        return feedparser.FeedParserDict(
+            {
+                "entries": [
+                    feedparser.FeedParserDict({"title": "Notizia", "link": link})
+                    for link in links
+                ]
+            }
+        )
+
+    monkeypatch.setattr(pr, "_parse_rss_from_url", fake_parse)
+    provider = Provider(
+        provider_id="gn_topic_it",
+        name="Google News Trigger Topics (IT)",
+        type="gn_topic",
+        base_url="https://news.google.com/rss/search",
+        enabled=True,
+    )
+
+    items = pr.fetch_news(
+        provider,
+        Path("unused.csv"),
+        triggers=[_trigger("t001", ["acquisizione"]), _trigger("t002", ["nomina"])],
+    )
+
+    assert len(requested) == 2
+    assert all("when%3A1d" in url and "ceid=IT" in url for url in requested)
+    assert sorted(item.url for item in items) == [
+        "https://example.com/deal",
+        "https://example.com/shared",
+    ]
+    assert all(item.company_hint == "" for item in items)
+    assert {item.source_name for item in items} == {"GN Topic | t001"}
@@ -0,0 +1,91 @@
+import base64
+from pathlib import Path
+
+import feedparser
+
+from agentic_alert.models.schemas import Provider
+from agentic_alert.sources import gn_urls, provider_registry
+from agentic_alert.sources.gn_urls import (
+    GnUrlCache,
+    canonical_url,
+    decode_gn_article_url,
+)
+
+PUBLISHER_URL = "https://www.ansa.it/economia/alpha-energia-acquisisce-beta.html"
+
+
+def _gn_link(payload: bytes) -> str:
+    token = base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+    return f"https://news.google.com/rss/articles/{token}?oc=5"
+
+
+def _legacy_payload(url: str) -> bytes:
+    encoded = url.encode("utf-8")
+    return b"\x08\x13\x22" + bytes([len(encoded)]) + encoded + b"\xd2\x01\x00"
+
+
+def test_decode_legacy_gn_links_offline() -> None:
+    link = _gn_link(_legacy_payload(PUBLISHER_URL))
+
+    assert link.split("/")[-1].startswith("CBMi")
+    assert decode_gn_article_url(link) == PUBLISHER_URL
+    opaque = _gn_link(b"\x08\x13\x22\x0bAU_yqLabcde\xd2\x01\x00")
+    assert decode_gn_article_url(opaque) is None
+    assert decode_gn_article_url("https://news.google.com/rss/articles/!!") is None
+    assert decode_gn_article_url(PUBLISHER_URL) is None
+    assert canonical_url(
+        "HTTP://WWW.Ansa.it/economia/alpha.html/?utm_source=gn&id=7#top"
+    ) == "https://ansa.it/economia/alpha.html?id=7"
+
+
+def test_gn_company_items_use_publisher_url(tmp_path: Path, monkeypatch) -> None:
+    cache_path = tmp_path / "gn_urls.json"
+    monkeypatch.setenv("GN_URL_CACHE_PATH", str(cache_path))
+    gn_urls.reset_shared_gn_url_cache()
+    link = _gn_link(_legacy_payload(PUBLISHER_URL))
+    entries = [
+        feedparser.FeedParserDict(
+            {"id": "CBMi-guid", "link": link, "title": "Alpha Energia acquisisce"}
+        )
+    ]
+    provider = Provider("gn_company_it", "GN Company", "gn_company", "", True)
+    try:
+        [item] = provider_registry._entries_to_items_for_company(
+            provider, "c001", entries, company_hint="c001"
+        )
+        report = gn_urls.save_gn_url_cache()
+    finally:
+        gn_urls.reset_shared_gn_url_cache()
+
+    assert item.url == PUBLISHER_URL
+    assert item.article_id == canonical_url(PUBLISHER_URL)
+    assert report == "decoded=1 cached=0 undecodable=0 evicted=0 entries=1"
+    reloaded = GnUrlCache(cache_path)
+    assert reloaded.resolve(link) == PUBLISHER_URL
+    assert reloaded.stats.cached == 1
+
+
+def test_gn_url_cache_skips_negatives_and_evicts(tmp_path: Path) -> None:
+    cache_path = tmp_path / "gn_urls.json"
+    links = [
+        _gn_link(_legacy_payload(f"https://www.ansa.it/economia/{index}.html"))
+        for index in range(3)
+    ]
+    undecodable = _gn_link(b"\x08\x13\x22\x05AU_yq")
+    cache = GnUrlCache(cache_path, ttl_days=10, max_entries=2, now=1_000_000.0)
+    for link in links + [undecodable, undecodable]:
+        cache.resolve(link)
+    assert cache.stats.undecodable == 1 and cache.stats.cached == 1
+    cache.save()
+
+    reloaded = GnUrlCache(cache_path, ttl_days=10, now=1_000_000.0 + 86400)
+    assert len(reloaded) == 2
+    assert reloaded.resolve(undecodable) is None
+    assert reloaded.stats.undecodable == 1
+    assert reloaded.resolve(links[2]) == "https://www.ansa.it/economia/2.html"
+    reloaded.save()
+
+    later = GnUrlCache(cache_path, ttl_days=10, now=1_000_000.0 + 10.5 * 86400)
+    later.save()
+    assert len(GnUrlCache(cache_path)) == 1
+    assert later.stats.evicted == 1
@@ -0,0 +1,125 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import feedparser
+import pytest
+
+from agentic_alert.models.schemas import Provider
+from agentic_alert.sources import http_cache
+from agentic_alert.sources.provider_registry import fetch_news
+
+_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Stand-in</title>
+<item><title>Alpha Energia acquisisce Beta</title>
+<link>https://example.com/a</link><guid>a-1</guid>
+<pubDate>Sun, 01 Feb 2026 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        if self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        if self.path == "/etag":
+            self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(_FEED)))
+        self.end_headers()
+        self.wfile.write(_FEED)
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture
+def feed_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _provider(url: str) -> Provider:
+    return Provider(
+        provider_id="p_cache",
+        name="Stand-in RSS",
+        type="rss",
+        base_url=url,
+        enabled=True,
+    )
+
+
+def test_rss_cache_skips_parse_on_304_and_unchanged_body(
+    feed_url: str, tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path / "http"))
+    http_cache.reset_shared_http_cache()
+    parses = []
+    real_parse = feedparser.parse
+
+    def _counting_parse(data, *args, **kwargs):
+        parses.append(data)
+        return real_parse(data, *args, **kwargs)
+
+    monkeypatch.setattr(feedparser, "parse", _counting_parse)
+
+    try:
+        first = fetch_news(_provider(f"{feed_url}/etag"), Path("data/articles.csv"))
+        second = fetch_news(_provider(f"{feed_url}/etag"), Path("data/articles.csv"))
+        fetch_news(_provider(f"{feed_url}/plain"), Path("data/articles.csv"))
+        fourth = fetch_news(_provider(f"{feed_url}/plain"), Path("data/articles.csv"))
+        stats = http_cache.shared_http_cache().stats
+    finally:
+        http_cache.reset_shared_http_cache()
+
+    assert len(parses) == 2
+    assert [item.article_id for item in first] == ["a-1"]
+    assert second == first
+    assert [item.title for item in fourth] == ["Alpha Energia acquisisce Beta"]
+    assert stats.hits == 1
+    assert stats.unchanged == 1
+    assert stats.misses == 2
+    assert stats.bytes_saved == len(_FEED)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda row: row.update(renamed_field="x"),
+        lambda row: row.pop("title"),
+    ],
+    ids=["unknown-field", "missing-field"],
+)
+def test_rss_cache_refetches_entries_with_stale_item_fields(
+    feed_url: str, tmp_path: Path, monkeypatch, mutate
+) -> None:
+    cache_dir = tmp_path / "http"
+    monkeypatch.setenv("HTTP_CACHE_DIR", str(cache_dir))
+    http_cache.reset_shared_http_cache()
+    provider = _provider(f"{feed_url}/etag")
+    try:
+        fetch_news(provider, Path("data/articles.csv"))
+        (entry_path,) = cache_dir.glob("*.json")
+        payload = json.loads(entry_path.read_text(encoding="utf-8"))
+        mutate(payload["entry"]["items"][0])
+        entry_path.write_text(json.dumps(payload), encoding="utf-8")
+
+        refetched = fetch_news(provider, Path("data/articles.csv"))
+        again = fetch_news(provider, Path("data/articles.csv"))
+        stats = http_cache.shared_http_cache().stats
+    finally:
+        http_cache.reset_shared_http_cache()
+
+    assert [item.title for item in refetched] == ["Alpha Energia acquisisce Beta"]
+    assert again == refetched
+    assert stats.misses == 2
+    assert stats.hits == 1
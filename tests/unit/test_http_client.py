@@ -0,0 +1,102 @@
+import gzip
+import shutil
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from agentic_alert.sources.http_client import HttpClient
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        body = f"<rss>{self.path}</rss>".encode("utf-8")
+        encoding = self.headers.get("Accept-Encoding", "")
+        self.send_response(200)
+        if "gzip" in encoding:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture
+def keep_alive_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_reuses_connection_and_decodes_gzip(keep_alive_url: str) -> None:
+    client = HttpClient(pool_maxsize=2)
+    try:
+        responses = [
+            client.get(f"{keep_alive_url}/feed/{index}") for index in range(3)
+        ]
+        stats = client.pool_stats()
+    finally:
+        client.close()
+
+    assert [response.content for response in responses] == [
+        b"<rss>/feed/0</rss>",
+        b"<rss>/feed/1</rss>",
+        b"<rss>/feed/2</rss>",
+    ]
+    assert responses[0].headers["Content-Encoding"] == "gzip"
+    assert len(stats) == 1
+    assert stats[0].host == "127.0.0.1"
+    assert stats[0].requests == 3
+    assert stats[0].connections == 1
+    assert stats[0].reused == 2
+
+
+@pytest.fixture
+def self_signed_url(tmp_path):
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl CLI not available")
+    cert_path = tmp_path / "cert.pem"
+    key_path = tmp_path / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", str(key_path), "-out", str(cert_path),
+            "-days", "1", "-subj", "/CN=127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_rejects_untrusted_certificate(self_signed_url: str) -> None:
+    client = HttpClient()
+    try:
+        with pytest.raises(requests.exceptions.SSLError):
+            client.get(f"{self_signed_url}/feed", timeout=5)
+        # The shared context is the one doing the verification.
+        assert client.ssl_context.verify_mode == ssl.CERT_REQUIRED
+        assert client._adapter.poolmanager.connection_pool_kw["ssl_context"] is (
+            client.ssl_context
+        )
+    finally:
+        client.close()
@@ -0,0 +1,104 @@
+import csv
+from pathlib import Path
+
+from agentic_alert.config import AppConfig
+from agentic_alert.matching.near_duplicates import NearDuplicateIndex
+from agentic_alert.models.schemas import NewsItem
+from agentic_alert.pipeline import _run_pipeline
+
+
+def _item(article_id: str, source: str, title: str, snippet: str = "") -> NewsItem:
+    return NewsItem(article_id, "p", source, title, "", "", snippet)
+
+
+def test_near_duplicate_index_clusters_copies_across_runs(tmp_path: Path) -> None:
+    path = tmp_path / "near.json"
+    index = NearDuplicateIndex.load(path, now=1_000_000.0)
+    title = "Alpha Energia acquisisce Beta Foods per 100 milioni"
+
+    assert index.assign(_item("a1", "ANSA", title, "Accordo firmato a Milano"))
+    assert index.assign(_item("a2", "GN", f"{title} - Il Sole 24 Ore")) == (
+        "a1",
+        False,
+    )
+    assert index.assign(_item("a3", "Adnkronos", f"{title} di euro")) == ("a1", False)
+    assert index.assign(_item("a4", "ANSA", "Gamma Tech annuncia il piano 2026"))[1]
+    assert index.assign(_item("a5", "ANSA", "Breve notizia"))[1]
+    assert index.sources("a1") == ["ANSA", "GN", "Adnkronos"]
+    index.save()
+
+    later = NearDuplicateIndex.load(path, now=1_000_000.0 + 86400)
+    assert later.assign(_item("a6", "GDELT", title)) == ("a1", False)
+    assert later.stats.skipped_previous == 1
+    assert later.sources("a1") == []
+    expired = NearDuplicateIndex.load(path, ttl_days=3, now=1_000_000.0 + 4 * 86400)
+    assert len(expired) == 0 and expired.stats.evicted == 2
+
+
+def test_near_duplicate_scopes_keep_company_scoped_copies_apart(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "near.json"
+    index = NearDuplicateIndex.load(path, now=1_000_000.0)
+    title = "Alpha Energia acquisisce Beta Foods per 100 milioni"
+
+    assert index.assign(_item("a1", "GN", title), scope="c001") == ("a1|c001", True)
+    assert index.assign(_item("a1", "GN", title), scope="c002") == ("a1|c002", True)
+    assert index.assign(_item("a2", "ANSA", title)) == ("a2", True)
+    assert index.assign(_item("a3", "GN", f"{title} - Il Sole 24 Ore"), "c002") == (
+        "a1|c002",
+        False,
+    )
+    index.save()
+
+    later = NearDuplicateIndex.load(path, now=1_000_000.0 + 86400)
+    assert later.assign(_item("a4", "GN", title), scope="c001") == ("a1|c001", False)
+    assert later.assign(_item("a5", "GN", title), scope="c003")[1]
+
+
+def test_pipeline_matches_one_representative_per_cluster(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,website_domain,country,status\n"
+        "c001,Alpha Energia,,alphaenergia.it,IT,active\n",
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisisce,high,Deal trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\n"
+        "p001,ANSA,dummy,,true\np002,Adnkronos,dummy,,true\n",
+        encoding="utf-8",
+    )
+    (data_dir / "articles.csv").write_text(
+        "article_id,provider_id,source_name,title,url,published_at,content_snippet\n"
+        "a001,p001,ANSA,Alpha Energia acquisisce Beta Foods per 100 milioni,"
+        "https://ansa.it/a,2026-02-01T08:00:00+00:00,\n"
+        "a002,p002,Adnkronos,Alpha Energia acquisisce Beta Foods per 100 milioni"
+        " di euro,https://adnkronos.com/a,2026-02-01T09:00:00+00:00,\n",
+        encoding="utf-8",
+    )
+    config = AppConfig(
+        companies_csv=data_dir / "companies.csv",
+        triggers_csv=data_dir / "triggers.csv",
+        providers_csv=data_dir / "providers.csv",
+        articles_csv=data_dir / "articles.csv",
+        alert_candidates_csv=data_dir / "alert_candidates.csv",
+        alerts_csv=data_dir / "alerts.csv",
+        company_index_cache_enabled=False,
+        near_duplicates_enabled=True,
+        near_duplicates_path=tmp_path / "near.json",
+    )
+
+    _run_pipeline(config)
+
+    with config.alerts_csv.open(newline="", encoding="utf-8") as handle:
+        alerts = list(csv.DictReader(handle))
+    assert len(alerts) == 1
+    assert alerts[0]["source"] == "ANSA; Adnkronos"
+    assert alerts[0]["article_url"] == "https://ansa.it/a"
+    assert (tmp_path / "near.json").exists()
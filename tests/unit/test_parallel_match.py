@@ -0,0 +1,160 @@
+from pathlib import Path
+
+import pytest
+
+from agentic_alert import pipeline
+from agentic_alert.config import AppConfig
+from agentic_alert.matching.companies import CompanyMatcher, article_text
+from agentic_alert.matching.parallel import ParallelMatcher, fork_available
+from agentic_alert.matching.planner import EvaluationPlanner
+from agentic_alert.models.schemas import Company, NewsItem, Trigger
+from agentic_alert.storage.csv_store import read_csv
+from agentic_alert.triggers.matcher import TriggerMatcher
+
+pytestmark = pytest.mark.skipif(not fork_available(), reason="needs fork")
+
+
+def _company(company_id: str, name: str, aliases: list[str], domain: str) -> Company:
+    return Company(
+        company_id=company_id,
+        name=name,
+        aliases=aliases,
+        revenue_eur="",
+        industry_code="",
+        industry_description="",
+        website="",
+        website_domain=domain,
+        country="IT",
+        contact_owner="",
+        status="active",
+    )
+
+
+COMPANIES = [
+    _company("c001", "Alpha Energia", [], "alphaenergia.it"),
+    _company("c002", "Beta Logistica", ["Beta Log"], "betalog.it"),
+    _company("c003", "Gamma Foods", [], ""),
+]
+TRIGGERS = [
+    Trigger("t001", "Acquisizione", ["acquisizione"], "high", ""),
+    Trigger("t002", "Nomina", ["nomina", "nuovo ceo"], "medium", ""),
+]
+TITLES = [
+    "Acquisizione di Alpha Energia",
+    "Beta Log annuncia la nomina del nuovo CEO",
+    "Gamma Foods cresce",
+    "Acquisizione: Gamma Foods e Beta Logistica",
+    "Meteo di oggi",
+]
+
+
+def _items(count: int) -> list[NewsItem]:
+    return [
+        NewsItem(
+            article_id=f"a{index}",
+            provider_id="p001",
+            source_name="Test",
+            title=f"{TITLES[index % len(TITLES)]} {index}",
+            url=f"https://example.com/{index}",
+            published_at="2026-02-01T00:00:00+00:00",
+            content_snippet="",
+        )
+        for index in range(count)
+    ]
+
+
+def _planner() -> EvaluationPlanner[NewsItem]:
+    trigger_matcher = TriggerMatcher(TRIGGERS)
+    company_matcher = CompanyMatcher(COMPANIES)
+    return EvaluationPlanner(
+        [
+            (
+                "triggers",
+                lambda item: trigger_matcher.match(article_text(item)).triggers,
+            ),
+            ("companies", company_matcher.match),
+        ]
+    )
+
+
+def _run(workers: int, items: list[NewsItem]) -> tuple[list, EvaluationPlanner]:
+    planner = _planner()
+    with ParallelMatcher(
+        planner, TRIGGERS, COMPANIES, workers=workers, batch_size=7
+    ) as matcher:
+        results = list(
+            matcher.evaluate_stream((item, item.article_id) for item in items)
+        )
+    return results, planner
+
+
+def test_worker_pool_matches_like_a_single_process() -> None:
+    items = _items(100)
+
+    serial, _ = _run(1, items)
+    parallel, parallel_planner = _run(3, items)
+
+    assert [tag for _, tag, _ in parallel] == [item.article_id for item in items]
+    assert parallel == serial
+    assert sum(results is not None for _, _, results in parallel) == 60
+    matched = parallel[3][2]
+    assert matched is not None
+    assert [trigger.trigger_id for trigger in matched["triggers"]] == ["t001"]
+    assert [match.company for match in matched["companies"]] == [
+        COMPANIES[1],
+        COMPANIES[2],
+    ]
+    assert matched["companies"][0].company is COMPANIES[1]
+    # Worker stage counters are merged back into the parent planner.
+    evaluated = {stats.name: stats.evaluated for stats in parallel_planner.stats}
+    assert evaluated == {"triggers": 100, "companies": 60}
+
+
+def test_pipeline_output_does_not_depend_on_worker_count(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,website_domain,country,status\n"
+        "c001,Alpha Energia,,alphaenergia.it,IT,active\n"
+        "c002,Beta Logistica,Beta Log,betalog.it,IT,active\n",
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisizione,high,Deal trigger\n"
+        "t002,Nomina,nomina;nuovo ceo,medium,People trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\np001,Test,dummy,,true\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(pipeline, "fetch_news", lambda *_args, **_kw: _items(60))
+
+    outputs = []
+    for workers in (1, 2):
+        run_dir = tmp_path / f"run{workers}"
+        config = AppConfig(
+            companies_csv=data_dir / "companies.csv",
+            triggers_csv=data_dir / "triggers.csv",
+            providers_csv=data_dir / "providers.csv",
+            articles_csv=data_dir / "articles.csv",
+            alert_candidates_csv=run_dir / "alert_candidates.csv",
+            alerts_csv=run_dir / "alerts.csv",
+            company_index_cache_enabled=False,
+            match_workers=workers,
+            match_batch_size=4,
+        )
+        pipeline._run_pipeline(config)
+        outputs.append(
+            [
+                (row["alert_id"], row["company_id"], row["trigger_id"])
+                for row in read_csv(config.alerts_csv)
+            ]
+        )
+
+    assert outputs[0]
+    assert outputs[0] == outputs[1]
+    assert "Parallel match: workers=2 batches=15 items=60" in capsys.readouterr().out
@@ -1,13 +1,15 @@
 import ssl
-import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
 import certifi
 import feedparser
+import requests
 
+from agentic_alert.matching.company_index import companies_from_rows
 from agentic_alert.models.schemas import Provider
-from agentic_alert.sources import provider_registry
+from agentic_alert.sources import http_client, provider_registry
 from agentic_alert.sources.provider_registry import fetch_news
 
 
@@ -73,7 +75,9 @@ def test_fetch_news_rss_file_parses_snapshot() -> None:
     assert item.content_snippet
 
 
-def test_fetch_news_https_uses_certifi_bundle(monkeypatch) -> None:
+def test_fetch_news_https_uses_pooled_client_with_certifi_context(
+    monkeypatch, tmp_path
+) -> None:
     provider = Provider(
         provider_id="p997",
         name="Test HTTPS RSS",
@@ -82,46 +86,34 @@ def test_fetch_news_https_uses_certifi_bundle(monkeypatch) -> None:
         enabled=True,
     )
 
-    captured = {}
+    captured = {"cafiles": [], "urls": []}
 
     def _fake_where():
         return "/tmp/certifi.pem"
 
     def _fake_create_default_context(*, cafile=None):
-        captured["cafile"] = cafile
+        captured["cafiles"].append(cafile)
 
         class DummyCtx:
             pass
 
         return DummyCtx()
 
-    class DummyResp:
-        status = 200
-        headers = {"content-type": "application/rss+xml"}
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def read(self):
-            return b"<rss></rss>"
-
-        def geturl(self):
-            return "https://example.com/rss"
-
-    def _fake_urlopen(request, context=None, timeout=None):
-        captured["context"] = context
-        captured["url"] = request.full_url
-        captured["user_agent"] = request.get_header("User-agent") or request.get_header(
-            "User-Agent"
-        )
-        return DummyResp()
+    def _fake_send(self, request, **_kwargs):
+        captured["urls"].append(request.url)
+        captured["user_agent"] = request.headers.get("User-Agent")
+        captured["accept_encoding"] = request.headers.get("Accept-Encoding")
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response._content = b"<rss></rss>"
+        return response
 
     monkeypatch.setattr(certifi, "where", _fake_where)
     monkeypatch.setattr(ssl, "create_default_context", _fake_create_default_context)
-    monkeypatch.setattr(urllib.request, "urlopen", _fake_urlopen)
+    monkeypatch.setattr(http_client._PooledAdapter, "send", _fake_send)
+    monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path / "http"))
+    http_client.reset_shared_http_client()
 
     def _fake_parse(data):
         captured["parse_arg"] = data
@@ -129,12 +121,18 @@ def test_fetch_news_https_uses_certifi_bundle(monkeypatch) -> None:
 
     monkeypatch.setattr(feedparser, "parse", _fake_parse)
 
-    fetch_news(provider, Path("data/articles.csv"))
+    try:
+        fetch_news(provider, Path("data/articles.csv"))
+        fetch_news(provider, Path("data/articles.csv"))
+        client = http_client.shared_http_client()
+    finally:
+        http_client.reset_shared_http_client()
 
-    assert captured["cafile"] == "/tmp/certifi.pem"
-    assert captured["url"] == "https://example.com/rss"
-    assert captured["context"].__class__.__name__ == "DummyCtx"
+    assert captured["cafiles"] == ["/tmp/certifi.pem"]
+    assert client.ssl_context.__class__.__name__ == "DummyCtx"
+    assert captured["urls"] == ["https://example.com/rss"] * 2
     assert captured["user_agent"] == "Mozilla/5.0 (AgenticAlert/0.1)"
+    assert captured["accept_encoding"] == "gzip, deflate"
     assert captured["parse_arg"] == b"<rss></rss>"
 
 
@@ -158,7 +156,11 @@ def test_fetch_news_gn_company_builds_query(monkeypatch, tmp_path) -> None:
         }
     ]
 
-    monkeypatch.setattr(provider_registry, "read_csv", lambda _path: rows)
+    monkeypatch.setattr(
+        provider_registry,
+        "load_companies_csv",
+        lambda _path: companies_from_rows(rows),
+    )
 
     captured = {"urls": []}
 
@@ -215,7 +217,11 @@ def test_fetch_news_rss_diagnostics_uses_requests(
         captured["verify"] = verify
         return DummyResp()
 
-    monkeypatch.setattr(provider_registry.requests, "get", _fake_get)
+    monkeypatch.setattr(
+        provider_registry,
+        "shared_http_client",
+        lambda: SimpleNamespace(get=_fake_get),
+    )
 
     def _fake_parse(data):
         captured["parse_arg"] = data
@@ -302,7 +308,11 @@ def test_gn_diagnostics_uses_certifi_verify(monkeypatch) -> None:
         captured["verify"] = verify
         return DummyResp()
 
-    monkeypatch.setattr(provider_registry.requests, "get", _fake_get)
+    monkeypatch.setattr(
+        provider_registry,
+        "shared_http_client",
+        lambda: SimpleNamespace(get=_fake_get),
+    )
 
     monkeypatch.setattr(
         feedparser,
@@ -313,3 +323,23 @@ def test_gn_diagnostics_uses_certifi_verify(monkeypatch) -> None:
     fetch_news(provider, Path("data/articles.csv"))
 
     assert captured["verify"] == "/tmp/ca.pem"
+
+
+def test_gn_company_entries_carry_company_hint() -> None:
+    provider = Provider(
+        provider_id="gn_company_it",
+        name="Google News Company-Scoped (IT)",
+        type="gn_company",
+        base_url="https://news.google.com/rss/search",
+        enabled=True,
+    )
+    entry = feedparser.FeedParserDict(
+        {"title": "Alpha Energia cresce", "link": "https://example.com/a"}
+    )
+
+    items = provider_registry._entries_to_items_for_company(
+        provider, "c001", [entry], company_hint="c001"
+    )
+
+    assert items[0].source_name == "GN Company | c001"
+    assert items[0].company_hint == "c001"
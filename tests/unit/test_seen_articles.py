@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+import feedparser
+
+from agentic_alert.models.schemas import Provider
+from agentic_alert.sources import provider_registry
+from agentic_alert.storage.seen_articles import SeenArticleStore
+
+DAY = 86400.0
+NOW = datetime(2026, 2, 10, tzinfo=timezone.utc).timestamp()
+
+
+def _entry(guid: str, day: int) -> feedparser.FeedParserDict:
+    published = datetime(2026, 2, day, 9, 0, tzinfo=timezone.utc)
+    return feedparser.FeedParserDict(
+        {
+            "guid": guid,
+            "title": f"Title {guid}",
+            "link": f"https://example.com/{guid}",
+            "published_parsed": published.utctimetuple(),
+        }
+    )
+
+
+def test_entries_to_items_drops_articles_seen_in_previous_runs(tmp_path: Path) -> None:
+    provider = Provider(
+        provider_id="p_seen",
+        name="Seen RSS",
+        type="rss",
+        base_url="https://example.com/rss",
+        enabled=True,
+    )
+    path = tmp_path / "seen.json"
+
+    first_run = SeenArticleStore.load(path, ttl_days=3, now=NOW)
+    items = provider_registry._entries_to_items(
+        provider, [_entry("a", 9), _entry("b", 9)], first_run
+    )
+    assert [item.article_id for item in items] == ["a", "b"]
+    first_run.save()
+
+    second_run = SeenArticleStore.load(path, ttl_days=3, now=NOW + DAY)
+    items = provider_registry._entries_to_items(
+        provider, [_entry("a", 9), _entry("c", 10), _entry("old", 1)], second_run
+    )
+    assert [item.article_id for item in items] == ["c"]
+    assert second_run.stats.skipped_seen == 1
+    assert second_run.stats.skipped_watermark == 1
+    second_run.save()
+
+    later_run = SeenArticleStore.load(path, ttl_days=3, now=NOW + 3.5 * DAY)
+    assert later_run.stats.evicted == 2
+    assert len(later_run) == 1
+
+
+def test_company_scoped_entries_use_separate_scopes(tmp_path: Path) -> None:
+    provider = Provider(
+        provider_id="gn_company_it",
+        name="GN Company",
+        type="gn_company",
+        base_url="https://news.google.com/rss/search",
+        enabled=True,
+    )
+    store = SeenArticleStore(tmp_path / "seen.json", now=NOW)
+    entries = [_entry("shared", 9)]
+
+    alpha = provider_registry._entries_to_items_for_company(
+        provider, "c001", entries, company_hint="c001", seen_store=store
+    )
+    beta = provider_registry._entries_to_items_for_company(
+        provider, "c002", entries, company_hint="c002", seen_store=store
+    )
+    alpha_again = provider_registry._entries_to_items_for_company(
+        provider, "c001", entries, company_hint="c001", seen_store=store
+    )
+
+    assert [item.company_hint for item in alpha + beta] == ["c001", "c002"]
+    assert alpha_again == []
@@ -0,0 +1,143 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from agentic_alert import pipeline
+from agentic_alert.config import AppConfig
+from agentic_alert.sharding import Shard, all_shards
+from agentic_alert.sources.provider_registry import merge_gn_rotation_states
+from agentic_alert.storage.csv_store import read_csv
+
+COMPANY_NAMES = ["Alpha Energia", "Beta Logistica", "Gamma Foods", "Delta Sistemi"]
+
+
+def test_shard_parse_and_partition() -> None:
+    assert Shard.parse("1/4") == Shard(1, 4)
+    assert Shard(1, 4).path(Path("data/alerts.csv")) == Path(
+        "data/alerts.shard-1-of-4.csv"
+    )
+    for value in ("4/4", "-1/2", "1", "a/b", "0/0"):
+        with pytest.raises(ValueError):
+            Shard.parse(value)
+
+    company_ids = [f"IT{index:011d}" for index in range(400)]
+    owners = [
+        [shard.index for shard in all_shards(4) if shard.owns(company_id)]
+        for company_id in company_ids
+    ]
+    assert all(len(owner) == 1 for owner in owners)
+    assert {owner[0] for owner in owners} == {0, 1, 2, 3}
+
+
+def _config(root: Path, data_dir: Path) -> AppConfig:
+    return AppConfig(
+        companies_csv=data_dir / "companies.csv",
+        triggers_csv=data_dir / "triggers.csv",
+        providers_csv=data_dir / "providers.csv",
+        articles_csv=data_dir / "articles.csv",
+        alert_candidates_csv=root / "alert_candidates.csv",
+        alerts_csv=root / "alerts.csv",
+        company_index_cache_enabled=False,
+    )
+
+
+def _write_inputs(data_dir: Path) -> None:
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,website_domain,country,status\n"
+        + "".join(
+            f"c{index:03d},{name},,,IT,active\n"
+            for index, name in enumerate(COMPANY_NAMES)
+        ),
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisizione,high,Deal trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\np001,Local Dummy,dummy,,true\n",
+        encoding="utf-8",
+    )
+    (data_dir / "articles.csv").write_text(
+        "article_id,provider_id,source_name,title,url,published_at,content_snippet\n"
+        + "".join(
+            f"a{index},p001,Local Dummy,Acquisizione di {name},"
+            f"https://example.com/{index},2026-02-0{index + 1}T00:00:00+00:00,\n"
+            for index, name in enumerate(COMPANY_NAMES)
+        )
+        + "a9,p001,Local Dummy,Acquisizione: Alpha Energia e Gamma Foods,"
+        "https://example.com/9,2026-02-09T00:00:00+00:00,\n",
+        encoding="utf-8",
+    )
+
+
+def _alerts(path: Path) -> list[tuple[str, str]]:
+    return [(row["alert_id"], row["company_id"]) for row in read_csv(path)]
+
+
+def test_shard_runs_merge_into_single_run_output(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    _write_inputs(data_dir)
+    single = _config(tmp_path / "single", data_dir)
+    sharded = _config(tmp_path / "sharded", data_dir)
+    pipeline._run_pipeline(single)
+
+    for index in (1, 0):
+        pipeline._run_pipeline(replace(sharded, shard=f"{index}/2"))
+    shard_rows = [
+        _alerts(Shard(index, 2).path(sharded.alerts_csv)) for index in (0, 1)
+    ]
+    assert shard_rows[0] and shard_rows[1]
+    assert not {company for _, company in shard_rows[0]} & {
+        company for _, company in shard_rows[1]
+    }
+    assert not sharded.alerts_csv.exists()
+
+    pipeline.merge_shards(sharded, 2)
+
+    expected = _alerts(single.alerts_csv)
+    assert len(expected) == 6
+    assert sorted(_alerts(sharded.alerts_csv)) == sorted(expected)
+    assert sorted(
+        row["candidate_id"] for row in read_csv(sharded.alert_candidates_csv)
+    ) == sorted(row["candidate_id"] for row in read_csv(single.alert_candidates_csv))
+    assert sorted(path.name for path in (tmp_path / "sharded").iterdir()) == [
+        "alert_candidates.csv",
+        "alerts.csv",
+    ]
+
+    # A second round finds everything already in the canonical outputs.
+    for index in (0, 1):
+        pipeline._run_pipeline(replace(sharded, shard=f"{index}/2"))
+    pipeline.merge_shards(sharded, 2)
+    assert sorted(_alerts(sharded.alerts_csv)) == sorted(expected)
+
+
+def test_merge_requires_every_shard(tmp_path: Path, capsys) -> None:
+    data_dir = tmp_path / "data"
+    _write_inputs(data_dir)
+    config = _config(tmp_path / "out", data_dir)
+    pipeline._run_pipeline(replace(config, shard="0/3"))
+
+    with pytest.raises(SystemExit):
+        pipeline.merge_shards(config, 3)
+
+    assert "missing or incomplete: 1/3, 2/3" in capsys.readouterr().out
+    assert not config.alerts_csv.exists()
+
+
+def test_merge_gn_rotation_states(tmp_path: Path, monkeypatch) -> None:
+    state_path = tmp_path / "gn_rotation_state.json"
+    monkeypatch.setenv("GN_ROTATION_STATE_PATH", str(state_path))
+    shards = all_shards(2)
+    for shard in shards:
+        shard.path(state_path).write_text('{"pointer": 1050}', encoding="utf-8")
+
+    assert merge_gn_rotation_states(shards) == "pointer=1050 shards=2"
+    assert json.loads(state_path.read_text(encoding="utf-8")) == {"pointer": 1050}
+    assert not any(shard.path(state_path).exists() for shard in shards)
+    assert merge_gn_rotation_states(shards) is None
@@ -0,0 +1,101 @@
+import csv
+from pathlib import Path
+
+from agentic_alert.config import AppConfig
+from agentic_alert.models.schemas import Alert
+from agentic_alert.pipeline import _run_pipeline
+from agentic_alert.storage.sqlite_store import ALERT_COLUMNS, SqliteAlertStore
+
+
+def _alert(alert_id: str, dedupe_key: str) -> Alert:
+    return Alert(
+        alert_id=alert_id,
+        company_id="c001",
+        company_name="Alpha Energia",
+        trigger_id="t001",
+        trigger_name="Acquisizione",
+        contact_owner="",
+        source="Local Dummy",
+        article_url="https://example.com/a",
+        published_at="2026-02-01T00:00:00+00:00",
+        dedupe_key=dedupe_key,
+        created_at="2026-02-02T00:00:00+00:00",
+        status="new",
+    )
+
+
+def test_sqlite_store_ignores_duplicates_and_updates_in_place(tmp_path: Path) -> None:
+    with SqliteAlertStore(tmp_path / "alerts.sqlite") as store:
+        first = store.insert_alerts([_alert("a1", "k1"), _alert("a2", "k2")])
+        second = store.insert_alerts([_alert("a3", "k1"), _alert("a4", "k3")])
+        updated = store.update_statuses({"a2", "missing"}, "sent")
+        exported = store.export_csv(tmp_path / "alerts.csv")
+
+    assert [alert.alert_id for alert in first] == ["a1", "a2"]
+    assert [alert.alert_id for alert in second] == ["a4"]
+    assert updated == 1
+    assert exported == 3
+    with (tmp_path / "alerts.csv").open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        rows = list(reader)
+    assert reader.fieldnames == ALERT_COLUMNS
+    assert [(row["alert_id"], row["status"]) for row in rows] == [
+        ("a1", "new"),
+        ("a2", "sent"),
+        ("a4", "new"),
+    ]
+    assert rows[0]["contact_owner"] == ""
+
+
+def test_pipeline_sqlite_backend_seeds_from_csv_and_dedupes(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,website_domain,country,status\n"
+        "c001,Alpha Energia,,alphaenergia.it,IT,active\n",
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisizione,high,Deal trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\np001,Local Dummy,dummy,,true\n",
+        encoding="utf-8",
+    )
+    (data_dir / "articles.csv").write_text(
+        "article_id,provider_id,source_name,title,url,published_at,content_snippet\n"
+        "a001,p001,Local Dummy,Acquisizione di Alpha Energia,https://example.com/a,"
+        "2026-02-01T00:00:00+00:00,Alpha Energia annuncia un'acquisizione\n",
+        encoding="utf-8",
+    )
+    alerts_csv = data_dir / "alerts.csv"
+    alerts_csv.write_text(
+        ",".join(ALERT_COLUMNS)
+        + "\nold1,c009,Legacy,t009,Legacy,,src,https://example.com/old,"
+        "2025-01-01T00:00:00+00:00,,2025-01-02T00:00:00+00:00,sent\n",
+        encoding="utf-8",
+    )
+    config = AppConfig(
+        companies_csv=data_dir / "companies.csv",
+        triggers_csv=data_dir / "triggers.csv",
+        providers_csv=data_dir / "providers.csv",
+        articles_csv=data_dir / "articles.csv",
+        alert_candidates_csv=data_dir / "alert_candidates.csv",
+        alerts_csv=alerts_csv,
+        company_index_cache_enabled=False,
+        alert_store="sqlite",
+        alert_store_sqlite_path=data_dir / "alerts.sqlite",
+    )
+
+    _run_pipeline(config)
+    _run_pipeline(config)
+
+    with SqliteAlertStore(config.alert_store_sqlite_path) as store:
+        rows = list(store.iter_rows())
+    assert [row["company_id"] for row in rows] == ["c009", "c001"]
+    assert rows[0]["dedupe_key"] == "c009|t009|2025-01-01|"
+    with alerts_csv.open(newline="", encoding="utf-8") as handle:
+        exported = list(csv.DictReader(handle))
+    assert [row["alert_id"] for row in exported] == [row["alert_id"] for row in rows]
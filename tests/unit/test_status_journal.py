@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+
+from agentic_alert import pipeline
+from agentic_alert.config import AppConfig
+from agentic_alert.storage.csv_store import read_csv
+from agentic_alert.storage.status_journal import (
+    append_status_changes,
+    compact_status_journal,
+    journal_path,
+    read_alerts,
+)
+
+
+def test_status_journal_appends_and_compacts(tmp_path: Path) -> None:
+    alerts = tmp_path / "alerts.csv"
+    alerts.write_text(
+        "alert_id,dedupe_key,status\na1,k1,new\na2,k2,new\n", encoding="utf-8"
+    )
+    original = alerts.read_bytes()
+
+    append_status_changes(alerts, {"a1", "a2"}, "sent", "2026-02-01T00:00:00+00:00")
+    append_status_changes(alerts, {"a2"}, "acked", "2026-02-02T00:00:00+00:00")
+
+    assert alerts.read_bytes() == original
+    assert journal_path(alerts).name == "alerts_status_journal.csv"
+    assert [row["status"] for row in read_alerts(alerts)] == ["sent", "acked"]
+    with pytest.raises(ValueError):
+        append_status_changes(alerts, {"a1"}, "bogus", "")
+
+    assert compact_status_journal(alerts) == 3
+    assert not journal_path(alerts).exists()
+    assert [row["status"] for row in read_csv(alerts)] == ["sent", "acked"]
+
+
+def test_pipeline_journals_sent_statuses(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,website_domain,country,status\n"
+        "c001,Alpha Energia,,alphaenergia.it,IT,active\n",
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisizione,high,Deal trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\np001,Local Dummy,dummy,,true\n",
+        encoding="utf-8",
+    )
+    (data_dir / "articles.csv").write_text(
+        "article_id,provider_id,source_name,title,url,published_at,content_snippet\n"
+        "a001,p001,Local Dummy,Acquisizione di Alpha Energia,https://example.com/a,"
+        "2026-02-01T00:00:00+00:00,Alpha Energia annuncia un'acquisizione\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(
+        pipeline,
+        "dispatch_alerts",
+        lambda alerts, *_args: {alert.alert_id for alert in alerts},
+    )
+    alerts_csv = data_dir / "alerts.csv"
+    config = AppConfig(
+        companies_csv=data_dir / "companies.csv",
+        triggers_csv=data_dir / "triggers.csv",
+        providers_csv=data_dir / "providers.csv",
+        articles_csv=data_dir / "articles.csv",
+        alert_candidates_csv=data_dir / "alert_candidates.csv",
+        alerts_csv=alerts_csv,
+        company_index_cache_enabled=False,
+        alert_status_journal_compact_rows=2,
+    )
+
+    pipeline._run_pipeline(config)
+
+    assert [row["status"] for row in read_csv(alerts_csv)] == ["new"]
+    assert [row["status"] for row in read_alerts(alerts_csv)] == ["sent"]
+
+    with (data_dir / "articles.csv").open("a", encoding="utf-8") as handle:
+        handle.write(
+            "a002,p001,Local Dummy,Nuova acquisizione di Alpha Energia,"
+            "https://example.com/b,2026-02-02T00:00:00+00:00,"
+            "Alpha Energia acquisizione\n"
+        )
+    pipeline._run_pipeline(config)
+
+    assert not journal_path(alerts_csv).exists()
+    assert [row["status"] for row in read_csv(alerts_csv)] == ["sent", "sent"]
@@ -0,0 +1,127 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from agentic_alert import pipeline
+from agentic_alert.config import AppConfig
+from agentic_alert.models.schemas import NewsItem
+from agentic_alert.storage.csv_store import read_csv
+from agentic_alert.streaming import StageCancelled, StageQueue, StageThread
+
+
+def test_stage_queue_applies_backpressure_and_cancels() -> None:
+    cancel = threading.Event()
+    stage: StageQueue[int] = StageQueue("test", 2, cancel)
+    produced: list[int] = []
+
+    def _produce() -> None:
+        for value in range(5):
+            stage.put(value)
+            produced.append(value)
+        stage.close()
+
+    producer = StageThread("produce", _produce, cancel)
+    producer.start()
+    consumed = list(stage)
+    producer.join_stage()
+
+    assert consumed == [0, 1, 2, 3, 4]
+    assert stage.blocked_puts >= 1
+
+    blocked: StageQueue[int] = StageQueue("blocked", 1, cancel)
+    blocked.put(0)
+    cancel.set()
+    with pytest.raises(StageCancelled):
+        blocked.put(1)
+
+
+def _config(tmp_path: Path) -> AppConfig:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "companies.csv").write_text(
+        "company_id,name,aliases,website_domain,country,status\n"
+        "c001,Alpha Energia,,alphaenergia.it,IT,active\n",
+        encoding="utf-8",
+    )
+    (data_dir / "triggers.csv").write_text(
+        "trigger_id,name,keywords,priority,description\n"
+        "t001,Acquisizione,acquisizione,high,Deal trigger\n",
+        encoding="utf-8",
+    )
+    (data_dir / "providers.csv").write_text(
+        "provider_id,name,type,base_url,enabled\n"
+        "p001,First,dummy,,true\np002,Second,dummy,,true\n",
+        encoding="utf-8",
+    )
+    return AppConfig(
+        companies_csv=data_dir / "companies.csv",
+        triggers_csv=data_dir / "triggers.csv",
+        providers_csv=data_dir / "providers.csv",
+        articles_csv=data_dir / "articles.csv",
+        alert_candidates_csv=data_dir / "alert_candidates.csv",
+        alerts_csv=data_dir / "alerts.csv",
+        company_index_cache_enabled=False,
+        stream_queue_size=1,
+        stream_write_batch=1,
+    )
+
+
+def _item(provider_id: str, day: int) -> NewsItem:
+    return NewsItem(
+        article_id=f"{provider_id}-{day}",
+        provider_id=provider_id,
+        source_name=provider_id,
+        title=f"Acquisizione di Alpha Energia numero {day}",
+        url=f"https://example.com/{provider_id}/{day}",
+        published_at=f"2026-02-0{day}T00:00:00+00:00",
+        content_snippet="",
+    )
+
+
+def test_matching_overlaps_fetching_of_later_providers(
+    tmp_path: Path, monkeypatch
+) -> None:
+    config = _config(tmp_path)
+    second_fetch_started = threading.Event()
+    overlapped: list[bool] = []
+    build = pipeline.build_alerts_for_article
+
+    def _fake_fetch(provider, *_args, **_kwargs):
+        if provider.provider_id == "p002":
+            second_fetch_started.set()
+            return [_item("p002", 2)]
+        return [_item("p001", 1)]
+
+    def _build(news_item, *args, **kwargs):
+        if news_item.provider_id == "p001":
+            # A sequential pipeline cannot start the next fetch while the
+            # first provider's item is still being matched.
+            overlapped.append(second_fetch_started.wait(timeout=5))
+        return build(news_item, *args, **kwargs)
+
+    monkeypatch.setattr(pipeline, "fetch_news", _fake_fetch)
+    monkeypatch.setattr(pipeline, "build_alerts_for_article", _build)
+
+    pipeline._run_pipeline(config)
+
+    assert overlapped == [True]
+    assert [row["published_at"][:10] for row in read_csv(config.alerts_csv)] == [
+        "2026-02-01",
+        "2026-02-02",
+    ]
+    assert len(read_csv(config.alert_candidates_csv)) == 2
+
+
+def test_fetch_stage_errors_propagate(tmp_path: Path, monkeypatch) -> None:
+    config = _config(tmp_path)
+
+    def _failing_fetch(provider, *_args, **_kwargs):
+        if provider.provider_id == "p002":
+            raise RuntimeError("feed exploded")
+        return [_item("p001", 1)]
+
+    monkeypatch.setattr(pipeline, "fetch_news", _failing_fetch)
+
+    with pytest.raises(RuntimeError, match="feed exploded"):
+        pipeline._run_pipeline(config)
@@ -1,5 +1,5 @@
 from agentic_alert.models.schemas import Trigger
-from agentic_alert.triggers.matcher import match_triggers
+from agentic_alert.triggers.matcher import TriggerMatcher, match_triggers
 
 
 def test_match_triggers_returns_expected_matches() -> None:
@@ -25,3 +25,40 @@ def test_match_triggers_returns_expected_matches() -> None:
     matched_ids = {trigger.trigger_id for trigger in matched}
 
     assert matched_ids == {"t001", "t002"}
+
+
+def test_trigger_matcher_reports_hit_offsets_in_one_scan() -> None:
+    triggers = [
+        Trigger(
+            trigger_id="t001",
+            name="Acquisizione",
+            keywords=["acquisizione", "M&A"],
+            priority="high",
+            description="M&A events",
+        ),
+        Trigger(
+            trigger_id="t002",
+            name="Cambio CEO",
+            keywords=["nuovo CEO", "CEO"],
+            priority="medium",
+            description="Leadership change",
+        ),
+        Trigger(
+            trigger_id="t003",
+            name="Funding",
+            keywords=["Series A"],
+            priority="high",
+            description="Funding round",
+        ),
+    ]
+    matcher = TriggerMatcher(triggers)
+
+    result = matcher.match("Nuovo CEO dopo l'ACQUISIZIONE")
+
+    assert [trigger.trigger_id for trigger in result.triggers] == ["t001", "t002"]
+    assert [(hit.trigger_id, hit.keyword, hit.start, hit.end) for hit in result.hits] == [
+        ("t002", "nuovo CEO", 0, 9),
+        ("t002", "CEO", 6, 9),
+        ("t001", "acquisizione", 17, 29),
+    ]
+    assert matcher.match("nessun evento").triggers == []